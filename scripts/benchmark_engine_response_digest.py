@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark the single-walk engine-response digest against the three-pass form."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from shield_orchestrator.bridges.component_verdicts import (  # noqa: E402
+    _contains_forbidden_authority,
+    _digest_engine_response,
+    _json_like,
+)
+from shield_orchestrator.v3.contracts.v3_2_receipt import canonical_sha256  # noqa: E402
+
+SCHEMA_VERSION = "shield-v3-engine-response-digest-benchmark-v1"
+COMPONENT_ID = "sentinel_ai"
+WARMUPS = 3
+SAMPLES = 15
+SIZES = (100, 1_000, 10_000)
+
+
+class Severity(Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+@dataclass
+class Observation:
+    sensor: str
+    severity: Severity
+    scores: tuple[float, ...]
+    tags: list[str]
+
+
+def _telemetry_response(events: int) -> dict[str, Any]:
+    """Sentinel-style telemetry response with events nested observations."""
+    return {
+        "decision": "ALLOW",
+        "component": COMPONENT_ID,
+        "reason_codes": ["SNTL_OK"],
+        "events": [
+            {
+                "id": f"evt-{index}",
+                "ts": 1_700_000_000 + index,
+                "observation": Observation(
+                    sensor=f"sensor-{index % 17}",
+                    severity=Severity.HIGH if index % 5 == 0 else Severity.LOW,
+                    scores=(index / 7, index / 11, 0.5),
+                    tags=["net", "tx", f"t{index % 3}"],
+                ),
+                "context": {"peer": f"peer-{index % 31}", "rtt_ms": index % 97, "note": "ok ✓"},
+            }
+            for index in range(events)
+        ],
+    }
+
+
+def _three_pass(response: Any) -> str:
+    normalized = _json_like(response)
+    if _contains_forbidden_authority(normalized):
+        raise AssertionError("unexpected authority key")
+    return canonical_sha256({"component_id": COMPONENT_ID, "engine_response": normalized})
+
+
+def _single_walk(response: Any) -> str:
+    digested = _digest_engine_response(COMPONENT_ID, response)
+    if digested.forbidden_authority:
+        raise AssertionError("unexpected authority key")
+    return digested.evidence_hash()
+
+
+def _measure(operation: Callable[[], Any], samples: int) -> list[float]:
+    for _ in range(WARMUPS):
+        operation()
+    timings: list[float] = []
+    for _ in range(samples):
+        started = time.perf_counter_ns()
+        operation()
+        timings.append((time.perf_counter_ns() - started) / 1_000_000)
+    return timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=SAMPLES)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    args = parser.parse_args(argv)
+
+    results = []
+    for events in args.sizes:
+        response = _telemetry_response(events)
+        if _three_pass(response) != _single_walk(response):
+            raise SystemExit("single-walk evidence hash differs from the three-pass form")
+        three_pass = statistics.median(_measure(partial(_three_pass, response), args.samples))
+        single_walk = statistics.median(_measure(partial(_single_walk, response), args.samples))
+        results.append(
+            {
+                "events": events,
+                "three_pass_median_ms": round(three_pass, 3),
+                "single_walk_median_ms": round(single_walk, 3),
+                "speedup": round(three_pass / single_walk, 2),
+            }
+        )
+    print(
+        json.dumps(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "python": platform.python_version(),
+                "samples": args.samples,
+                "results": results,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
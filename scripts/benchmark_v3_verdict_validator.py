@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark the per-verdict cost of the compiled v3.2 verdict validator against the reference checks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from shield_orchestrator.v3.contracts.v3_2_receipt import (  # noqa: E402
+    COMPONENT_EVIDENCE_FAMILIES,
+    COMPONENT_REASON_IDS,
+    SUPPORTED_COMPONENTS,
+    VERDICT_SCHEMA_VERSION,
+    VERDICT_VALIDATOR,
+    _validate_component_verdict_reference,
+    build_receipt,
+    validate_receipt,
+)
+
+SCHEMA_VERSION = "shield-v3-verdict-validator-benchmark-v1"
+CONTEXT_HASH = "a" * 64
+EVIDENCE_HASH = "b" * 64
+WARMUPS = 3
+SAMPLES = 15
+ITERATIONS = 2_000
+METADATA_SIZES = (1, 10, 100)
+
+
+def _verdict(component_id: str, metadata_items: int) -> dict[str, Any]:
+    return {
+        "component_id": component_id,
+        "contract_version": 3,
+        "schema_version": VERDICT_SCHEMA_VERSION,
+        "request_id": "bench-1",
+        "context_hash": CONTEXT_HASH,
+        "decision": "ALLOW",
+        "reason_ids": [COMPONENT_REASON_IDS[component_id][0]],
+        "evidence_hash": EVIDENCE_HASH,
+        "evidence_families": list(COMPONENT_EVIDENCE_FAMILIES[component_id][:2]),
+        "metadata": {
+            "bridge_source": "engine",
+            "samples": [{"index": index, "score": index / 10} for index in range(metadata_items)],
+        },
+        "fail_closed": True,
+    }
+
+
+def _per_verdict_us(validate: Callable[..., Any], verdicts: list[dict[str, Any]], samples: int) -> float:
+    def run() -> None:
+        for _ in range(ITERATIONS):
+            for verdict in verdicts:
+                validate(verdict, expected_context_hash=CONTEXT_HASH)
+
+    for _ in range(WARMUPS):
+        run()
+    timings: list[float] = []
+    for _ in range(samples):
+        started = time.perf_counter_ns()
+        run()
+        timings.append((time.perf_counter_ns() - started) / 1_000 / (ITERATIONS * len(verdicts)))
+    return statistics.median(timings)
+
+
+def _per_receipt_us(verdicts: list[dict[str, Any]], samples: int) -> float:
+    receipt = build_receipt(request_id="bench-1", context_hash=CONTEXT_HASH, component_verdicts=verdicts)
+    timings: list[float] = []
+    for _ in range(samples):
+        started = time.perf_counter_ns()
+        for _ in range(ITERATIONS // 10):
+            validate_receipt(receipt, expected_context_hash=CONTEXT_HASH)
+        timings.append((time.perf_counter_ns() - started) / 1_000 / (ITERATIONS // 10))
+    return statistics.median(timings)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=SAMPLES)
+    parser.add_argument("--metadata-sizes", type=int, nargs="+", default=list(METADATA_SIZES))
+    args = parser.parse_args(argv)
+
+    results = []
+    for metadata_items in args.metadata_sizes:
+        verdicts = [_verdict(component_id, metadata_items) for component_id in SUPPORTED_COMPONENTS]
+        reference = _per_verdict_us(_validate_component_verdict_reference, verdicts, args.samples)
+        compiled = _per_verdict_us(VERDICT_VALIDATOR.validate, verdicts, args.samples)
+        results.append(
+            {
+                "metadata_items": metadata_items,
+                "reference_per_verdict_us": round(reference, 3),
+                "compiled_per_verdict_us": round(compiled, 3),
+                "speedup": round(reference / compiled, 2),
+                "validate_receipt_us": round(_per_receipt_us(verdicts, args.samples), 3),
+            }
+        )
+    print(
+        json.dumps(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "python": platform.python_version(),
+                "samples": args.samples,
+                "results": results,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Drive orchestrate() under load against local stand-in component engines."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from shield_orchestrator.bridges.engine_registry import EngineImportRegistry  # noqa: E402
+from shield_orchestrator.testing.stand_in_engines import (  # noqa: E402
+    LATENCY_DISTRIBUTIONS,
+    STAND_IN_COMPONENTS,
+    StandInEngines,
+    StandInProfile,
+)
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request  # noqa: E402
+from shield_orchestrator.v3.options import OrchestratorV3Options  # noqa: E402
+from shield_orchestrator.v3.orchestrate import orchestrate  # noqa: E402
+
+SCHEMA_VERSION = "shield-v3-stand-in-load-v1"
+PERCENTILES = (50, 95, 99)
+
+
+def _request(index: int) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id=f"wallet-{index % 64}",
+        action="SEND",
+        nonce=f"load-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"load-{index}",
+            "context_hash": f"{index:064x}",
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"peer_count": index % 17}},
+                "dqsn": {"signals": [{"score": index % 100 / 100}]},
+                "adn": {"events": [{"kind": "tx", "index": index}]},
+                "guardian_wallet": {"wallet_ctx": {"balance": 1_000 + index}},
+                "qwg": {"risk_context": {"tx_amount": index % 1_000, "device_id": f"dev-{index % 8}"}},
+            },
+        },
+    )
+
+
+def _percentiles(samples: Sequence[float]) -> dict[str, float | None]:
+    """Nearest-rank percentiles in milliseconds."""
+    ordered = sorted(samples)
+    result: dict[str, float | None] = {}
+    for percentile in PERCENTILES:
+        if not ordered:
+            result[f"p{percentile}_ms"] = None
+            continue
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        result[f"p{percentile}_ms"] = round(ordered[rank - 1] * 1000, 3)
+    return result
+
+
+def _profiles(args: argparse.Namespace) -> dict[str, StandInProfile]:
+    base = {
+        "latency_ms": args.latency_ms,
+        "distribution": args.distribution,
+        "latency_sigma": args.latency_sigma,
+        "failure_rate": args.failure_rate,
+        "response_items": args.response_items,
+    }
+    overrides = json.loads(Path(args.profiles).read_text(encoding="utf-8")) if args.profiles else {}
+    return {component: StandInProfile(**{**base, **overrides.get(component, {})}) for component in STAND_IN_COMPONENTS}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight at once")
+    parser.add_argument("--bridge-workers", type=int, default=1, help="OrchestratorV3Options.max_workers")
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--response-items", type=int, default=8)
+    parser.add_argument("--profiles", help="JSON file mapping component ids to StandInProfile overrides")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    engines = StandInEngines(_profiles(args), seed=args.seed)
+    options = OrchestratorV3Options(max_workers=args.bridge_workers, engine_registry=EngineImportRegistry())
+    requests = [_request(index) for index in range(args.requests)]
+
+    def timed(request: OrchestratorV3Request) -> tuple[str, float]:
+        started = time.perf_counter()
+        outcome = orchestrate(request, options=options).outcome
+        return outcome, time.perf_counter() - started
+
+    with engines.installed(), ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(timed, requests))
+        elapsed = time.perf_counter() - started
+
+    stages: dict[str, Any] = {
+        component: {"calls": stats.calls, "failures": stats.failures, **_percentiles(stats.durations)}
+        for component, stats in engines.stats().items()
+    }
+    stages["orchestrate"] = {"calls": len(results), **_percentiles([latency for _, latency in results])}
+    print(
+        json.dumps(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "python": platform.python_version(),
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "bridge_workers": args.bridge_workers,
+                "elapsed_s": round(elapsed, 3),
+                "throughput_rps": round(len(results) / elapsed, 1),
+                "outcomes": dict(Counter(outcome for outcome, _ in results)),
+                "stages": stages,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
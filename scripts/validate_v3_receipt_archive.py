@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Re-validate archived v3.2 receipts from JSONL files or directories, resumably and in parallel."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from shield_orchestrator.v3.receipt_archive import main  # noqa: E402
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, TraceEntry
+
+from .adaptive_core_bridge import AdaptiveCoreBridge
+
+SINK_POLICIES = ("drop_oldest", "block")
+
+# Trace entry returned on the request path for every report handed to the sink.
+# It is fixed so the response never depends on queue state or sink timing.
+QUEUED_TRACE_ENTRY = TraceEntry(
+    stage=AdaptiveCoreBridge.STAGE,
+    component=AdaptiveCoreBridge.COMPONENT,
+    status="OK",
+    reason_ids=(),
+    notes="adaptive_core_sink_queued",
+)
+
+_Report = tuple[float, OrchestratorV3Request, str, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class AdaptiveCoreSinkStats:
+    """Point-in-time Adaptive Core sink counters."""
+
+    pending: int
+    max_queue: int
+    policy: str
+    submitted: int
+    reported: int
+    failed: int
+    dropped: int
+    lag_seconds: float
+    max_lag_seconds: float
+    closed: bool
+
+
+class AdaptiveCoreSink:
+    """
+    Bounded background queue for Adaptive Core sink reports.
+
+    report_v3() has the AdaptiveCoreBridge signature but only enqueues the
+    report and returns QUEUED_TRACE_ENTRY; a single worker thread runs
+    AdaptiveCoreBridge.report_v3() off the request path. The sink stays
+    read-only: its reports never reach a response.
+
+    - policy="drop_oldest" discards the oldest pending report when full.
+    - policy="block" waits for room, up to block_timeout_seconds (forever
+      when None); a report that still does not fit is dropped.
+    - on_report, when given, receives every trace entry the worker produces.
+
+    lag_seconds is the age of the oldest pending report; max_lag_seconds the
+    longest observed time from enqueue to report. After shutdown() every new
+    report is dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 1024,
+        policy: str = "drop_oldest",
+        block_timeout_seconds: float | None = None,
+        on_report: Callable[[TraceEntry], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(max_queue, bool) or not isinstance(max_queue, int) or max_queue <= 0:
+            raise ValueError("max_queue must be a positive integer")
+        if policy not in SINK_POLICIES:
+            raise ValueError("policy must be 'drop_oldest' or 'block'")
+        if block_timeout_seconds is not None and (
+            isinstance(block_timeout_seconds, bool)
+            or not isinstance(block_timeout_seconds, (int, float))
+            or not block_timeout_seconds > 0
+        ):
+            raise ValueError("block_timeout_seconds must be a positive number")
+        self._max_queue = max_queue
+        self._policy = policy
+        self._block_timeout = block_timeout_seconds
+        self._on_report = on_report
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queue: deque[_Report] = deque()
+        self._busy = False
+        self._closed = False
+        self._submitted = 0
+        self._reported = 0
+        self._failed = 0
+        self._dropped = 0
+        self._max_lag = 0.0
+        self._worker = threading.Thread(target=self._run, name="shield-adaptive-core-sink", daemon=True)
+        self._worker.start()
+
+    def report_v3(self, request: OrchestratorV3Request, *, outcome: str, reason_ids: tuple[str, ...]) -> TraceEntry:
+        """Enqueue a sink report and return the fixed placeholder trace entry."""
+        report = (self._clock(), request, outcome, tuple(reason_ids))
+        with self._cond:
+            self._submitted += 1
+            if not self._closed and len(self._queue) >= self._max_queue:
+                if self._policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._dropped += 1
+                else:
+                    self._cond.wait_for(
+                        lambda: self._closed or len(self._queue) < self._max_queue,
+                        timeout=self._block_timeout,
+                    )
+            if self._closed or len(self._queue) >= self._max_queue:
+                self._dropped += 1
+            else:
+                self._queue.append(report)
+                self._cond.notify_all()
+        return QUEUED_TRACE_ENTRY
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every pending report has been handled; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout=timeout)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop accepting reports; the worker drains what is pending and exits."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            self._worker.join()
+
+    def stats(self) -> AdaptiveCoreSinkStats:
+        with self._cond:
+            oldest = self._queue[0][0] if self._queue else None
+            return AdaptiveCoreSinkStats(
+                pending=len(self._queue),
+                max_queue=self._max_queue,
+                policy=self._policy,
+                submitted=self._submitted,
+                reported=self._reported,
+                failed=self._failed,
+                dropped=self._dropped,
+                lag_seconds=0.0 if oldest is None else max(0.0, self._clock() - oldest),
+                max_lag_seconds=self._max_lag,
+                closed=self._closed,
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                enqueued, request, outcome, reason_ids = self._queue.popleft()
+                self._busy = True
+                self._cond.notify_all()
+            ok = True
+            try:
+                entry = AdaptiveCoreBridge().report_v3(request, outcome=outcome, reason_ids=reason_ids)
+                if self._on_report is not None:
+                    self._on_report(entry)
+            except Exception:
+                ok = False
+            with self._cond:
+                if ok:
+                    self._reported += 1
+                else:
+                    self._failed += 1
+                self._max_lag = max(self._max_lag, self._clock() - enqueued)
+                self._busy = False
+                self._cond.notify_all()
@@ -2,54 +2,22 @@ from __future__ import annotations
 
 from typing import Any, Mapping
 
-from .base_layer import BaseLayer
-from .component_verdicts import (
-    ComponentBridgeResult,
-    build_component_result_from_response,
-    component_input,
-    error_component_result,
-    receipt_context_hash,
-    receipt_request_id,
-)
-from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from .component_bridge import ComponentBridge
 
 
-class ADNBridge(BaseLayer):
+class ADNBridge(ComponentBridge):
     """ADN bridge for Shield v3.2 receipt synthesis."""
 
     COMPONENT = "adn"
+    ENGINE_MODULES = ("adn_v3",)
 
-    def evaluate_v3(self, request: OrchestratorV3Request) -> ComponentBridgeResult:
-        request_id = receipt_request_id(request)
-        context_hash = receipt_context_hash(request)
-        payload = component_input(request, self.COMPONENT)
-        if payload is None:
-            return error_component_result(
-                component_id=self.COMPONENT,
-                request_id=request_id,
-                context_hash=context_hash,
-                note="missing_component_input",
-            )
-        try:
-            response = self._evaluate_engine(payload, request_id=request_id)
-        except Exception:
-            return error_component_result(
-                component_id=self.COMPONENT,
-                request_id=request_id,
-                context_hash=context_hash,
-                note="component_engine_unavailable_or_failed",
-            )
-        return build_component_result_from_response(
-            component_id=self.COMPONENT,
-            request_id=request_id,
-            context_hash=context_hash,
-            engine_response=response,
-        )
-
-    def _evaluate_engine(self, payload: Mapping[str, Any], *, request_id: str) -> Mapping[str, Any]:
+    def _import_engine(self) -> Any:
         from adn_v3 import ADNv3
 
-        return ADNv3().evaluate(self._engine_request(payload, request_id=request_id))
+        return ADNv3
+
+    def _load_engine(self) -> Any:
+        return self._resolve_engine()()
 
     def _engine_request(self, payload: Mapping[str, Any], *, request_id: str) -> dict[str, Any]:
         if "contract_version" in payload:
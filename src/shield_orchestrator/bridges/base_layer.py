@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from shield_orchestrator.bridges.component_verdicts import ComponentBridgeResult, PreparedRequest
+    from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+
 
 LEGACY_PROCESS_DISABLED_MESSAGE = (
     "Legacy BaseLayer.process() is disabled because it is not a live Shield "
@@ -18,3 +24,18 @@ class BaseLayer:
         shield_orchestrator.v3.orchestrate.orchestrate().
         """
         raise RuntimeError(LEGACY_PROCESS_DISABLED_MESSAGE)
+
+
+@runtime_checkable
+class AsyncComponentBridge(Protocol):
+    """
+    Optional native-asyncio bridge protocol.
+
+    A BaseLayer subclass that implements evaluate_v3_async() is awaited
+    directly by orchestrate_async(). Bridges without it are offloaded to an
+    executor through their synchronous evaluate_v3(). Either way the bridge
+    must return the same ComponentBridgeResult it would return synchronously.
+    """
+
+    async def evaluate_v3_async(self, request: OrchestratorV3Request | PreparedRequest) -> ComponentBridgeResult:
+        ...
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """Point-in-time circuit breaker state and transition counters."""
+
+    state: BreakerState
+    consecutive_failures: int
+    short_circuited: int
+    opened: int
+    half_opened: int
+    closed: int
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one component engine.
+
+    - closed: calls pass through; failure_threshold consecutive failures
+      open the breaker.
+    - open: calls are short-circuited until reset_timeout_seconds have
+      elapsed, then the breaker moves to half_open.
+    - half_open: up to half_open_max_calls probe calls pass through; a
+      successful probe closes the breaker, a failed one opens it again.
+
+    Transitions into each state are counted and exposed through stats().
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(failure_threshold, bool) or not isinstance(failure_threshold, int) or failure_threshold <= 0:
+            raise ValueError("failure_threshold must be a positive integer")
+        if isinstance(half_open_max_calls, bool) or not isinstance(half_open_max_calls, int) or half_open_max_calls <= 0:
+            raise ValueError("half_open_max_calls must be a positive integer")
+        if isinstance(reset_timeout_seconds, bool) or not isinstance(reset_timeout_seconds, (int, float)):
+            raise ValueError("reset_timeout_seconds must be a non-negative number")
+        if reset_timeout_seconds < 0:
+            raise ValueError("reset_timeout_seconds must be a non-negative number")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = float(reset_timeout_seconds)
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: BreakerState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._short_circuited = 0
+        self._transitions = {"closed": 0, "open": 0, "half_open": 0}
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may proceed; a refused call counts as short-circuited."""
+        with self._lock:
+            if self._state == "open" and self._clock() - self._opened_at >= self._reset_timeout:
+                self._transition("half_open")
+            if self._state == "closed":
+                return True
+            if self._state == "half_open" and self._probes < self._half_open_max_calls:
+                self._probes += 1
+                return True
+            self._short_circuited += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == "half_open":
+                self._transition("closed")
+            elif self._state == "closed":
+                self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == "half_open":
+                self._transition("open")
+            elif self._state == "closed":
+                self._failures += 1
+                if self._failures >= self._failure_threshold:
+                    self._transition("open")
+
+    def stats(self) -> CircuitBreakerStats:
+        with self._lock:
+            return CircuitBreakerStats(
+                state=self._state,
+                consecutive_failures=self._failures,
+                short_circuited=self._short_circuited,
+                opened=self._transitions["open"],
+                half_opened=self._transitions["half_open"],
+                closed=self._transitions["closed"],
+            )
+
+    def _transition(self, state: BreakerState) -> None:
+        self._state = state
+        self._transitions[state] += 1
+        self._failures = 0
+        self._probes = 0
+        if state == "open":
+            self._opened_at = self._clock()
+
+
+class CircuitBreakers:
+    """Circuit breakers keyed by bridge COMPONENT."""
+
+    def __init__(self, breakers: Mapping[str, CircuitBreaker]) -> None:
+        self._breakers = dict(breakers)
+
+    @classmethod
+    def for_bridges(
+        cls,
+        bridge_types: Iterable[type[Any]],
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_thresholds: Mapping[str, int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> CircuitBreakers:
+        """Build one breaker per bridge; failure_thresholds overrides per component."""
+        failure_thresholds = failure_thresholds or {}
+        return cls(
+            {
+                bridge_type.COMPONENT: CircuitBreaker(
+                    failure_threshold=failure_thresholds.get(bridge_type.COMPONENT, failure_threshold),
+                    reset_timeout_seconds=reset_timeout_seconds,
+                    half_open_max_calls=half_open_max_calls,
+                    clock=clock,
+                )
+                for bridge_type in bridge_types
+            }
+        )
+
+    def get(self, component: str) -> CircuitBreaker | None:
+        return self._breakers.get(component)
+
+    def stats(self) -> dict[str, CircuitBreakerStats]:
+        return {component: breaker.stats() for component, breaker in self._breakers.items()}
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.work_budget import V3WorkBudget
+
+from .base_layer import BaseLayer
+from .circuit_breaker import CircuitBreaker
+from .component_verdicts import (
+    ComponentBridgeResult,
+    PreparedRequest,
+    build_component_result_from_response,
+    error_component_result,
+    prepare_request,
+)
+from .engine_pool import EnginePool
+from .engine_process_pool import EngineProcessPool
+from .engine_registry import DEFAULT_ENGINE_REGISTRY, EngineImportRegistry
+from .verdict_cache import VerdictCache, VerdictCacheKey
+
+CIRCUIT_OPEN_NOTE = "component_circuit_open"
+
+
+class ComponentBridge(BaseLayer, ABC):
+    """Shared evaluate path for the five Shield v3.2 component bridges.
+
+    Subclasses provide the engine specifics; _import_engine(), _load_engine()
+    and _engine_request() are abstract, so a bridge missing one of them fails
+    when it is constructed rather than on its first request:
+    - ENGINE_MODULES / _import_engine(): the engine package modules and a
+      loader importing the engine entry points from them
+    - _load_engine(): construct the engine from the resolved entry points
+    - _call_engine(): evaluate one component input on a loaded engine
+    - _engine_request(): translate component input into the engine request
+
+    Missing input, unavailable packages and engine failures all fail closed to
+    an ERROR component verdict.
+
+    Bridges accept either a raw request or a PreparedRequest. The orchestrator
+    prepares once and passes the same PreparedRequest to all five bridges, so
+    request_id / context_hash are not re-derived per bridge.
+
+    Entry points are resolved through an EngineImportRegistry, so imports
+    and unavailable packages are not re-probed on every request. With an
+    engine_pool the engine is leased from the warm pool instead of being
+    loaded per call. With a circuit_breaker, engine failures are recorded and
+    an open breaker short-circuits to an ERROR verdict noted
+    component_circuit_open without calling the engine; a caller that stops
+    waiting for a call reports it through abandon(), so the late outcome of
+    that call is not recorded. With a verdict_cache,
+    a retried evaluation of the same input is served from the cache. With a
+    process_pool, the engine runs on a warm engine in a worker process instead
+    of in the calling process. With a response_budget, an engine response
+    exceeding it yields an ERROR verdict noted
+    component_engine_response_over_budget.
+    """
+
+    COMPONENT = "unknown"
+    ENGINE_MODULES: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        *,
+        engine_pool: EnginePool | None = None,
+        engine_registry: EngineImportRegistry | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        verdict_cache: VerdictCache | None = None,
+        process_pool: EngineProcessPool | None = None,
+        response_budget: V3WorkBudget | None = None,
+    ) -> None:
+        self.engine_pool = engine_pool
+        self.engine_registry = engine_registry or DEFAULT_ENGINE_REGISTRY
+        self.circuit_breaker = circuit_breaker
+        self.verdict_cache = verdict_cache
+        self.process_pool = process_pool
+        self.response_budget = response_budget
+        self._outcome_lock = threading.Lock()
+        self._abandoned = False
+
+    def abandon(self) -> None:
+        """Record a call the caller stopped waiting for as a breaker failure.
+
+        Engine outcomes the call reports afterwards are discarded, so a late
+        success cannot reset the failures a slow engine keeps causing.
+        """
+        with self._outcome_lock:
+            if self._abandoned:
+                return
+            self._abandoned = True
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+
+    def evaluate_v3(self, request: OrchestratorV3Request | PreparedRequest) -> ComponentBridgeResult:
+        prepared = request if isinstance(request, PreparedRequest) else prepare_request(request)
+        request_id = prepared.request_id
+        context_hash = prepared.context_hash
+        payload = prepared.component_input(self.COMPONENT)
+        if payload is None:
+            return self._error(request_id, context_hash, "missing_component_input")
+        cache_key, cached = self._cached(prepared, payload)
+        if cached is not None:
+            return cached
+        if not self._breaker_allows():
+            return self._error(request_id, context_hash, CIRCUIT_OPEN_NOTE)
+        try:
+            response = self._evaluate_engine(payload, request_id=request_id)
+        except Exception:
+            self._record_engine_outcome(False)
+            return self._error(request_id, context_hash, "component_engine_unavailable_or_failed")
+        self._record_engine_outcome(True)
+        result = build_component_result_from_response(
+            component_id=self.COMPONENT,
+            request_id=request_id,
+            context_hash=context_hash,
+            engine_response=response,
+            budget=self.response_budget,
+        )
+        self._remember(cache_key, result)
+        return result
+
+    def evaluate_v3_many(self, items: Sequence[PreparedRequest]) -> list[Any]:
+        """Evaluate a batch of prepared requests.
+
+        The engine is loaded (or leased) once for the whole batch. Engines
+        exposing evaluate_many() receive every engine request in one call;
+        otherwise, or if the batch call fails, each input is evaluated
+        individually so one bad input cannot fail the rest of the batch.
+
+        Returns one entry per item, in order: a ComponentBridgeResult, or the
+        exception that the single-request path would have raised for it.
+        """
+        results: list[Any] = [None] * len(items)
+        pending: list[tuple[int, Mapping[str, Any]]] = []
+        cache_keys: dict[int, VerdictCacheKey | None] = {}
+        for index, item in enumerate(items):
+            payload = item.component_input(self.COMPONENT)
+            if payload is None:
+                results[index] = self._error(item.request_id, item.context_hash, "missing_component_input")
+                continue
+            cache_keys[index], results[index] = self._cached(item, payload)
+            if results[index] is None:
+                pending.append((index, payload))
+        if not pending:
+            return results
+        if not self._breaker_allows():
+            for index, _ in pending:
+                results[index] = self._error(items[index].request_id, items[index].context_hash, CIRCUIT_OPEN_NOTE)
+            return results
+
+        try:
+            if self.process_pool is not None:
+                self._evaluate_pending_remote(self.process_pool, items, pending, results, cache_keys)
+            else:
+                with self._engine_lease() as engine:
+                    self._evaluate_pending(engine, items, pending, results, cache_keys)
+        except Exception:
+            self._record_engine_outcome(False)
+            for index, _ in pending:
+                if results[index] is None:
+                    results[index] = self._error(
+                        items[index].request_id,
+                        items[index].context_hash,
+                        "component_engine_unavailable_or_failed",
+                    )
+        return results
+
+    def _evaluate_pending(
+        self,
+        engine: Any,
+        items: Sequence[PreparedRequest],
+        pending: list[tuple[int, Mapping[str, Any]]],
+        results: list[Any],
+        cache_keys: Mapping[int, VerdictCacheKey | None],
+    ) -> None:
+        responses = self._call_engine_many_or_none(
+            engine, [(payload, items[index].request_id) for index, payload in pending]
+        )
+
+        def respond(position: int, payload: Mapping[str, Any], request_id: str) -> Any:
+            if responses is None:
+                return self._call_engine(engine, payload, request_id=request_id)
+            return responses[position]
+
+        self._fill_pending(items, pending, results, cache_keys, respond)
+
+    def _evaluate_pending_remote(
+        self,
+        pool: EngineProcessPool,
+        items: Sequence[PreparedRequest],
+        pending: list[tuple[int, Mapping[str, Any]]],
+        results: list[Any],
+        cache_keys: Mapping[int, VerdictCacheKey | None],
+    ) -> None:
+        """Fan the batch out across the process pool's workers."""
+        futures = [
+            pool.submit(self.COMPONENT, payload, request_id=items[index].request_id)
+            for index, payload in pending
+        ]
+        self._fill_pending(
+            items,
+            pending,
+            results,
+            cache_keys,
+            lambda position, payload, request_id: futures[position].result(),
+        )
+
+    def _fill_pending(
+        self,
+        items: Sequence[PreparedRequest],
+        pending: list[tuple[int, Mapping[str, Any]]],
+        results: list[Any],
+        cache_keys: Mapping[int, VerdictCacheKey | None],
+        respond: Callable[[int, Mapping[str, Any], str], Any],
+    ) -> None:
+        for position, (index, payload) in enumerate(pending):
+            request_id = items[index].request_id
+            context_hash = items[index].context_hash
+            try:
+                response = respond(position, payload, request_id)
+            except Exception:
+                self._record_engine_outcome(False)
+                results[index] = self._error(
+                    request_id, context_hash, "component_engine_unavailable_or_failed"
+                )
+                continue
+            self._record_engine_outcome(True)
+            try:
+                results[index] = build_component_result_from_response(
+                    component_id=self.COMPONENT,
+                    request_id=request_id,
+                    context_hash=context_hash,
+                    engine_response=response,
+                    budget=self.response_budget,
+                )
+            except Exception as e:
+                results[index] = e
+            else:
+                self._remember(cache_keys[index], results[index])
+
+    def _cached(
+        self,
+        prepared: PreparedRequest,
+        payload: Mapping[str, Any],
+    ) -> tuple[VerdictCacheKey | None, ComponentBridgeResult | None]:
+        if self.verdict_cache is None:
+            return None, None
+        key = self.verdict_cache.key(
+            self.COMPONENT,
+            request_id=prepared.request_id,
+            context_hash=prepared.context_hash,
+            component_input=payload,
+        )
+        return key, None if key is None else self.verdict_cache.get(key)
+
+    def _remember(self, key: VerdictCacheKey | None, result: ComponentBridgeResult) -> None:
+        if self.verdict_cache is not None and key is not None:
+            self.verdict_cache.put(key, result)
+
+    def _breaker_allows(self) -> bool:
+        return self.circuit_breaker is None or self.circuit_breaker.allow()
+
+    def _record_engine_outcome(self, succeeded: bool) -> None:
+        if self.circuit_breaker is None:
+            return
+        with self._outcome_lock:
+            if self._abandoned:
+                return
+            if succeeded:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+
+    def _evaluate_engine(self, payload: Mapping[str, Any], *, request_id: str) -> Any:
+        if self.process_pool is not None:
+            return self.process_pool.evaluate(self.COMPONENT, payload, request_id=request_id)
+        with self._engine_lease() as engine:
+            return self._call_engine(engine, payload, request_id=request_id)
+
+    @contextmanager
+    def _engine_lease(self) -> Iterator[Any]:
+        if self.engine_pool is None:
+            yield self._load_engine()
+        else:
+            with self.engine_pool.lease() as engine:
+                yield engine
+
+    def _resolve_engine(self) -> Any:
+        return self.engine_registry.resolve(self.ENGINE_MODULES, self._import_engine)
+
+    @abstractmethod
+    def _import_engine(self) -> Any:
+        """Import the engine entry points; called once through the registry."""
+
+    @abstractmethod
+    def _load_engine(self) -> Any:
+        """Construct an engine from the resolved entry points."""
+
+    def _call_engine(self, engine: Any, payload: Mapping[str, Any], *, request_id: str) -> Any:
+        return engine.evaluate(self._engine_request(payload, request_id=request_id))
+
+    def _call_engine_many(self, engine: Any, inputs: list[tuple[Mapping[str, Any], str]]) -> list[Any] | None:
+        """Batch engine call, or None when the engine has no batch entry point."""
+        evaluate_many = getattr(engine, "evaluate_many", None)
+        if not callable(evaluate_many):
+            return None
+        return list(
+            evaluate_many(
+                [self._engine_request(payload, request_id=request_id) for payload, request_id in inputs]
+            )
+        )
+
+    def _call_engine_many_or_none(
+        self,
+        engine: Any,
+        inputs: list[tuple[Mapping[str, Any], str]],
+    ) -> list[Any] | None:
+        try:
+            responses = self._call_engine_many(engine, inputs)
+        except Exception:
+            return None
+        if responses is not None and len(responses) != len(inputs):
+            return None
+        return responses
+
+    @abstractmethod
+    def _engine_request(self, payload: Mapping[str, Any], *, request_id: str) -> dict[str, Any]:
+        """Translate one component input into the engine request."""
+
+    def _error(self, request_id: str, context_hash: str, note: str) -> ComponentBridgeResult:
+        return error_component_result(
+            component_id=self.COMPONENT,
+            request_id=request_id,
+            context_hash=context_hash,
+            note=note,
+        )
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, is_dataclass
+import hashlib
+import json
+import math
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from enum import Enum
+from json.encoder import encode_basestring
 from typing import Any, Mapping
 
 from shield_orchestrator.v3.context_hash import compute_context_hash
@@ -9,9 +13,10 @@ from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, Tra
 from shield_orchestrator.v3.contracts.v3_2_receipt import (
     COMPONENT_EVIDENCE_FAMILIES,
     COMPONENT_REASON_IDS,
+    VERDICT_VALIDATOR,
     canonical_sha256,
-    validate_component_verdict,
 )
+from shield_orchestrator.v3.work_budget import V3WorkBudget, V3WorkBudgetError, WorkMeter
 
 _FORBIDDEN_AUTHORITY_KEYS = frozenset(
     {
@@ -82,6 +87,8 @@ _COMPONENT_DEFAULT_FAMILY = {
     "sentinel_ai": "telemetry",
 }
 
+RESPONSE_OVER_BUDGET_NOTE = "component_engine_response_over_budget"
+
 _COMPONENT_PAYLOAD_ALIASES = {
     "sentinel_ai": ("sentinel_ai", "sentinel"),
     "dqsn": ("dqsn", "dqs_network"),
@@ -99,6 +106,43 @@ class ComponentBridgeResult:
     verdict: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class PreparedRequest:
+    """Request-scoped receipt context, derived once and shared by every bridge.
+
+    request_id and context_hash are the receipt bindings; component_inputs
+    holds the explicit input found for each component, keyed by component id.
+    """
+
+    request: OrchestratorV3Request
+    request_id: str
+    context_hash: str
+    component_inputs: Mapping[str, Mapping[str, Any]]
+
+    def component_input(self, component_id: str) -> Mapping[str, Any] | None:
+        return self.component_inputs.get(component_id)
+
+
+def prepare_request(request: OrchestratorV3Request) -> PreparedRequest:
+    """Derive request_id, context_hash and component inputs in one pass.
+
+    The context hash may serialize the whole payload, so callers evaluating
+    several components should prepare once and pass the result to each bridge.
+    """
+
+    inputs: dict[str, Mapping[str, Any]] = {}
+    for component_id in _COMPONENT_PAYLOAD_ALIASES:
+        value = component_input(request, component_id)
+        if value is not None:
+            inputs[component_id] = value
+    return PreparedRequest(
+        request=request,
+        request_id=receipt_request_id(request),
+        context_hash=receipt_context_hash(request),
+        component_inputs=inputs,
+    )
+
+
 def receipt_request_id(request: OrchestratorV3Request) -> str:
     """Return the deterministic request_id used by the Shield v3.2 receipt."""
 
@@ -150,10 +194,24 @@ def build_component_result_from_response(
     request_id: str,
     context_hash: str,
     engine_response: Any,
+    budget: V3WorkBudget | None = None,
 ) -> ComponentBridgeResult:
-    """Translate a real component engine response into Shield v3.2 verdict shape."""
+    """Translate a real component engine response into Shield v3.2 verdict shape.
 
-    normalized = _json_like(engine_response)
+    With a budget, a response exceeding it yields an ERROR verdict as soon as
+    the cap is hit, before it is fully normalized or hashed.
+    """
+
+    try:
+        digested = _digest_engine_response(component_id, engine_response, budget)
+    except V3WorkBudgetError:
+        return error_component_result(
+            component_id=component_id,
+            request_id=request_id,
+            context_hash=context_hash,
+            note=RESPONSE_OVER_BUDGET_NOTE,
+        )
+    normalized = digested.normalized
     if not isinstance(normalized, dict):
         return error_component_result(
             component_id=component_id,
@@ -161,7 +219,7 @@ def build_component_result_from_response(
             context_hash=context_hash,
             note="component_engine_returned_non_object",
         )
-    if _contains_forbidden_authority(normalized):
+    if digested.forbidden_authority:
         return error_component_result(
             component_id=component_id,
             request_id=request_id,
@@ -171,7 +229,7 @@ def build_component_result_from_response(
 
     decision = _normalized_decision(normalized)
     reason_id = _COMPONENT_REASON_BY_DECISION[component_id][decision]
-    evidence_hash = canonical_sha256({"component_id": component_id, "engine_response": normalized})
+    evidence_hash = digested.evidence_hash()
     metadata = {
         "bridge_source": "real_component_engine",
         "engine_component": str(normalized.get("component", component_id)),
@@ -221,6 +279,41 @@ def error_component_result(
     return ComponentBridgeResult(trace=_trace_from_verdict(verdict, note=note), verdict=verdict)
 
 
+def skipped_component_result(
+    *,
+    component_id: str,
+    request_id: str,
+    context_hash: str,
+    note: str,
+) -> ComponentBridgeResult:
+    """Build a SKIPPED component verdict for a component that was deliberately not evaluated.
+
+    SKIPPED never permits: a receipt containing one is at best DENY. The
+    component's invalid-verdict reason_id is reused since v3.2 defines no
+    dedicated skip reason.
+    """
+
+    evidence_hash = canonical_sha256(
+        {
+            "component_id": component_id,
+            "skipped": note,
+            "request_id": request_id,
+            "context_hash": context_hash,
+        }
+    )
+    verdict = _build_verdict(
+        component_id=component_id,
+        request_id=request_id,
+        context_hash=context_hash,
+        decision="SKIPPED",
+        reason_ids=[_COMPONENT_ERROR_REASON[component_id]],
+        evidence_hash=evidence_hash,
+        evidence_families=[_COMPONENT_DEFAULT_FAMILY[component_id]],
+        metadata={"bridge_source": "orchestrator", "bridge_skipped": note},
+    )
+    return ComponentBridgeResult(trace=_trace_from_verdict(verdict, note=note), verdict=verdict)
+
+
 def _build_verdict(
     *,
     component_id: str,
@@ -245,12 +338,12 @@ def _build_verdict(
         "metadata": metadata,
         "fail_closed": True,
     }
-    return validate_component_verdict(verdict, expected_context_hash=context_hash)
+    return VERDICT_VALIDATOR.validate(verdict, expected_context_hash=context_hash)
 
 
 def _trace_from_verdict(verdict: Mapping[str, Any], *, note: str) -> TraceEntry:
     decision = str(verdict["decision"])
-    status = "ERROR" if decision == "ERROR" else "DENY" if decision == "DENY" else "OK"
+    status = decision if decision in {"ERROR", "DENY", "SKIPPED"} else "OK"
     return TraceEntry(
         stage=str(verdict["component_id"]),
         component=str(verdict["component_id"]),
@@ -285,8 +378,155 @@ def _contains_forbidden_authority(value: Any) -> bool:
     return False
 
 
+# Canonical JSON fragments are hashed in chunks of about this many parts.
+_DIGEST_FLUSH_PARTS = 4096
+# Raised for dataclass types in engine responses, as asdict() does.
+_DATACLASS_TYPE_ERROR = "asdict() should be called on dataclass instances"
+
+
+@dataclass(frozen=True)
+class _DigestedResponse:
+    """Result of the single walk over an engine response."""
+
+    normalized: Any
+    forbidden_authority: bool
+    digest: str
+    error: Exception | None
+
+    def evidence_hash(self) -> str:
+        """canonical_sha256({"component_id": ..., "engine_response": normalized}).
+
+        Raises the serialization error canonical_sha256 would have raised.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.digest
+
+
+def _digest_engine_response(
+    component_id: str,
+    engine_response: Any,
+    budget: V3WorkBudget | None = None,
+) -> _DigestedResponse:
+    """
+    Normalize, authority-scan and evidence-hash an engine response in one walk.
+
+    Equivalent to _json_like(), then _contains_forbidden_authority() on the
+    result, then canonical_sha256({"component_id": component_id,
+    "engine_response": normalized}). Mapping keys are visited in sorted order,
+    so canonical JSON fragments are produced in output order and fed to
+    SHA-256 in chunks without building the whole document. A serialization
+    error is kept, not raised, so that the authority scan still completes as
+    it does in the three-pass form.
+
+    With a budget, the same walk meters the response and raises
+    V3WorkBudgetError at the first exceeded cap.
+    """
+    meter: WorkMeter | None = None if budget is None else budget.meter()
+    sha = hashlib.sha256()
+    parts: list[str] = []
+    append = parts.append
+    forbidden = False
+    errors: list[Exception] = []
+    encode_errors: list[Exception] = []
+
+    def flush() -> None:
+        try:
+            sha.update("".join(parts).encode("utf-8"))
+        except UnicodeEncodeError as e:
+            encode_errors.append(e)
+        parts.clear()
+
+    def leaf(value: Any) -> None:
+        if isinstance(value, float) and math.isfinite(value):
+            append(float.__repr__(value))
+            return
+        try:
+            append(_canonical_leaf(value))
+        except (TypeError, ValueError) as e:
+            errors.append(e)
+
+    def walk(value: Any, depth: int) -> Any:
+        nonlocal forbidden
+        if meter is not None:
+            meter.node(depth)
+        kind = type(value)
+        if kind is str:
+            if meter is not None:
+                meter.text(value)
+            append(encode_basestring(value))
+            return value
+        if kind is int or kind is float or kind is bool or value is None:
+            if meter is not None:
+                meter.scalar(value)
+            leaf(value)
+            return value
+        if kind is not dict and kind is not list:
+            if is_dataclass(value):
+                if isinstance(value, type):
+                    raise TypeError(_DATACLASS_TYPE_ERROR)
+                value = {f.name: getattr(value, f.name) for f in fields(value)}
+            elif isinstance(value, Enum):
+                raw = value.value
+                if meter is not None:
+                    meter.visit(raw, depth)
+                forbidden = forbidden or _contains_forbidden_authority(raw)
+                leaf(raw)
+                return raw
+        if isinstance(value, Mapping):
+            if meter is not None:
+                for key in value:
+                    meter.key(key)
+            items = {str(k): v for k, v in value.items()}
+            if not forbidden and not _FORBIDDEN_AUTHORITY_KEYS.isdisjoint(items):
+                forbidden = True
+            normalized = dict.fromkeys(items)
+            append("{")
+            for index, key in enumerate(sorted(items)):
+                append(("," if index else "") + encode_basestring(key) + ":")
+                normalized[key] = walk(items[key], depth + 1)
+            append("}")
+            if len(parts) >= _DIGEST_FLUSH_PARTS:
+                flush()
+            return normalized
+        if isinstance(value, (list, tuple)):
+            append("[")
+            normalized_items = []
+            for index, item in enumerate(value):
+                if index:
+                    append(",")
+                normalized_items.append(walk(item, depth + 1))
+            append("]")
+            if len(parts) >= _DIGEST_FLUSH_PARTS:
+                flush()
+            return normalized_items
+        if meter is not None:
+            meter.scalar(value)
+        leaf(value)
+        return value
+
+    append('{"component_id":' + encode_basestring(component_id) + ',"engine_response":')
+    normalized = walk(engine_response, 1)
+    append("}")
+    flush()
+    error = next(iter(errors or encode_errors), None)
+    return _DigestedResponse(
+        normalized=normalized,
+        forbidden_authority=forbidden,
+        digest="" if error is not None else sha.hexdigest(),
+        error=error,
+    )
+
+
+def _canonical_leaf(value: Any) -> str:
+    """Canonical JSON of a value that is not a normalized dict or list; raises like canonical_json."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
 def _json_like(value: Any) -> Any:
     if is_dataclass(value):
+        if isinstance(value, type):
+            raise TypeError(_DATACLASS_TYPE_ERROR)
         return _json_like(asdict(value))
     if isinstance(value, Enum):
         return value.value
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .engine_registry import EngineImportRegistry
+
+
+@dataclass(frozen=True)
+class EnginePoolStats:
+    """Point-in-time engine pool counters."""
+
+    size: int
+    idle: int
+    created: int
+    hits: int
+    misses: int
+    per_thread: bool
+    closed: bool
+
+
+class EnginePool:
+    """
+    Warm pool of component engine instances for one bridge.
+
+    Engines are constructed by factory (normally the bridge's _load_engine)
+    and reused across requests instead of being built per call.
+
+    - per_thread=False: engines are leased exclusively; up to size idle
+      engines are kept warm, extra engines created under contention are
+      dropped on release.
+    - per_thread=True: each thread keeps its own engine while it lives, for
+      engines that are not thread-safe. Warm engines are claimed by the first
+      threads to use the pool; when a thread exits its engine goes back to
+      the idle engines, so the short-lived workers of per-call executors
+      reuse warm engines. At most size engines are kept idle; the rest are
+      closed.
+
+    A lease that reuses a warm engine counts as a hit; one that has to
+    construct an engine counts as a miss. After shutdown() every lease fails,
+    which bridges report as component_engine_unavailable_or_failed.
+    """
+
+    def __init__(self, factory: Callable[[], Any], *, size: int = 1, per_thread: bool = False) -> None:
+        if isinstance(size, bool) or not isinstance(size, int) or size <= 0:
+            raise ValueError("engine pool size must be a positive integer")
+        self._factory = factory
+        self._size = size
+        self._per_thread = per_thread
+        self._lock = threading.Lock()
+        self._idle: list[Any] = []
+        self._thread_engines: dict[int, Any] = {}
+        self._tokens = itertools.count()
+        self._local = threading.local()
+        self._closed = False
+        self._created = 0
+        self._hits = 0
+        self._misses = 0
+
+    def warmup(self) -> None:
+        """Eagerly construct engines until size warm engines are idle."""
+        with self._lock:
+            self._require_open()
+            missing = self._size - len(self._idle)
+        engines = [self._factory() for _ in range(missing)]
+        with self._lock:
+            self._require_open()
+            self._created += len(engines)
+            self._idle.extend(engines)
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        engine = self._acquire()
+        try:
+            yield engine
+        finally:
+            self._release(engine)
+
+    def shutdown(self) -> None:
+        """Drop every engine, calling close() on engines that provide it."""
+        with self._lock:
+            self._closed = True
+            engines = self._idle + list(self._thread_engines.values())
+            self._idle = []
+            self._thread_engines = {}
+        for engine in engines:
+            _close(engine)
+
+    def stats(self) -> EnginePoolStats:
+        with self._lock:
+            return EnginePoolStats(
+                size=self._size,
+                idle=len(self._idle),
+                created=self._created,
+                hits=self._hits,
+                misses=self._misses,
+                per_thread=self._per_thread,
+                closed=self._closed,
+            )
+
+    def _acquire(self) -> Any:
+        if not self._per_thread:
+            return self._take()
+        holder = getattr(self._local, "holder", None)
+        if holder is not None:
+            with self._lock:
+                self._require_open()
+                self._hits += 1
+            return holder.engine
+        engine = self._take()
+        token = next(self._tokens)
+        with self._lock:
+            self._thread_engines[token] = engine
+        holder = self._local.holder = _ThreadEngine(engine)
+        # The thread's locals are dropped when it exits, which hands the engine back.
+        weakref.finalize(holder, _thread_exited, weakref.ref(self), token).atexit = False
+        return engine
+
+    def _take(self) -> Any:
+        with self._lock:
+            self._require_open()
+            if self._idle:
+                self._hits += 1
+                return self._idle.pop()
+            self._misses += 1
+        engine = self._factory()
+        with self._lock:
+            self._created += 1
+        return engine
+
+    def _release(self, engine: Any) -> None:
+        if self._per_thread:
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self._size:
+                self._idle.append(engine)
+
+    def _return_thread_engine(self, token: int) -> None:
+        with self._lock:
+            engine = self._thread_engines.pop(token, None)
+            if engine is None:
+                return
+            if not self._closed and len(self._idle) < self._size:
+                self._idle.append(engine)
+                return
+        _close(engine)
+
+    def _require_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("engine pool is shut down")
+
+
+class _ThreadEngine:
+    """A thread's engine in a per_thread pool, stored in the thread's locals."""
+
+    __slots__ = ("engine", "__weakref__")
+
+    def __init__(self, engine: Any) -> None:
+        self.engine = engine
+
+
+def _thread_exited(pool_ref: weakref.ref[EnginePool], token: int) -> None:
+    pool = pool_ref()
+    if pool is not None:
+        pool._return_thread_engine(token)
+
+
+def _close(engine: Any) -> None:
+    close = getattr(engine, "close", None)
+    if callable(close):
+        close()
+
+
+class EnginePools:
+    """Engine pools keyed by bridge COMPONENT."""
+
+    def __init__(self, pools: Mapping[str, EnginePool]) -> None:
+        self._pools = dict(pools)
+
+    @classmethod
+    def for_bridges(
+        cls,
+        bridge_types: Iterable[type[Any]],
+        *,
+        size: int = 1,
+        sizes: Mapping[str, int] | None = None,
+        per_thread: Iterable[str] = (),
+        engine_registry: EngineImportRegistry | None = None,
+    ) -> EnginePools:
+        """Build one pool per bridge from its _load_engine() factory."""
+        sizes = sizes or {}
+        per_thread_components = frozenset(per_thread)
+        return cls(
+            {
+                bridge_type.COMPONENT: EnginePool(
+                    bridge_type(engine_registry=engine_registry)._load_engine,
+                    size=sizes.get(bridge_type.COMPONENT, size),
+                    per_thread=bridge_type.COMPONENT in per_thread_components,
+                )
+                for bridge_type in bridge_types
+            }
+        )
+
+    def get(self, component: str) -> EnginePool | None:
+        return self._pools.get(component)
+
+    def warmup(self) -> dict[str, bool]:
+        """Warm every pool; returns component -> whether its engines could be built."""
+        ready: dict[str, bool] = {}
+        for component, pool in self._pools.items():
+            try:
+                pool.warmup()
+            except Exception:
+                ready[component] = False
+            else:
+                ready[component] = True
+        return ready
+
+    def shutdown(self) -> None:
+        for pool in self._pools.values():
+            pool.shutdown()
+
+    def stats(self) -> dict[str, EnginePoolStats]:
+        return {component: pool.stats() for component, pool in self._pools.items()}
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from .component_verdicts import _json_like
+
+# Worker-process state: one bridge and one warm engine per component.
+_WORKER_BRIDGES: dict[str, Any] = {}
+_WORKER_ENGINES: dict[str, Any] = {}
+
+
+class EngineProcessPool:
+    """
+    Persistent process pool for CPU-bound component engines.
+
+    Each worker process preloads one engine per selected bridge at start-up
+    and keeps it warm. Bridges whose COMPONENT is in the pool send the
+    component input and request_id to a worker, which runs the bridge's own
+    _call_engine() on its warm engine and returns the response as plain
+    JSON-like data. The verdict is then built in the calling process exactly
+    as for an in-process engine.
+
+    Any worker failure, including a crashed worker breaking the pool, surfaces
+    as an exception and therefore as the bridge's fail-closed ERROR verdict.
+    A broken pool is replaced by a fresh one for subsequent calls.
+    """
+
+    def __init__(
+        self,
+        bridge_types: Iterable[type[Any]],
+        *,
+        max_workers: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        if max_workers is not None and (
+            isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers <= 0
+        ):
+            raise ValueError("max_workers must be a positive integer")
+        self._bridge_types = tuple(bridge_types)
+        self.components = frozenset(bridge_type.COMPONENT for bridge_type in self._bridge_types)
+        self._max_workers = max_workers
+        self._mp_context = mp_context
+        self._lock = threading.Lock()
+        self._closed = False
+        self._replacements = 0
+        self._executor = self._new_executor()
+
+    def submit(self, component: str, payload: Mapping[str, Any], *, request_id: str) -> Future[Any]:
+        """Evaluate one component input on a worker; the future resolves to a plain response."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("engine process pool is shut down")
+            executor = self._executor
+        try:
+            future = executor.submit(_evaluate_in_worker, component, dict(payload), request_id)
+        except BrokenProcessPool:
+            self._replace(executor)
+            raise
+        future.add_done_callback(lambda done: self._replace_if_broken(executor, done))
+        return future
+
+    def evaluate(self, component: str, payload: Mapping[str, Any], *, request_id: str) -> Any:
+        return self.submit(component, payload, request_id=request_id).result()
+
+    def warmup(self) -> None:
+        """Start every worker process, preloading its engines."""
+        with self._lock:
+            executor = self._executor
+        workers = self._max_workers or os.cpu_count() or 1
+        for future in [executor.submit(_worker_ready) for _ in range(workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def replacements(self) -> int:
+        """How many times a broken pool has been replaced."""
+        with self._lock:
+            return self._replacements
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._bridge_types,),
+        )
+
+    def _replace_if_broken(self, executor: ProcessPoolExecutor, future: Future[Any]) -> None:
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._replace(executor)
+
+    def _replace(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._closed or self._executor is not broken:
+                return
+            self._executor = self._new_executor()
+            self._replacements += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_worker(bridge_types: tuple[type[Any], ...]) -> None:
+    """Worker initializer: build each bridge and preload its engine."""
+    for bridge_type in bridge_types:
+        bridge = bridge_type()
+        _WORKER_BRIDGES[bridge_type.COMPONENT] = bridge
+        try:
+            _WORKER_ENGINES[bridge_type.COMPONENT] = bridge._load_engine()
+        except Exception:
+            _WORKER_ENGINES.pop(bridge_type.COMPONENT, None)
+
+
+def _worker_ready() -> bool:
+    return True
+
+
+def _evaluate_in_worker(component: str, payload: Mapping[str, Any], request_id: str) -> Any:
+    bridge = _WORKER_BRIDGES[component]
+    engine = _WORKER_ENGINES.get(component)
+    if engine is None:
+        engine = _WORKER_ENGINES[component] = bridge._load_engine()
+    return _json_like(bridge._call_engine(engine, payload, request_id=request_id))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class EngineReadiness:
+    """Startup readiness of one component engine."""
+
+    component: str
+    live: bool
+    modules: tuple[str, ...]
+
+
+class EngineImportRegistry:
+    """
+    Resolved-import cache for component engine entry points.
+
+    Each bridge imports its engine package with literal import statements in
+    a loader (_import_engine). The registry runs the loader once and caches
+    what it returns, keyed by the engine's module names.
+
+    - A cached entry point is reused while sys.modules still holds the same
+      module objects, so reinstalled or replaced modules are picked up.
+    - A loader that fails with ImportError marks the engine unavailable and
+      is not run again until reprobe_interval_seconds have elapsed; lookups
+      in between fail immediately with ModuleNotFoundError instead of
+      searching sys.path again.
+    """
+
+    def __init__(
+        self,
+        *,
+        reprobe_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(reprobe_interval_seconds, bool) or not isinstance(reprobe_interval_seconds, (int, float)):
+            raise ValueError("reprobe_interval_seconds must be a non-negative number")
+        if reprobe_interval_seconds < 0:
+            raise ValueError("reprobe_interval_seconds must be a non-negative number")
+        self._reprobe_interval = float(reprobe_interval_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._resolved: dict[tuple[str, ...], tuple[tuple[Any, ...], Any]] = {}
+        self._unavailable_until: dict[tuple[str, ...], float] = {}
+
+    def resolve(self, module_names: tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        modules = tuple(sys.modules.get(name) for name in module_names)
+        if all(module is not None for module in modules):
+            cached = self._resolved.get(module_names)
+            if cached is not None and all(a is b for a, b in zip(cached[0], modules, strict=True)):
+                return cached[1]
+        else:
+            with self._lock:
+                until = self._unavailable_until.get(module_names)
+            if until is not None and self._clock() < until:
+                raise ModuleNotFoundError(f"{', '.join(module_names)} cached as unavailable")
+        try:
+            value = loader()
+        except ImportError:
+            with self._lock:
+                self._unavailable_until[module_names] = self._clock() + self._reprobe_interval
+            raise
+        loaded = tuple(sys.modules.get(name) for name in module_names)
+        with self._lock:
+            self._unavailable_until.pop(module_names, None)
+            self._resolved[module_names] = (loaded, value)
+        return value
+
+    def readiness(self, bridge_types: Iterable[type[Any]]) -> tuple[EngineReadiness, ...]:
+        """Resolve every bridge's engine entry points and report which engines are live."""
+        report: list[EngineReadiness] = []
+        for bridge_type in bridge_types:
+            bridge = bridge_type(engine_registry=self)
+            try:
+                bridge._resolve_engine()
+            except Exception:
+                live = False
+            else:
+                live = True
+            report.append(
+                EngineReadiness(
+                    component=bridge_type.COMPONENT,
+                    live=live,
+                    modules=tuple(bridge_type.ENGINE_MODULES),
+                )
+            )
+        return tuple(report)
+
+    def unavailable(self) -> tuple[tuple[str, ...], ...]:
+        """Engine module groups currently cached as unavailable."""
+        now = self._clock()
+        with self._lock:
+            return tuple(
+                sorted(names for names, until in self._unavailable_until.items() if now < until)
+            )
+
+
+DEFAULT_ENGINE_REGISTRY = EngineImportRegistry()
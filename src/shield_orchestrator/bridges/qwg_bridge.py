@@ -1,69 +1,52 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Mapping, NamedTuple
 
-from .base_layer import BaseLayer
-from .component_verdicts import (
-    ComponentBridgeResult,
-    build_component_result_from_response,
-    component_input,
-    error_component_result,
-    receipt_context_hash,
-    receipt_request_id,
-)
-from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from .component_bridge import ComponentBridge
 
 
-class QWGBridge(BaseLayer):
+class _QWGEngine(NamedTuple):
+    decision_engine: Any
+    risk_context: Any
+    risk_level: Any
+
+
+class QWGBridge(ComponentBridge):
     """QWG bridge for Shield v3.2 receipt synthesis."""
 
     COMPONENT = "qwg"
+    ENGINE_MODULES = ("qwg",)
 
-    def evaluate_v3(self, request: OrchestratorV3Request) -> ComponentBridgeResult:
-        request_id = receipt_request_id(request)
-        context_hash = receipt_context_hash(request)
-        payload = component_input(request, self.COMPONENT)
-        if payload is None:
-            return error_component_result(
-                component_id=self.COMPONENT,
-                request_id=request_id,
-                context_hash=context_hash,
-                note="missing_component_input",
-            )
-        try:
-            response = self._evaluate_engine(payload, request_id=request_id)
-        except Exception:
-            return error_component_result(
-                component_id=self.COMPONENT,
-                request_id=request_id,
-                context_hash=context_hash,
-                note="component_engine_unavailable_or_failed",
-            )
-        return build_component_result_from_response(
-            component_id=self.COMPONENT,
-            request_id=request_id,
-            context_hash=context_hash,
-            engine_response=response,
-        )
-
-    def _evaluate_engine(self, payload: Mapping[str, Any], *, request_id: str) -> Any:
+    def _import_engine(self) -> Any:
         from qwg import DecisionEngine, RiskContext, RiskLevel
 
+        return DecisionEngine, RiskContext, RiskLevel
+
+    def _load_engine(self) -> Any:
+        decision_engine, risk_context, risk_level = self._resolve_engine()
+        return _QWGEngine(decision_engine(), risk_context, risk_level)
+
+    def _call_engine(self, engine: Any, payload: Mapping[str, Any], *, request_id: str) -> Any:
+        fields = self._engine_request(payload, request_id=request_id)
+        for name in ("sentinel_level", "adn_level"):
+            fields[name] = engine.risk_level(fields[name])
+        return engine.decision_engine.evaluate_transaction_v3(engine.risk_context(**fields))
+
+    def _engine_request(self, payload: Mapping[str, Any], *, request_id: str) -> dict[str, Any]:
         ctx_payload = payload.get("risk_context", payload)
         if not isinstance(ctx_payload, Mapping):
             ctx_payload = {}
-        ctx = RiskContext(
-            sentinel_level=self._risk_level(ctx_payload.get("sentinel_level", "normal"), RiskLevel),
-            dqs_network_score=float(ctx_payload.get("dqs_network_score", 0.0)),
-            adn_level=self._risk_level(ctx_payload.get("adn_level", "normal"), RiskLevel),
-            wallet_balance=float(ctx_payload.get("wallet_balance", 0.0)),
-            tx_amount=float(ctx_payload.get("tx_amount", 0.0)),
-            address_age_days=ctx_payload.get("address_age_days"),
-            behaviour_score=float(ctx_payload.get("behaviour_score", 1.0)),
-            device_id=ctx_payload.get("device_id"),
-            trusted_device=bool(ctx_payload.get("trusted_device", True)),
-        )
-        return DecisionEngine().evaluate_transaction_v3(ctx)
+        return {
+            "sentinel_level": self._risk_level(ctx_payload.get("sentinel_level", "normal"), str),
+            "dqs_network_score": float(ctx_payload.get("dqs_network_score", 0.0)),
+            "adn_level": self._risk_level(ctx_payload.get("adn_level", "normal"), str),
+            "wallet_balance": float(ctx_payload.get("wallet_balance", 0.0)),
+            "tx_amount": float(ctx_payload.get("tx_amount", 0.0)),
+            "address_age_days": ctx_payload.get("address_age_days"),
+            "behaviour_score": float(ctx_payload.get("behaviour_score", 1.0)),
+            "device_id": ctx_payload.get("device_id"),
+            "trusted_device": bool(ctx_payload.get("trusted_device", True)),
+        }
 
     @staticmethod
     def _risk_level(value: Any, risk_level_cls: Any) -> Any:
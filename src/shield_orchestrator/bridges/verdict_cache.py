@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from shield_orchestrator.v3.contracts.v3_2_receipt import canonical_sha256
+
+from .component_verdicts import ComponentBridgeResult
+
+VerdictCacheKey = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class VerdictCacheStats:
+    """Point-in-time verdict cache counters."""
+
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class VerdictCache:
+    """
+    Bounded, time-limited cache of component verdicts for retried requests.
+
+    Entries are keyed on component id, receipt request_id, context hash and
+    the canonical SHA-256 of the component input, so a hit returns exactly the
+    verdict the engine would have produced for that input. Only non-ERROR
+    verdicts are stored: failures are always re-evaluated.
+
+    - max_entries bounds the cache; the least recently used entry is evicted.
+    - ttl_seconds bounds how long an entry may be served.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(max_entries, bool) or not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        if isinstance(ttl_seconds, bool) or not isinstance(ttl_seconds, (int, float)) or not ttl_seconds > 0:
+            raise ValueError("ttl_seconds must be a positive number")
+        self._max_entries = max_entries
+        self._ttl = float(ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[VerdictCacheKey, tuple[float, ComponentBridgeResult]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def key(
+        component_id: str,
+        *,
+        request_id: str,
+        context_hash: str,
+        component_input: Mapping[str, Any],
+    ) -> VerdictCacheKey | None:
+        """Cache key for one component evaluation, or None if the input cannot be hashed."""
+        try:
+            input_hash = canonical_sha256(dict(component_input))
+        except (TypeError, ValueError):
+            return None
+        return (component_id, request_id, context_hash, input_hash)
+
+    def get(self, key: VerdictCacheKey) -> ComponentBridgeResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            result = entry[1]
+        return ComponentBridgeResult(trace=result.trace, verdict=copy.deepcopy(result.verdict))
+
+    def put(self, key: VerdictCacheKey, result: ComponentBridgeResult) -> None:
+        if result.verdict.get("decision") == "ERROR":
+            return
+        stored = ComponentBridgeResult(trace=result.trace, verdict=copy.deepcopy(result.verdict))
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> VerdictCacheStats:
+        with self._lock:
+            return VerdictCacheStats(
+                size=len(self._entries),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Response
+
+# Prometheus text exposition format, version 0.0.4.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Label value for an ERROR trace entry without a note.
+NO_NOTE = "none"
+
+_METRIC_NAME = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*\Z")
+_LABEL_NAME = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*\Z")
+
+
+class _Metric:
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str]) -> None:
+        labelnames = tuple(labelnames)
+        if not _METRIC_NAME.match(name):
+            raise ValueError(f"invalid metric name: {name!r}")
+        for label in labelnames:
+            if not _LABEL_NAME.match(label) or label.startswith("__") or label == "le":
+                raise ValueError(f"invalid label name: {label!r}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: tuple[str, ...]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}")
+        return labels
+
+    def _header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+
+
+class Counter(_Metric):
+    """Monotonic counter per label combination; one short critical section per increment."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram per label combination; buckets are chosen once, at creation."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(float(bound) for bound in buckets)
+        if not bounds or list(bounds) != sorted(set(bounds)) or not all(math.isfinite(b) for b in bounds):
+            raise ValueError("buckets must be finite, strictly increasing and non-empty")
+        self.buckets = bounds
+        # Per label key: [count per bucket..., count above the last bucket], sum.
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            series = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = _labels((*self.labelnames, "le"), (*key, _number(bound)))
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+_MetricT = TypeVar("_MetricT", "Counter", "Histogram")
+
+
+class MetricsRegistry:
+    """In-process metric families rendered in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric: _MetricT) -> _MetricT:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric._header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class ShieldMetrics:
+    """
+    The orchestrator's metric families, on a registry that may be shared.
+
+    Labels are bounded identifiers only: outcomes, reason ids, component ids
+    and trace notes. Pass one instance as OrchestratorV3Options.metrics and
+    to verify_v4_receipt_with_audit(metrics=...), and serve render() with
+    PROMETHEUS_CONTENT_TYPE.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        *,
+        latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.registry = MetricsRegistry() if registry is None else registry
+        self.v3_responses = self.registry.counter(
+            "shield_v3_responses_total", "Orchestrator v3 responses by outcome.", ("outcome",)
+        )
+        self.v3_reason_ids = self.registry.counter(
+            "shield_v3_reason_ids_total", "Reason ids on orchestrator v3 responses.", ("reason_id",)
+        )
+        self.v3_component_errors = self.registry.counter(
+            "shield_v3_component_errors_total",
+            "Component ERROR verdicts by component and trace note.",
+            ("component_id", "note"),
+        )
+        self.v3_bridge_duration = self.registry.histogram(
+            "shield_v3_bridge_duration_seconds",
+            "Component bridge evaluation latency.",
+            ("component_id",),
+            latency_buckets,
+        )
+        self.v4_verifications = self.registry.counter(
+            "shield_v4_verifications_total", "Audited v4 receipt verifications by reason id.", ("reason_id",)
+        )
+
+    def record_v3_response(self, response: OrchestratorV3Response) -> None:
+        self.v3_responses.inc(response.outcome)
+        for reason_id in response.reason_ids:
+            self.v3_reason_ids.inc(reason_id)
+        for entry in response.trace:
+            if entry.status == "ERROR":
+                self.v3_component_errors.inc(entry.component, entry.notes or NO_NOTE)
+
+    def record_bridge_durations(self, durations: Mapping[str, float]) -> None:
+        for component, seconds in durations.items():
+            self.v3_bridge_duration.observe(seconds, component)
+
+    def record_v4_result(self, reason_id: str) -> None:
+        self.v4_verifications.inc(reason_id)
+
+    def render(self) -> str:
+        return self.registry.render()
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
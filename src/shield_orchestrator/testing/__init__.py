@@ -0,0 +1,7 @@
+"""
+shield_orchestrator.testing
+
+Local stand-ins for tests and load runs. The orchestrator never imports this
+package; callers install the stand-ins explicitly, for example with
+stand_in_engines.StandInEngines.installed().
+"""
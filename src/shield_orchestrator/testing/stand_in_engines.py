@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import random
+import sys
+import threading
+import time
+import types
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+STAND_IN_DECISIONS = ("ALLOW", "ESCALATE", "DENY")
+STAND_IN_COMPONENTS = ("sentinel_ai", "dqsn", "adn", "guardian_wallet", "qwg")
+
+
+class StandInEngineError(RuntimeError):
+    """Injected stand-in engine failure."""
+
+
+@dataclass(frozen=True)
+class StandInProfile:
+    """
+    Behaviour of one stand-in component engine.
+
+    - latency_ms is the fixed latency, the mean for uniform (0 to twice
+      latency_ms) and exponential, and the median for lognormal, whose spread
+      is latency_sigma.
+    - failure_rate is the probability that a call raises StandInEngineError.
+    - response_items pads each response with that many evidence entries.
+    - decision is the decision every successful call returns.
+    """
+
+    latency_ms: float = 0.0
+    distribution: str = "fixed"
+    latency_sigma: float = 0.5
+    failure_rate: float = 0.0
+    response_items: int = 0
+    decision: str = "ALLOW"
+
+    def __post_init__(self) -> None:
+        if not _non_negative_number(self.latency_ms):
+            raise ValueError("latency_ms must be a non-negative number")
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+        if not _non_negative_number(self.latency_sigma):
+            raise ValueError("latency_sigma must be a non-negative number")
+        if not _non_negative_number(self.failure_rate) or self.failure_rate > 1:
+            raise ValueError("failure_rate must be a number between 0 and 1")
+        if isinstance(self.response_items, bool) or not isinstance(self.response_items, int) or self.response_items < 0:
+            raise ValueError("response_items must be a non-negative integer")
+        if self.decision not in STAND_IN_DECISIONS:
+            raise ValueError(f"decision must be one of {', '.join(STAND_IN_DECISIONS)}")
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        if self.latency_ms == 0 or self.distribution == "fixed":
+            return float(self.latency_ms)
+        if self.distribution == "uniform":
+            return rng.uniform(0.0, 2.0 * self.latency_ms)
+        if self.distribution == "exponential":
+            return rng.expovariate(1.0 / self.latency_ms)
+        return self.latency_ms * rng.lognormvariate(0.0, self.latency_sigma)
+
+
+@dataclass(frozen=True)
+class StandInStageStats:
+    """Calls, injected failures and engine durations (seconds) of one stand-in."""
+
+    component: str
+    calls: int
+    failures: int
+    durations: tuple[float, ...]
+
+
+class QWGRiskLevel(Enum):
+    NORMAL = "normal"
+    ELEVATED = "elevated"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+class StandInEngines:
+    """
+    Local stand-ins for the five component engine packages.
+
+    installed() places modules named like the real packages (adn_v3,
+    dqsnetwork.v3_api, dgb_wallet_guardian, qwg, sentinel_ai_v2.config and
+    sentinel_ai_v2.v3) in sys.modules, exposing the entry points and call
+    signatures the bridges use, and restores the previous modules on exit.
+    Each engine sleeps for a latency drawn from its component's profile,
+    may raise StandInEngineError, and records its own call duration so a
+    load driver can report per-stage latencies.
+
+    The modules only exist in this process: an engine process pool must use
+    the fork start method to see them.
+    """
+
+    def __init__(
+        self,
+        profiles: Mapping[str, StandInProfile] | None = None,
+        *,
+        default: StandInProfile | None = None,
+        seed: int | None = 0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        unknown = set(profiles or {}) - set(STAND_IN_COMPONENTS)
+        if unknown:
+            raise ValueError(f"unknown stand-in components: {', '.join(sorted(unknown))}")
+        default = default or StandInProfile()
+        self.profiles = {component: (profiles or {}).get(component, default) for component in STAND_IN_COMPONENTS}
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._calls = dict.fromkeys(STAND_IN_COMPONENTS, 0)
+        self._failures = dict.fromkeys(STAND_IN_COMPONENTS, 0)
+        self._durations: dict[str, list[float]] = {component: [] for component in STAND_IN_COMPONENTS}
+
+    def respond(self, component: str, request: Mapping[str, Any]) -> dict[str, Any]:
+        """Evaluate one engine request as the stand-in for component."""
+        profile = self.profiles[component]
+        started = self._clock()
+        with self._lock:
+            latency_ms = profile.sample_latency_ms(self._rng)
+            failed = profile.failure_rate > 0 and self._rng.random() < profile.failure_rate
+        try:
+            if latency_ms > 0:
+                self._sleep(latency_ms / 1000.0)
+            if failed:
+                raise StandInEngineError(f"{component} stand-in failure")
+            return {
+                "decision": profile.decision,
+                "component": request.get("component", component),
+                "request_id": request.get("request_id"),
+                "reason_codes": [f"STAND_IN_{profile.decision}"],
+                "evidence": [{"index": index, "score": index % 100 / 100} for index in range(profile.response_items)],
+            }
+        finally:
+            elapsed = self._clock() - started
+            with self._lock:
+                self._calls[component] += 1
+                self._failures[component] += failed
+                self._durations[component].append(elapsed)
+
+    def stats(self) -> dict[str, StandInStageStats]:
+        with self._lock:
+            return {
+                component: StandInStageStats(
+                    component=component,
+                    calls=self._calls[component],
+                    failures=self._failures[component],
+                    durations=tuple(self._durations[component]),
+                )
+                for component in STAND_IN_COMPONENTS
+            }
+
+    def modules(self) -> dict[str, types.ModuleType]:
+        """Build the stand-in engine modules, keyed by module name."""
+        stand_in = self
+
+        class ADNv3:
+            def evaluate(self, req: dict[str, Any]) -> dict[str, Any]:
+                return stand_in.respond("adn", req)
+
+        class GuardianWalletV3:
+            def evaluate(self, req: dict[str, Any]) -> dict[str, Any]:
+                return stand_in.respond("guardian_wallet", req)
+
+        class CircuitBreakerThresholds:
+            pass
+
+        class SentinelV3:
+            def __init__(self, *, thresholds: CircuitBreakerThresholds) -> None:
+                self.thresholds = thresholds
+
+            def evaluate(self, req: dict[str, Any]) -> dict[str, Any]:
+                return stand_in.respond("sentinel_ai", req)
+
+        def evaluate_v3(req: dict[str, Any]) -> dict[str, Any]:
+            return stand_in.respond("dqsn", req)
+
+        class RiskContext:
+            def __init__(self, **fields: Any) -> None:
+                self.fields = fields
+
+        class DecisionEngine:
+            def evaluate_transaction_v3(self, ctx: RiskContext) -> dict[str, Any]:
+                return stand_in.respond("qwg", {"component": "qwg", "request_id": None})
+
+        modules = {
+            "adn_v3": _module("adn_v3", ADNv3=ADNv3),
+            "dgb_wallet_guardian": _module("dgb_wallet_guardian", GuardianWalletV3=GuardianWalletV3),
+            "dqsnetwork": _module("dqsnetwork"),
+            "dqsnetwork.v3_api": _module("dqsnetwork.v3_api", evaluate_v3=evaluate_v3),
+            "qwg": _module("qwg", DecisionEngine=DecisionEngine, RiskContext=RiskContext, RiskLevel=QWGRiskLevel),
+            "sentinel_ai_v2": _module("sentinel_ai_v2"),
+            "sentinel_ai_v2.config": _module("sentinel_ai_v2.config", CircuitBreakerThresholds=CircuitBreakerThresholds),
+            "sentinel_ai_v2.v3": _module("sentinel_ai_v2.v3", SentinelV3=SentinelV3),
+        }
+        modules["dqsnetwork"].v3_api = modules["dqsnetwork.v3_api"]  # type: ignore[attr-defined]
+        modules["sentinel_ai_v2"].config = modules["sentinel_ai_v2.config"]  # type: ignore[attr-defined]
+        modules["sentinel_ai_v2"].v3 = modules["sentinel_ai_v2.v3"]  # type: ignore[attr-defined]
+        return modules
+
+    @contextmanager
+    def installed(self) -> Iterator[StandInEngines]:
+        """Install the stand-in modules for the duration of the block."""
+        modules = self.modules()
+        previous = {name: sys.modules.get(name) for name in modules}
+        sys.modules.update(modules)
+        try:
+            yield self
+        finally:
+            for name, module in previous.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+
+
+def _module(name: str, **attributes: Any) -> types.ModuleType:
+    module = types.ModuleType(name, "Shield v3 stand-in component engine.")
+    for key, value in attributes.items():
+        setattr(module, key, value)
+    return module
+
+
+def _non_negative_number(value: Any) -> bool:
+    return not isinstance(value, bool) and isinstance(value, (int, float)) and value >= 0
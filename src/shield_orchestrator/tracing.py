@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Protocol, TypeAlias
+
+# Span attributes are identifiers only: reason ids, component ids, outcomes
+# and counts. Request payloads, engine responses and keys never become
+# attributes.
+SpanAttribute: TypeAlias = str | int | bool | tuple[str, ...]
+
+
+class Tracer(Protocol):
+    """
+    Dependency-free span sink, shaped after OpenTelemetry's span lifecycle.
+
+    start_span() returns an opaque handle that is passed back to end_span()
+    together with the attributes gathered while the span was open and the
+    exception that ended it, if any. Tracer failures are swallowed: tracing
+    can never change an outcome.
+    """
+
+    def start_span(self, name: str, attributes: Mapping[str, SpanAttribute]) -> Any: ...
+
+    def end_span(
+        self,
+        span: Any,
+        attributes: Mapping[str, SpanAttribute],
+        error: BaseException | None,
+    ) -> None: ...
+
+
+class NoOpTracer:
+    """Tracer that records nothing; treated exactly like tracing being disabled."""
+
+    def start_span(self, name: str, attributes: Mapping[str, SpanAttribute]) -> Any:
+        return None
+
+    def end_span(
+        self,
+        span: Any,
+        attributes: Mapping[str, SpanAttribute],
+        error: BaseException | None,
+    ) -> None:
+        return None
+
+
+NOOP_TRACER = NoOpTracer()
+
+
+def tracing_enabled(tracer: Tracer | None) -> bool:
+    """The zero-cost check: two identity comparisons, no span objects."""
+    return tracer is not None and tracer is not NOOP_TRACER
+
+
+class SpanScope:
+    """Attributes to attach when the open span ends."""
+
+    __slots__ = ("attributes",)
+
+    def __init__(self) -> None:
+        self.attributes: dict[str, SpanAttribute] = {}
+
+    def set(self, key: str, value: SpanAttribute) -> None:
+        self.attributes[key] = value
+
+
+class _DisabledScope(SpanScope):
+    __slots__ = ()
+
+    def set(self, key: str, value: SpanAttribute) -> None:
+        return None
+
+
+_DISABLED = nullcontext(_DisabledScope())
+
+
+def traced(tracer: Tracer | None, name: str, **attributes: SpanAttribute) -> AbstractContextManager[SpanScope]:
+    """Open span name around a block; a shared no-op context when tracing is disabled."""
+    if not tracing_enabled(tracer):
+        return _DISABLED
+    return _span(tracer, name, attributes)  # type: ignore[arg-type]
+
+
+@contextmanager
+def _span(tracer: Tracer, name: str, attributes: Mapping[str, SpanAttribute]) -> Iterator[SpanScope]:
+    scope = SpanScope()
+    try:
+        handle = tracer.start_span(name, attributes)
+    except Exception:
+        yield scope
+        return
+    try:
+        yield scope
+    except BaseException as error:
+        _end(tracer, handle, scope, error)
+        raise
+    _end(tracer, handle, scope, None)
+
+
+def _end(tracer: Tracer, handle: Any, scope: SpanScope, error: BaseException | None) -> None:
+    try:
+        tracer.end_span(handle, scope.attributes, error)
+    except Exception:
+        pass
+
+
+class PhaseSpans:
+    """
+    Consecutive child spans for the phases of one long function.
+
+    enter() ends the current phase and opens the next one, so phase
+    boundaries can be marked without restructuring the function; close()
+    ends the last phase, with the exception that ended the function, if any.
+    """
+
+    def __init__(self, tracer: Tracer | None, prefix: str) -> None:
+        self._tracer = tracer
+        self._prefix = prefix
+        self._current: AbstractContextManager[SpanScope] | None = None
+        self.scope: SpanScope = _DISABLED.enter_result
+
+    def enter(self, phase: str, **attributes: SpanAttribute) -> None:
+        if not tracing_enabled(self._tracer):
+            return
+        self.close()
+        self._current = traced(self._tracer, f"{self._prefix}.{phase}", **attributes)
+        self.scope = self._current.__enter__()
+
+    def close(self, error: BaseException | None = None) -> None:
+        current, self._current = self._current, None
+        if current is None:
+            return
+        if error is None:
+            current.__exit__(None, None, None)
+        else:
+            current.__exit__(type(error), error, error.__traceback__)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from typing import Any
 
 CONTRACT_VERSION = 3
@@ -210,6 +211,11 @@ def build_manifest() -> dict[str, Any]:
 
 
 def validate_component_verdict(verdict: dict[str, Any], *, expected_context_hash: str) -> dict[str, Any]:
+    return VERDICT_VALIDATOR.validate(verdict, expected_context_hash=expected_context_hash)
+
+
+def _validate_component_verdict_reference(verdict: dict[str, Any], *, expected_context_hash: str) -> dict[str, Any]:
+    """Uncompiled reference for CompiledVerdictValidator; kept for differential tests and benchmarks."""
     if not isinstance(verdict, dict):
         raise ValueError("component verdict must be dict")
     if set(verdict.keys()) != REQUIRED_VERDICT_FIELDS:
@@ -252,6 +258,118 @@ def validate_component_verdict(verdict: dict[str, Any], *, expected_context_hash
     return dict(verdict)
 
 
+_LOWER_SHA256 = re.compile(r"[0-9a-f]{64}\Z")
+
+
+class CompiledVerdictValidator:
+    """
+    validate_component_verdict() compiled for one verdict schema version.
+
+    Allowed reason ids and evidence families are frozensets built once per
+    component, and each field is checked once, in the reference order. Values
+    already in canonical form (exact supported strings, lowercase sha256 hex)
+    take a direct membership test; anything else goes through the reference
+    checks, so decisions and error messages match
+    _validate_component_verdict_reference() exactly.
+    """
+
+    __slots__ = ("schema_version", "_fields", "_decisions", "_forbidden", "_plans")
+
+    def __init__(self, schema_version: str) -> None:
+        self.schema_version = schema_version
+        self._fields = REQUIRED_VERDICT_FIELDS
+        self._decisions = frozenset(SUPPORTED_DECISIONS)
+        self._forbidden = FORBIDDEN_METADATA_AUTHORITY_KEYS
+        self._plans = {
+            component_id: (
+                frozenset(COMPONENT_REASON_IDS[component_id]),
+                frozenset(COMPONENT_EVIDENCE_FAMILIES[component_id]),
+            )
+            for component_id in SUPPORTED_COMPONENTS
+        }
+
+    def validate(self, verdict: dict[str, Any], *, expected_context_hash: str) -> dict[str, Any]:
+        if not isinstance(verdict, dict):
+            raise ValueError("component verdict must be dict")
+        if verdict.keys() != self._fields:
+            raise ValueError("component verdict fields must match required schema")
+        component_id = verdict["component_id"]
+        plan = self._plans.get(component_id) if type(component_id) is str else None
+        if plan is None:
+            plan = self._plans.get(_require_non_empty_str(component_id, field="component_id"))
+            if plan is None:
+                raise ValueError("unknown component_id")
+        allowed_reason_ids, allowed_evidence_families = plan
+        if verdict["contract_version"] != CONTRACT_VERSION:
+            raise ValueError("contract_version mismatch")
+        if verdict["schema_version"] != self.schema_version:
+            raise ValueError("schema_version mismatch")
+        if verdict["fail_closed"] is not True:
+            raise ValueError("component verdict fail_closed must be true")
+        context_hash = verdict["context_hash"]
+        if not (type(context_hash) is str and context_hash == expected_context_hash and _LOWER_SHA256.match(context_hash)):
+            if _require_hash(context_hash, field="context_hash") != _require_hash(expected_context_hash, field="expected_context_hash"):
+                raise ValueError("context_hash mismatch")
+        decision = verdict["decision"]
+        if type(decision) is not str or decision not in self._decisions:
+            if _require_non_empty_str(decision, field="decision") not in self._decisions:
+                raise ValueError("unsupported decision")
+        reason_ids = verdict["reason_ids"]
+        if not isinstance(reason_ids, list) or not reason_ids:
+            raise ValueError("reason_ids must be non-empty list")
+        for reason_id in reason_ids:
+            if type(reason_id) is not str or reason_id not in allowed_reason_ids:
+                if _require_non_empty_str(reason_id, field="reason_id") not in allowed_reason_ids:
+                    raise ValueError("unknown component reason_id")
+        evidence_hash = verdict["evidence_hash"]
+        if type(evidence_hash) is not str or not _LOWER_SHA256.match(evidence_hash):
+            _require_hash(evidence_hash, field="evidence_hash")
+        evidence_families = verdict["evidence_families"]
+        if not isinstance(evidence_families, list) or not evidence_families:
+            raise ValueError("evidence_families must be non-empty list")
+        if len(set(evidence_families)) != len(evidence_families):
+            raise ValueError("duplicated evidence family")
+        for evidence_family in evidence_families:
+            if type(evidence_family) is not str or evidence_family not in allowed_evidence_families:
+                if _require_non_empty_str(evidence_family, field="evidence_family") not in allowed_evidence_families:
+                    raise ValueError("unknown component evidence family")
+        metadata = verdict["metadata"]
+        if not isinstance(metadata, dict):
+            raise ValueError("metadata must be dict")
+        if _contains_forbidden_key(metadata, self._forbidden):
+            raise ValueError("component metadata contains forbidden authority field")
+        return dict(verdict)
+
+
+def _contains_forbidden_key(value: dict[str, Any] | list[Any], forbidden: frozenset[str]) -> bool:
+    if isinstance(value, dict):
+        if not forbidden.isdisjoint(value):
+            return True
+        items: Any = value.values()
+    else:
+        items = value
+    for item in items:
+        if isinstance(item, (dict, list)) and _contains_forbidden_key(item, forbidden):
+            return True
+    return False
+
+
+_COMPILED_VERDICT_VALIDATORS: dict[str, CompiledVerdictValidator] = {}
+
+
+def compile_verdict_validator(schema_version: str = VERDICT_SCHEMA_VERSION) -> CompiledVerdictValidator:
+    """The compiled validator for schema_version, built once per version."""
+    if schema_version != VERDICT_SCHEMA_VERSION:
+        raise ValueError("unsupported verdict schema_version")
+    validator = _COMPILED_VERDICT_VALIDATORS.get(schema_version)
+    if validator is None:
+        validator = _COMPILED_VERDICT_VALIDATORS.setdefault(schema_version, CompiledVerdictValidator(schema_version))
+    return validator
+
+
+VERDICT_VALIDATOR = compile_verdict_validator()
+
+
 def _classify(verdicts: list[dict[str, Any]]) -> tuple[str, list[str], dict[str, Any]]:
     decisions = [v["decision"] for v in verdicts]
     if "DENY" in decisions:
@@ -273,7 +391,7 @@ def build_receipt(*, request_id: str, context_hash: str, component_verdicts: lis
     seen: set[str] = set()
     checked: list[dict[str, Any]] = []
     for verdict in component_verdicts:
-        valid = validate_component_verdict(verdict, expected_context_hash=context_hash)
+        valid = VERDICT_VALIDATOR.validate(verdict, expected_context_hash=context_hash)
         component_id = valid["component_id"]
         if component_id in seen:
             raise ValueError("duplicated component verdict")
@@ -302,6 +420,90 @@ def build_receipt(*, request_id: str, context_hash: str, component_verdicts: lis
 
 
 def validate_receipt(receipt: dict[str, Any], *, expected_context_hash: str) -> dict[str, Any]:
+    """
+    Validate a v3.2 receipt and return the receipt build_receipt() would produce for it.
+
+    A receipt already in the form build_receipt() emits is checked in one
+    pass: each verdict is validated once in place and the receipt hash is
+    recomputed in one serialization, without rebuilding, sorting or
+    deep-comparing the receipt. Anything else is re-checked by rebuilding, so
+    accept/reject decisions and error messages are exactly those of
+    _validate_receipt_by_rebuild().
+    """
+    _validate_receipt_header(receipt)
+    checked = _validate_built_receipt(receipt, expected_context_hash)
+    if checked is None:
+        return _validate_receipt_by_rebuild(receipt, expected_context_hash=expected_context_hash)
+    return checked
+
+
+def _validate_receipt_header(receipt: Any) -> None:
+    if not isinstance(receipt, dict):
+        raise ValueError("receipt must be dict")
+    if set(receipt.keys()) != REQUIRED_RECEIPT_FIELDS:
+        raise ValueError("receipt fields must match required schema")
+    if receipt["schema_version"] != RECEIPT_SCHEMA_VERSION:
+        raise ValueError("receipt schema mismatch")
+    if receipt["contract_version"] != CONTRACT_VERSION:
+        raise ValueError("receipt contract mismatch")
+    if receipt["fail_closed"] is not True:
+        raise ValueError("receipt fail_closed must be true")
+
+
+def _validate_built_receipt(receipt: dict[str, Any], expected_context_hash: str) -> dict[str, Any] | None:
+    """The single-pass check; None when the receipt must be re-checked by rebuilding."""
+    request_id = receipt["request_id"]
+    context_hash = receipt["context_hash"]
+    verdicts = receipt["component_verdicts"]
+    if (
+        type(receipt["contract_version"]) is not int
+        or not isinstance(request_id, str)
+        or not request_id
+        or request_id != request_id.strip()
+        or type(verdicts) is not list
+        or len(verdicts) != len(SUPPORTED_COMPONENTS)
+    ):
+        return None
+    try:
+        if _require_hash(context_hash, field="context_hash") != _require_hash(
+            expected_context_hash, field="expected_context_hash"
+        ):
+            return None
+        checked = [VERDICT_VALIDATOR.validate(verdict, expected_context_hash=context_hash) for verdict in verdicts]
+    except Exception:
+        return None
+    # SUPPORTED_COMPONENTS is sorted: this also rules out duplicates, gaps and padded ids.
+    if any(verdict["component_id"] != component_id for verdict, component_id in zip(checked, SUPPORTED_COMPONENTS, strict=True)):
+        return None
+    final_outcome, dominant_reason_ids, handoff = _classify(checked)
+    if (
+        receipt["final_outcome"] != final_outcome
+        or receipt["dominant_reason_ids"] != dominant_reason_ids
+        or receipt["adamantineos_handoff"] != handoff
+    ):
+        return None
+    built = {
+        "schema_version": RECEIPT_SCHEMA_VERSION,
+        "contract_version": CONTRACT_VERSION,
+        "request_id": request_id,
+        "context_hash": context_hash,
+        "component_verdicts": verdicts,
+        "final_outcome": final_outcome,
+        "dominant_reason_ids": dominant_reason_ids,
+        "receipt_hash": "",
+        "adamantineos_handoff": handoff,
+        "fail_closed": True,
+    }
+    receipt_hash = canonical_sha256(built)
+    if receipt["receipt_hash"] != receipt_hash:
+        return None
+    built["component_verdicts"] = checked
+    built["receipt_hash"] = receipt_hash
+    return built
+
+
+def _validate_receipt_by_rebuild(receipt: dict[str, Any], *, expected_context_hash: str) -> dict[str, Any]:
+    """Reference validator: rebuild the receipt from its verdicts and compare."""
     if not isinstance(receipt, dict):
         raise ValueError("receipt must be dict")
     if set(receipt.keys()) != REQUIRED_RECEIPT_FIELDS:
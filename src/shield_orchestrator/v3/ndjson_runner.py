@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, TextIO
+
+from .canonical_json import to_canonical_json
+from .contracts.envelope import OrchestratorV3Request
+from .options import DEFAULT_OPTIONS, OrchestratorV3Options
+from .orchestrate import orchestrate
+
+INVALID_LINE_ERROR = "invalid_request_line"
+
+_LineResult = tuple[str, "str | None"]
+# Input lines: text, or raw bytes decoded as UTF-8 one line at a time.
+_Line = str | bytes
+
+
+@dataclass
+class RunSummary:
+    """Counters for one NDJSON run."""
+
+    requests: int = 0
+    invalid_lines: int = 0
+    outcomes: dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "invalid_lines": self.invalid_lines,
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "requests_per_second": round(self.requests_per_second, 3),
+        }
+
+
+def run(
+    lines: Iterable[str | bytes],
+    out: TextIO,
+    *,
+    workers: int = 1,
+    ordered: bool = True,
+    window: int | None = None,
+    options: OrchestratorV3Options = DEFAULT_OPTIONS,
+) -> RunSummary:
+    """
+    Stream OrchestratorV3Request JSON lines through orchestrate().
+
+    One NDJSON line is written per non-blank input line: the canonical JSON of
+    the OrchestratorV3Response, or {"error": "invalid_request_line", ...} for
+    a line that is not a JSON request object. Byte lines are decoded as UTF-8
+    one at a time, so a line that is not valid UTF-8 is an invalid line
+    rather than the end of the run. Memory stays constant: input is read
+    lazily and at most window requests are in flight.
+
+    - workers>1 evaluates requests on a thread pool.
+    - ordered=True writes responses in input order; ordered=False writes them
+      as they complete and adds the 1-based input "line" to every record.
+    """
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers <= 0:
+        raise ValueError("workers must be a positive integer")
+    window = window or workers * 4
+    summary = RunSummary()
+    started = time.perf_counter()
+    numbered = _numbered(lines)
+
+    def emit(result: _LineResult) -> None:
+        record, outcome = result
+        if outcome is None:
+            summary.invalid_lines += 1
+        else:
+            summary.requests += 1
+            summary.outcomes[outcome] = summary.outcomes.get(outcome, 0) + 1
+        out.write(record)
+        out.write("\n")
+
+    def respond(line_no: int, text: _Line) -> _LineResult:
+        return _respond_line(line_no, text, options, with_line=not ordered)
+
+    if workers == 1:
+        for line_no, text in numbered:
+            emit(respond(line_no, text))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="shield-ndjson") as pool:
+            drain = _drain_ordered if ordered else _drain_unordered
+            drain(pool, numbered, window, respond, emit)
+    out.flush()
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m shield_orchestrator.v3",
+        description="Run OrchestratorV3Request NDJSON through orchestrate() and write NDJSON responses.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="request NDJSON file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="response NDJSON file (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="concurrent requests (default: 1)")
+    parser.add_argument("--unordered", action="store_true", help="write responses as they complete")
+    parser.add_argument("--window", type=int, default=None, help="max requests in flight (default: 4 x workers)")
+    parser.add_argument("--no-summary", action="store_true", help="do not print the throughput summary")
+    args = parser.parse_args(argv)
+    if args.workers <= 0:
+        parser.error("--workers must be a positive integer")
+    if args.window is not None and args.window <= 0:
+        parser.error("--window must be a positive integer")
+
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        summary = run(
+            source,
+            sink,
+            workers=args.workers,
+            ordered=not args.unordered,
+            window=args.window,
+        )
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    if not args.no_summary:
+        print(json.dumps(summary.as_dict(), sort_keys=True), file=sys.stderr)
+    return 0
+
+
+def _numbered(lines: Iterable[_Line]) -> Iterator[tuple[int, _Line]]:
+    for line_no, text in enumerate(lines, start=1):
+        if text.strip():
+            yield line_no, text
+
+
+def _respond_line(
+    line_no: int,
+    text: _Line,
+    options: OrchestratorV3Options,
+    *,
+    with_line: bool,
+) -> _LineResult:
+    request = _parse_request(text)
+    if request is None:
+        return to_canonical_json({"error": INVALID_LINE_ERROR, "line": line_no}), None
+    response = orchestrate(request, options=options)
+    record = asdict(response)
+    if with_line:
+        record["line"] = line_no
+    return to_canonical_json(record), response.outcome
+
+
+def _parse_request(text: _Line) -> OrchestratorV3Request | None:
+    # UnicodeDecodeError is a ValueError; RecursionError covers deeply nested lines.
+    try:
+        data = json.loads(text.decode("utf-8") if isinstance(text, bytes) else text)
+    except (ValueError, RecursionError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    try:
+        return OrchestratorV3Request(**data)
+    except TypeError:
+        return None
+
+
+def _drain_ordered(
+    pool: ThreadPoolExecutor,
+    numbered: Iterator[tuple[int, _Line]],
+    window: int,
+    respond: Callable[[int, _Line], _LineResult],
+    emit: Callable[[_LineResult], None],
+) -> None:
+    in_flight: deque[Future[_LineResult]] = deque()
+    for line_no, text in numbered:
+        in_flight.append(pool.submit(respond, line_no, text))
+        if len(in_flight) >= window:
+            emit(in_flight.popleft().result())
+    while in_flight:
+        emit(in_flight.popleft().result())
+
+
+def _drain_unordered(
+    pool: ThreadPoolExecutor,
+    numbered: Iterator[tuple[int, _Line]],
+    window: int,
+    respond: Callable[[int, _Line], _LineResult],
+    emit: Callable[[_LineResult], None],
+) -> None:
+    in_flight: set[Future[_LineResult]] = set()
+    for line_no, text in numbered:
+        if len(in_flight) >= window:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                emit(future.result())
+        in_flight.add(pool.submit(respond, line_no, text))
+    for future in as_completed(in_flight):
+        emit(future.result())
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .work_budget import DEFAULT_WORK_BUDGET, V3WorkBudget
+
+if TYPE_CHECKING:
+    from shield_orchestrator.bridges.adaptive_core_sink import AdaptiveCoreSink
+    from shield_orchestrator.bridges.circuit_breaker import CircuitBreakers
+    from shield_orchestrator.bridges.engine_pool import EnginePools
+    from shield_orchestrator.bridges.engine_process_pool import EngineProcessPool
+    from shield_orchestrator.bridges.engine_registry import EngineImportRegistry
+    from shield_orchestrator.bridges.verdict_cache import VerdictCache
+    from shield_orchestrator.metrics import ShieldMetrics
+    from shield_orchestrator.tracing import Tracer
+
+    from .stage_timings import V3StageTimings
+
+
+@dataclass(frozen=True)
+class OrchestratorV3Options:
+    """
+    Caller-side execution options for Orchestrator v3.
+
+    Options only change how component bridges are scheduled. They never enter
+    hashed material, so receipts and context hashes are identical for every
+    combination of options, except that fast_deny replaces the verdicts of
+    components it skips and adaptive_core_sink replaces the sink trace entry.
+
+    - max_workers=1 keeps the strict sequential bridge order (default).
+    - max_workers>1 fans the five bridge calls out on a bounded thread pool
+      owned by the call.
+    - executor, when given, is a caller-owned pool used instead of a per-call
+      pool; it is never shut down by the orchestrator.
+    - engine_pools, when given, supplies warm per-bridge engine pools instead
+      of constructing a component engine on every call.
+    - engine_registry, when given, replaces the process-wide resolved-import
+      cache used to locate component engine packages.
+    - enforce_ttl_deadline=True bounds bridge evaluation by the request's
+      ttl_seconds; deadline_seconds overrides that bound explicitly.
+    - component_timeouts maps a component id to its own timeout in seconds.
+      A bridge that does not finish within its timeout or the deadline gets
+      an ERROR verdict noted component_deadline_exceeded instead of blocking.
+    - circuit_breakers, when given, supplies per-component circuit breakers
+      that short-circuit a failing engine to an ERROR verdict noted
+      component_circuit_open; timeouts count as failures.
+    - verdict_cache, when given, serves retried component evaluations of the
+      same input from a bounded cache of non-ERROR verdicts.
+    - process_pool, when given, runs the engines of the bridges it was built
+      for on warm engines in persistent worker processes.
+    - fast_deny=True stops evaluating components once one returns DENY; every
+      later component in the fixed bridge order gets a SKIPPED verdict noted
+      component_skipped_after_deny. The outcome is the same DENY.
+    - adaptive_core_sink, when given, takes Adaptive Core sink reports off the
+      request path onto a bounded background queue; the trace carries a fixed
+      placeholder sink entry instead of the computed one.
+    - payload_budget caps request.payload before it is copied or hashed; an
+      over-budget payload fails closed with INVALID_REQUEST.
+    - engine_response_budget caps each engine response; an over-budget
+      response yields an ERROR verdict noted
+      component_engine_response_over_budget. Both default to
+      DEFAULT_WORK_BUDGET; either may be None to disable it.
+    - on_stage_timings, when given, receives the monotonic per-stage
+      durations of every orchestration as a V3StageTimings, outside the
+      response; a failing callback is ignored.
+    - tracer, when given, receives spans for the orchestration, each bridge
+      call and receipt synthesis; None and NOOP_TRACER disable tracing.
+    - metrics, when given, counts every response by outcome, reason id and
+      component ERROR note, and observes bridge latencies.
+    """
+
+    max_workers: int = 1
+    executor: Executor | None = None
+    engine_pools: EnginePools | None = None
+    engine_registry: EngineImportRegistry | None = None
+    enforce_ttl_deadline: bool = False
+    deadline_seconds: float | None = None
+    component_timeouts: Mapping[str, float] | None = None
+    circuit_breakers: CircuitBreakers | None = None
+    verdict_cache: VerdictCache | None = None
+    process_pool: EngineProcessPool | None = None
+    fast_deny: bool = False
+    adaptive_core_sink: AdaptiveCoreSink | None = None
+    payload_budget: V3WorkBudget | None = DEFAULT_WORK_BUDGET
+    engine_response_budget: V3WorkBudget | None = DEFAULT_WORK_BUDGET
+    on_stage_timings: Callable[[V3StageTimings], None] | None = None
+    tracer: Tracer | None = None
+    metrics: ShieldMetrics | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.max_workers, bool) or not isinstance(self.max_workers, int):
+            raise ValueError("max_workers must be a positive integer")
+        if self.max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        if self.deadline_seconds is not None and not _positive_number(self.deadline_seconds):
+            raise ValueError("deadline_seconds must be a positive number")
+        for timeout in (self.component_timeouts or {}).values():
+            if not _positive_number(timeout):
+                raise ValueError("component_timeouts must map components to positive numbers")
+
+    @property
+    def bounds_bridges(self) -> bool:
+        """Whether bridge evaluation is bounded by a deadline or component timeout."""
+        return self.enforce_ttl_deadline or self.deadline_seconds is not None or bool(self.component_timeouts)
+
+
+def _positive_number(value: Any) -> bool:
+    return not isinstance(value, bool) and isinstance(value, (int, float)) and value > 0
+
+
+DEFAULT_OPTIONS = OrchestratorV3Options()
@@ -1,30 +1,65 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import asdict, replace
+from functools import partial
 from typing import Any
 
 from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
 from shield_orchestrator.bridges.adn_bridge import ADNBridge
 from shield_orchestrator.bridges.component_verdicts import (
     ComponentBridgeResult,
+    PreparedRequest,
     error_component_result,
-    receipt_context_hash,
-    receipt_request_id,
+    prepare_request,
+    skipped_component_result,
 )
 from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
 from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
 from shield_orchestrator.bridges.qwg_bridge import QWGBridge
 from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
 from shield_orchestrator.errors import TVAError
+from shield_orchestrator.metrics import ShieldMetrics
+from shield_orchestrator.tracing import SpanScope, Tracer, traced, tracing_enabled
 
 from .context_hash import compute_context_hash
 from .contracts.envelope import OrchestratorV3Request, OrchestratorV3Response, TraceEntry
 from .contracts.reason_ids import ReasonId
 from .contracts.v3_2_receipt import build_receipt
 from .contracts.version import CONTRACT_VERSION
+from .options import DEFAULT_OPTIONS, OrchestratorV3Options
+from .stage_timings import StageTimer, timed_stage
+from .work_budget import V3WorkBudgetError
+
+COMPONENT_BRIDGES = (
+    SentinelBridge,
+    DQSNBridge,
+    ADNBridge,
+    GuardianWalletBridge,
+    QWGBridge,
+)
+
+DEADLINE_EXCEEDED_NOTE = "component_deadline_exceeded"
+ORCHESTRATE_SPAN = "shield.v3.orchestrate"
+ORCHESTRATE_MANY_SPAN = "shield.v3.orchestrate_many"
+BRIDGE_SPAN = "shield.v3.bridge"
+RECEIPT_SPAN = "shield.v3.build_receipt"
+FAST_DENY_SKIPPED_NOTE = "component_skipped_after_deny"
+_BRIDGE_COMPONENTS = tuple(bridge.COMPONENT for bridge in COMPONENT_BRIDGES)
 
+# Placeholder result for a bridge call abandoned at its timeout or the deadline.
+_TIMED_OUT = object()
+# Placeholder result for a bridge call not made because fast_deny already saw a DENY.
+_SKIPPED = object()
 
-def orchestrate(request: OrchestratorV3Request) -> OrchestratorV3Response:
+
+def orchestrate(
+    request: OrchestratorV3Request,
+    *,
+    options: OrchestratorV3Options = DEFAULT_OPTIONS,
+) -> OrchestratorV3Response:
     """
     Orchestrator v3 public entrypoint.
 
@@ -38,153 +73,712 @@ def orchestrate(request: OrchestratorV3Request) -> OrchestratorV3Response:
     - missing component input or unavailable component package yields ERROR verdict,
       not an all-ALLOW stub
     - Adaptive Core remains a read-only sink and must not affect outcome
+    - options.max_workers / options.executor may run the bridge calls
+      concurrently; results are still consumed in the fixed order above, so
+      trace, verdicts and receipt are identical to the sequential path
+    - request_id / context_hash / component inputs are derived once into a
+      PreparedRequest shared by every bridge
+    - options may bound bridge evaluation by a deadline (ttl_seconds or an
+      explicit override) and per-component timeouts; a bridge that misses its
+      bound yields an ERROR verdict noted component_deadline_exceeded
+    - options.fast_deny stops calling bridges after the first DENY; later
+      components get SKIPPED verdicts and the outcome is unchanged
+    - options.adaptive_core_sink moves the Adaptive Core report to a
+      background queue; the trace then carries a fixed placeholder entry
+    - request.payload and every engine response are checked against the
+      options work budgets before being copied, normalized or hashed
+    - options.on_stage_timings receives per-stage durations out-of-band
+    - options.tracer receives spans for the call, each bridge's evaluate_v3
+      and build_receipt, carrying outcomes, reason ids and component ids
+    - options.metrics counts the response and observes bridge latencies
     """
+    timer = _stage_timer(options)
+    with traced(options.tracer, ORCHESTRATE_SPAN) as span:
+        response = _orchestrate_one(request, options, timer)
+        _record_response(span, response)
+    _report_observations(options, timer, response)
+    return response
+
+
+def _orchestrate_one(
+    request: OrchestratorV3Request,
+    options: OrchestratorV3Options,
+    timer: StageTimer | None,
+) -> OrchestratorV3Response:
+    started = time.monotonic()
     try:
+        prepared = _prepare_request(request, options, timer)
+        bridges = _new_bridges(options)
+        try:
+            results = _evaluate_bridges(
+                bridges,
+                prepared,
+                options,
+                deadline=_deadline(options, started, request.ttl_seconds),
+                timer=timer,
+            )
+            components = _normalize_components(bridges, results, prepared)
+        except Exception as e:
+            raise _component_failure(e) from e
+        return _complete_response(prepared, components, options, timer)
+    except TVAError as e:
+        return _fail_closed_response(request, e)
+    except Exception:
+        return _internal_error_response(request)
+
+
+def orchestrate_many(
+    requests: Iterable[OrchestratorV3Request],
+    *,
+    options: OrchestratorV3Options = DEFAULT_OPTIONS,
+) -> list[OrchestratorV3Response]:
+    """
+    Batch Orchestrator v3 entrypoint.
+
+    Each response is identical to orchestrate(request) for the same request,
+    and responses are returned in input order. Per-call setup is amortized
+    over the batch: bridges are constructed once, each component engine is
+    imported and constructed once and, where it supports evaluate_many(),
+    called once for the whole batch. request_id / context_hash are derived
+    once per request.
+
+    Failures are isolated: each request fails closed to its own DENY response
+    without affecting the other requests in the batch.
+
+    With a deadline configured, the whole batch shares one deadline, derived
+    from the shortest ttl_seconds in the batch unless overridden. With
+    fast_deny, a request denied by one bridge is not passed to later bridges.
+    With on_stage_timings, each bridge stage is timed once for the whole
+    batch and reported with that duration for every request in it; with
+    metrics, each bridge latency is observed once per batch.
+    """
+    batch = list(requests)
+    with traced(options.tracer, ORCHESTRATE_MANY_SPAN, batch_size=len(batch)) as span:
+        responses = _orchestrate_batch(batch, options)
+        span.set("outcomes", tuple(response.outcome for response in responses))
+    return responses
+
+
+def _orchestrate_batch(
+    batch: list[OrchestratorV3Request],
+    options: OrchestratorV3Options,
+) -> list[OrchestratorV3Response]:
+    started = time.monotonic()
+    responses: list[OrchestratorV3Response | None] = [None] * len(batch)
+    timers = [_stage_timer(options) for _ in batch]
+    live: list[tuple[int, PreparedRequest]] = []
+    for index, request in enumerate(batch):
+        try:
+            prepared = _prepare_request(request, options, timers[index])
+        except TVAError as e:
+            responses[index] = _fail_closed_response(request, e)
+        except Exception:
+            responses[index] = _internal_error_response(request)
+        else:
+            live.append((index, prepared))
+
+    if live:
+        bridges = _new_bridges(options)
+        items = [prepared for _, prepared in live]
+        denied: list[int | None] | None = [None] * len(items) if options.fast_deny else None
+        batch_timer = _stage_timer(options)
+        per_bridge = _run_bridge_calls(
+            bridges,
+            _observed_bridge_calls(
+                bridges,
+                [
+                    partial(_evaluate_bridge_batch, bridge, items, denied, position)
+                    for position, bridge in enumerate(bridges)
+                ],
+                batch_timer,
+                options.tracer,
+            ),
+            options,
+            deadline=_deadline(options, started, min(item.request.ttl_seconds for item in items)),
+        )
+        per_bridge = [
+            [_deadline_exceeded(bridge, item) for item in items] if results is _TIMED_OUT else results
+            for bridge, results in zip(bridges, per_bridge, strict=True)
+        ]
+        for position, (index, prepared) in enumerate(live):
+            timer = timers[index]
+            if timer is not None and batch_timer is not None:
+                timer.durations.update(batch_timer.durations)
+            responses[index] = _respond_from_batch(
+                prepared,
+                bridges,
+                [results[position] for results in per_bridge],
+                options,
+                timer,
+            )
+        if options.metrics is not None and batch_timer is not None:
+            _record_bridge_latencies(options.metrics, batch_timer)
+    final = [response for response in responses if response is not None]
+    for timer, response in zip(timers, final, strict=True):
+        _report_observations(options, timer, response, bridges_recorded=True)
+    return final
+
+
+def _prepare_request(
+    request: OrchestratorV3Request,
+    options: OrchestratorV3Options,
+    timer: StageTimer | None = None,
+) -> PreparedRequest:
+    """Validate the request, check its payload budget and derive its receipt context once."""
+    with timed_stage(timer, "input_validation"):
         _validate_request(request)
+        if options.payload_budget is not None:
+            try:
+                options.payload_budget.check(request.payload)
+            except V3WorkBudgetError as e:
+                raise TVAError(ReasonId.INVALID_REQUEST.value, "payload exceeds work budget") from e
         try:
-            request_id = receipt_request_id(request)
-            context_hash = receipt_context_hash(request)
+            prepared = prepare_request(request)
         except TypeError as e:
             raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
         except ValueError as e:
             raise TVAError(ReasonId.INVALID_REQUEST.value, "invalid request context") from e
+    if timer is not None:
+        timer.request_id = prepared.request_id
+    return prepared
 
-        trace: list[TraceEntry] = [
-            TraceEntry(stage="input_validation", component="orchestrator", status="OK")
+
+def _stage_timer(options: OrchestratorV3Options) -> StageTimer | None:
+    if options.on_stage_timings is None and options.metrics is None:
+        return None
+    return StageTimer()
+
+
+def _report_observations(
+    options: OrchestratorV3Options,
+    timer: StageTimer | None,
+    response: OrchestratorV3Response,
+    *,
+    bridges_recorded: bool = False,
+) -> None:
+    """Hand the request's metrics and stage timings to the caller; they never reach the response."""
+    if options.metrics is not None:
+        options.metrics.record_v3_response(response)
+        if timer is not None and not bridges_recorded:
+            _record_bridge_latencies(options.metrics, timer)
+    if timer is None or options.on_stage_timings is None:
+        return
+    try:
+        options.on_stage_timings(timer.finish(response.outcome))
+    except Exception:
+        pass
+
+
+def _record_bridge_latencies(metrics: ShieldMetrics, timer: StageTimer) -> None:
+    durations = dict(timer.durations)
+    metrics.record_bridge_durations(
+        {component: durations[component] for component in _BRIDGE_COMPONENTS if component in durations}
+    )
+
+
+def _observed_bridge_calls(
+    bridges: tuple[Any, ...],
+    calls: list[Callable[[], Any]],
+    timer: StageTimer | None,
+    tracer: Tracer | None,
+) -> list[Callable[[], Any]]:
+    """Wrap each bridge call in its stage timing and bridge span, when requested."""
+    if tracing_enabled(tracer):
+        calls = [
+            _traced_bridge_call(tracer, bridge.COMPONENT, call)
+            for bridge, call in zip(bridges, calls, strict=True)
         ]
-        component_verdicts: list[dict[str, Any]] = []
+    if timer is not None:
+        calls = [timer.timed(bridge.COMPONENT, call) for bridge, call in zip(bridges, calls, strict=True)]
+    return calls
 
+
+def _traced_bridge_call(tracer: Tracer | None, component: str, call: Callable[[], Any]) -> Callable[[], Any]:
+    def run() -> Any:
+        with traced(tracer, BRIDGE_SPAN, component_id=component) as span:
+            result = call()
+            _record_bridge_result(span, result)
+            return result
+
+    return run
+
+
+def _record_bridge_result(span: SpanScope, result: Any) -> None:
+    """Span attributes for a bridge result: its verdict decision and reason ids, never its evidence."""
+    if isinstance(result, ComponentBridgeResult):
+        span.set("decision", str(result.verdict.get("decision")))
+        span.set("reason_ids", tuple(result.trace.reason_ids))
+        if result.trace.notes is not None:
+            span.set("note", result.trace.notes)
+    elif isinstance(result, list):
+        span.set("batch_size", len(result))
+
+
+def _record_response(span: SpanScope, response: OrchestratorV3Response) -> None:
+    span.set("outcome", response.outcome)
+    span.set("reason_ids", tuple(response.reason_ids))
+
+
+def _new_bridges(options: OrchestratorV3Options) -> tuple[Any, ...]:
+    pools = options.engine_pools
+    breakers = options.circuit_breakers
+    process_pool = options.process_pool
+    return tuple(
+        bridge_type(
+            engine_pool=None if pools is None else pools.get(bridge_type.COMPONENT),
+            engine_registry=options.engine_registry,
+            circuit_breaker=None if breakers is None else breakers.get(bridge_type.COMPONENT),
+            verdict_cache=options.verdict_cache,
+            response_budget=options.engine_response_budget,
+            process_pool=(
+                process_pool
+                if process_pool is not None and bridge_type.COMPONENT in process_pool.components
+                else None
+            ),
+        )
+        for bridge_type in COMPONENT_BRIDGES
+    )
+
+
+def _evaluate_bridge_batch(
+    bridge: Any,
+    items: list[PreparedRequest],
+    denied: list[int | None] | None = None,
+    position: int = 0,
+) -> list[Any]:
+    """
+    Per-item bridge results for a batch; a failing bridge fails every item, not the batch.
+
+    With denied (fast_deny), denied[index] is the position of a bridge that
+    denied item index. Items already denied by an earlier bridge are not
+    evaluated and yield _SKIPPED; items this bridge denies are recorded for
+    the bridges after it.
+    """
+    positions = [index for index in range(len(items)) if not _denied_before(denied, index, position)]
+    try:
+        evaluated = list(bridge.evaluate_v3_many([items[index] for index in positions])) if positions else []
+    except Exception as e:
+        return [e] * len(items)
+    if len(evaluated) != len(positions):
+        return [ValueError("component bridge batch result count mismatch")] * len(items)
+    results: list[Any] = [_SKIPPED] * len(items)
+    for index, result in zip(positions, evaluated, strict=True):
+        results[index] = result
+        if denied is not None and _is_deny(result):
+            current = denied[index]
+            denied[index] = position if current is None else min(current, position)
+    return results
+
+
+def _denied_before(denied: list[int | None] | None, index: int, position: int) -> bool:
+    earliest = None if denied is None else denied[index]
+    return earliest is not None and earliest < position
+
+
+def _respond_from_batch(
+    prepared: PreparedRequest,
+    bridges: tuple[Any, ...],
+    results: list[Any],
+    options: OrchestratorV3Options,
+    timer: StageTimer | None = None,
+) -> OrchestratorV3Response:
+    try:
         try:
-            for bridge in (
-                SentinelBridge(),
-                DQSNBridge(),
-                ADNBridge(),
-                GuardianWalletBridge(),
-                QWGBridge(),
-            ):
-                result = bridge.evaluate_v3(request)
-                normalized = _normalize_bridge_result(
-                    result,
-                    bridge_component=str(getattr(bridge, "COMPONENT", "unknown")),
-                    request_id=request_id,
-                    context_hash=context_hash,
-                )
-                trace.append(normalized.trace)
-                component_verdicts.append(normalized.verdict)
-        except TypeError as e:
-            raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
+            if options.fast_deny:
+                results = _skip_after_deny(bridges, results, prepared)
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            components = _normalize_components(bridges, results, prepared)
         except Exception as e:
-            raise TVAError(ReasonId.COMPONENT_ERROR.value, "component error") from e
-
+            raise _component_failure(e) from e
+        return _complete_response(prepared, components, options, timer)
+    except TVAError as e:
+        return _fail_closed_response(prepared.request, e)
+    except Exception:
+        return _internal_error_response(prepared.request)
+
+
+def _component_failure(error: Exception) -> TVAError:
+    """Map a bridge-stage exception to its deterministic fail-closed TVAError."""
+    if isinstance(error, TypeError):
+        return TVAError(ReasonId.HASHING_FAILED.value, "hashing failed")
+    return TVAError(ReasonId.COMPONENT_ERROR.value, "component error")
+
+
+def _normalize_components(
+    bridges: tuple[Any, ...],
+    results: list[Any],
+    prepared: PreparedRequest,
+) -> list[ComponentBridgeResult]:
+    return [
+        _normalize_bridge_result(
+            result,
+            bridge_component=str(getattr(bridge, "COMPONENT", "unknown")),
+            request_id=prepared.request_id,
+            context_hash=prepared.context_hash,
+        )
+        for bridge, result in zip(bridges, results, strict=True)
+    ]
+
+
+def _complete_response(
+    prepared: PreparedRequest,
+    components: list[ComponentBridgeResult],
+    options: OrchestratorV3Options,
+    timer: StageTimer | None = None,
+) -> OrchestratorV3Response:
+    """Synthesize the receipt, report to the sink and build the final response."""
+    request = prepared.request
+    request_id = prepared.request_id
+    context_hash = prepared.context_hash
+    trace: list[TraceEntry] = [
+        TraceEntry(stage="input_validation", component="orchestrator", status="OK")
+    ]
+    trace.extend(component.trace for component in components)
+
+    with timed_stage(timer, "receipt_synthesis"), traced(options.tracer, RECEIPT_SPAN) as span:
         receipt = build_receipt(
             request_id=request_id,
             context_hash=context_hash,
-            component_verdicts=component_verdicts,
+            component_verdicts=[component.verdict for component in components],
         )
         outcome, reason_ids = _response_from_receipt(receipt)
-
-        trace.append(
-            TraceEntry(
-                stage="receipt_synthesis",
-                component="shield_orchestrator",
-                status="OK" if outcome != "DENY" else "DENY",
-                reason_ids=reason_ids,
-                component_context_hash=str(receipt["receipt_hash"]),
-                notes="v3_2_receipt_built_from_component_verdicts",
-            )
+        span.set("outcome", outcome)
+        span.set("reason_ids", reason_ids)
+
+    trace.append(
+        TraceEntry(
+            stage="receipt_synthesis",
+            component="shield_orchestrator",
+            status="OK" if outcome != "DENY" else "DENY",
+            reason_ids=reason_ids,
+            component_context_hash=str(receipt["receipt_hash"]),
+            notes="v3_2_receipt_built_from_component_verdicts",
         )
+    )
 
-        # Adaptive Core sink (must not influence outcome)
-        try:
-            sink_entry = AdaptiveCoreBridge().report_v3(
+    # Adaptive Core sink (must not influence outcome)
+    try:
+        with timed_stage(timer, "adaptive_core"):
+            sink_entry = (options.adaptive_core_sink or AdaptiveCoreBridge()).report_v3(
                 request, outcome=outcome, reason_ids=reason_ids
             )
-        except Exception:
-            sink_entry = TraceEntry(
-                stage="adaptive_core",
-                component="adaptive_core",
-                status="ERROR",
-                reason_ids=(ReasonId.COMPONENT_ERROR.value,),
-                notes="phase3_sink_failed",
-            )
+    except Exception:
+        sink_entry = TraceEntry(
+            stage="adaptive_core",
+            component="adaptive_core",
+            status="ERROR",
+            reason_ids=(ReasonId.COMPONENT_ERROR.value,),
+            notes="phase3_sink_failed",
+        )
 
-        full_trace = tuple(trace + [sink_entry])
+    full_trace = tuple(trace + [sink_entry])
 
-        try:
-            compute_context_hash(
-                {
-                    "receipt_hash": receipt["receipt_hash"],
-                    "outcome": outcome,
-                    "reason_ids": list(reason_ids),
-                    "trace": [asdict(t) for t in full_trace],
-                }
-            )
-        except TypeError as e:
-            raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
-
-        return OrchestratorV3Response(
-            contract_version=CONTRACT_VERSION,
-            outcome=outcome,
-            context_hash=context_hash,
-            reason_ids=reason_ids,
-            trace=full_trace,
-            receipt=receipt,
+    try:
+        compute_context_hash(
+            {
+                "receipt_hash": receipt["receipt_hash"],
+                "outcome": outcome,
+                "reason_ids": list(reason_ids),
+                "trace": [asdict(t) for t in full_trace],
+            }
         )
+    except TypeError as e:
+        raise TVAError(ReasonId.HASHING_FAILED.value, "hashing failed") from e
+
+    return OrchestratorV3Response(
+        contract_version=CONTRACT_VERSION,
+        outcome=outcome,
+        context_hash=context_hash,
+        reason_ids=reason_ids,
+        trace=full_trace,
+        receipt=receipt,
+    )
+
+
+def _fail_closed_response(request: OrchestratorV3Request, e: TVAError) -> OrchestratorV3Response:
+    # Build a deterministic DENY response without ever re-hashing the payload.
+    trace = (
+        TraceEntry(
+            stage="fail_closed",
+            component="orchestrator",
+            status="DENY",
+            reason_ids=(e.reason_id,),
+            notes="tva_error",
+        ),
+    )
+
+    # Always omit payload in failure hashing to avoid recursive serialization errors.
+    hash_material = {
+        "request": _request_for_hash(request),
+        "outcome": "DENY",
+        "reason_ids": [e.reason_id],
+        "trace": [asdict(t) for t in trace],
+    }
+    context_hash = compute_context_hash(hash_material)
+
+    return OrchestratorV3Response(
+        contract_version=CONTRACT_VERSION,
+        outcome="DENY",
+        context_hash=context_hash,
+        reason_ids=(e.reason_id,),
+        trace=trace,
+    )
+
+
+def _internal_error_response(request: OrchestratorV3Request) -> OrchestratorV3Response:
+    trace = (
+        TraceEntry(
+            stage="internal_error",
+            component="orchestrator",
+            status="DENY",
+            reason_ids=(ReasonId.INTERNAL_ERROR.value,),
+        ),
+    )
+
+    hash_material = {
+        "request": _request_for_hash(request),
+        "outcome": "DENY",
+        "reason_ids": [ReasonId.INTERNAL_ERROR.value],
+        "trace": [asdict(t) for t in trace],
+    }
+    context_hash = compute_context_hash(hash_material)
+
+    return OrchestratorV3Response(
+        contract_version=CONTRACT_VERSION,
+        outcome="DENY",
+        context_hash=context_hash,
+        reason_ids=(ReasonId.INTERNAL_ERROR.value,),
+        trace=trace,
+    )
+
+
+def _evaluate_bridges(
+    bridges: tuple[Any, ...],
+    prepared: PreparedRequest,
+    options: OrchestratorV3Options,
+    *,
+    deadline: float | None = None,
+    timer: StageTimer | None = None,
+) -> list[Any]:
+    """Run evaluate_v3 on every bridge and return results in bridge order."""
+    results = _run_bridge_calls(
+        bridges,
+        _observed_bridge_calls(
+            bridges,
+            [partial(bridge.evaluate_v3, prepared) for bridge in bridges],
+            timer,
+            options.tracer,
+        ),
+        options,
+        deadline=deadline,
+        stop=_is_deny if options.fast_deny else None,
+    )
+    if options.fast_deny:
+        results = _skip_after_deny(bridges, results, prepared)
+    return [
+        _deadline_exceeded(bridge, prepared) if result is _TIMED_OUT else result
+        for bridge, result in zip(bridges, results, strict=True)
+    ]
+
+
+def _is_deny(result: Any) -> bool:
+    return isinstance(result, ComponentBridgeResult) and result.verdict.get("decision") == "DENY"
+
+
+def _skip_after_deny(
+    bridges: tuple[Any, ...],
+    results: list[Any],
+    prepared: PreparedRequest,
+) -> list[Any]:
+    """
+    Replace every result after the first DENY, in bridge order, with a SKIPPED verdict.
 
-    except TVAError as e:
-        # Build a deterministic DENY response without ever re-hashing the payload.
-        trace = (
-            TraceEntry(
-                stage="fail_closed",
-                component="orchestrator",
-                status="DENY",
-                reason_ids=(e.reason_id,),
-                notes="tva_error",
-            ),
-        )
+    Concurrent modes may already have finished some of those calls; they are
+    discarded so the receipt does not depend on scheduling.
+    """
+    for position, result in enumerate(results):
+        if _is_deny(result):
+            return results[: position + 1] + [
+                skipped_component_result(
+                    component_id=bridge.COMPONENT,
+                    request_id=prepared.request_id,
+                    context_hash=prepared.context_hash,
+                    note=FAST_DENY_SKIPPED_NOTE,
+                )
+                for bridge in bridges[position + 1 :]
+            ]
+    return results
 
-        # Always omit payload in failure hashing to avoid recursive serialization errors.
-        hash_material = {
-            "request": _request_for_hash(request, include_payload=False),
-            "outcome": "DENY",
-            "reason_ids": [e.reason_id],
-            "trace": [asdict(t) for t in trace],
-        }
-        context_hash = compute_context_hash(hash_material)
-
-        return OrchestratorV3Response(
-            contract_version=CONTRACT_VERSION,
-            outcome="DENY",
-            context_hash=context_hash,
-            reason_ids=(e.reason_id,),
-            trace=trace,
-        )
 
-    except Exception:
-        trace = (
-            TraceEntry(
-                stage="internal_error",
-                component="orchestrator",
-                status="DENY",
-                reason_ids=(ReasonId.INTERNAL_ERROR.value,),
-            ),
-        )
+def _deadline(options: OrchestratorV3Options, started: float, ttl_seconds: int) -> float | None:
+    """Absolute time.monotonic() deadline for bridge evaluation, if any."""
+    if options.deadline_seconds is not None:
+        return started + options.deadline_seconds
+    if options.enforce_ttl_deadline:
+        return started + ttl_seconds
+    return None
 
-        hash_material = {
-            "request": _request_for_hash(request, include_payload=False),
-            "outcome": "DENY",
-            "reason_ids": [ReasonId.INTERNAL_ERROR.value],
-            "trace": [asdict(t) for t in trace],
-        }
-        context_hash = compute_context_hash(hash_material)
-
-        return OrchestratorV3Response(
-            contract_version=CONTRACT_VERSION,
-            outcome="DENY",
-            context_hash=context_hash,
-            reason_ids=(ReasonId.INTERNAL_ERROR.value,),
-            trace=trace,
+
+def _deadline_exceeded(bridge: Any, prepared: PreparedRequest) -> ComponentBridgeResult:
+    return error_component_result(
+        component_id=bridge.COMPONENT,
+        request_id=prepared.request_id,
+        context_hash=prepared.context_hash,
+        note=DEADLINE_EXCEEDED_NOTE,
+    )
+
+
+def _run_bridge_calls(
+    bridges: tuple[Any, ...],
+    calls: list[Callable[[], Any]],
+    options: OrchestratorV3Options,
+    *,
+    deadline: float | None,
+    stop: Callable[[Any], bool] | None = None,
+) -> list[Any]:
+    """
+    Run one call per bridge and return their results in bridge order.
+
+    Once stop(result) holds for a result, later calls are not made (or no
+    longer waited for) and yield _SKIPPED.
+    """
+    if not options.bounds_bridges:
+        return _run_in_order(calls, options, stop)
+    timeouts = options.component_timeouts or {}
+    return _run_bounded(
+        calls,
+        [timeouts.get(bridge.COMPONENT) for bridge in bridges],
+        deadline,
+        options,
+        stop,
+        abandon=[bridge.abandon for bridge in bridges],
+    )
+
+
+def _run_bounded(
+    calls: list[Callable[[], Any]],
+    timeouts: list[float | None],
+    deadline: float | None,
+    options: OrchestratorV3Options,
+    stop: Callable[[Any], bool] | None = None,
+    *,
+    abandon: list[Callable[[], None]],
+) -> list[Any]:
+    """
+    Run calls like _run_in_order, but stop waiting for a call once its own
+    timeout or the shared deadline has passed; such calls yield _TIMED_OUT
+    and their abandon hook runs as soon as the bound passes, so the
+    bridge's breaker counts the timeout before the call can finish late.
+
+    Calls always run on worker threads so a hung engine cannot block the
+    caller. Sequential mode still runs one call at a time, each on a fresh
+    worker if an earlier call is stuck. Abandoned calls are left to finish in
+    the background: an owned pool is shut down without waiting for them.
+    """
+    sequential = options.executor is None and options.max_workers == 1
+    owned: ThreadPoolExecutor | None = None
+    executor: Executor
+    if options.executor is not None:
+        executor = options.executor
+    else:
+        executor = owned = ThreadPoolExecutor(
+            max_workers=len(calls) if sequential else min(options.max_workers, len(calls)),
+            thread_name_prefix="shield-bridge",
         )
+    futures: list[Future[Any]] = []
+    try:
+        if sequential:
+            results: list[Any] = []
+            for call, timeout, on_timeout in zip(calls, timeouts, abandon, strict=True):
+                if _stopped(results, stop):
+                    results.append(_SKIPPED)
+                    continue
+                limit = _limit(time.monotonic(), timeout, deadline)
+                if limit is not None and limit <= time.monotonic():
+                    on_timeout()
+                    results.append(_TIMED_OUT)
+                    continue
+                futures.append(executor.submit(call))
+                results.append(_result_by(futures[-1], limit, on_timeout))
+            return results
+        submitted = time.monotonic()
+        futures = [executor.submit(call) for call in calls]
+        results = []
+        for future, timeout, on_timeout in zip(futures, timeouts, abandon, strict=True):
+            stopped = _stopped(results, stop)
+            results.append(
+                _SKIPPED if stopped else _result_by(future, _limit(submitted, timeout, deadline), on_timeout)
+            )
+        return results
+    finally:
+        for future in futures:
+            future.cancel()
+        if owned is not None:
+            owned.shutdown(wait=False, cancel_futures=True)
+
+
+def _stopped(results: list[Any], stop: Callable[[Any], bool] | None) -> bool:
+    """Whether a stop condition was met by an earlier result; later calls are skipped."""
+    return stop is not None and bool(results) and (results[-1] is _SKIPPED or stop(results[-1]))
+
+
+def _limit(start: float, timeout: float | None, deadline: float | None) -> float | None:
+    limits = [limit for limit in (None if timeout is None else start + timeout, deadline) if limit is not None]
+    return min(limits) if limits else None
+
+
+def _result_by(future: Future[Any], limit: float | None, on_timeout: Callable[[], None]) -> Any:
+    try:
+        return future.result(timeout=None if limit is None else max(0.0, limit - time.monotonic()))
+    except TimeoutError:
+        if future.done():
+            raise
+        on_timeout()
+        future.cancel()
+        return _TIMED_OUT
+
+
+def _run_in_order(
+    calls: list[Callable[[], Any]],
+    options: OrchestratorV3Options,
+    stop: Callable[[Any], bool] | None = None,
+) -> list[Any]:
+    """
+    Run calls sequentially or on a pool and return their results in call order.
+
+    Concurrent modes wait on futures in call order, so the first exception
+    surfaced is the one the sequential path would have raised.
+    """
+    if options.executor is not None:
+        return _collect_in_order(options.executor, calls, stop)
+    if options.max_workers == 1:
+        results: list[Any] = []
+        for call in calls:
+            results.append(_SKIPPED if _stopped(results, stop) else call())
+        return results
+    with ThreadPoolExecutor(
+        max_workers=min(options.max_workers, len(calls)),
+        thread_name_prefix="shield-bridge",
+    ) as pool:
+        return _collect_in_order(pool, calls, stop)
+
+
+def _collect_in_order(
+    executor: Executor,
+    calls: list[Callable[[], Any]],
+    stop: Callable[[Any], bool] | None = None,
+) -> list[Any]:
+    futures = [executor.submit(call) for call in calls]
+    try:
+        results: list[Any] = []
+        for future in futures:
+            results.append(_SKIPPED if _stopped(results, stop) else future.result())
+        return results
+    finally:
+        for future in futures:
+            future.cancel()
 
 
 def _normalize_bridge_result(
@@ -220,19 +814,15 @@ def _response_from_receipt(receipt: dict[str, Any]) -> tuple[str, tuple[str, ...
     return "DENY", reason_ids
 
 
-def _request_for_hash(request: OrchestratorV3Request, *, include_payload: bool) -> dict[str, Any]:
+def _request_for_hash(request: OrchestratorV3Request) -> dict[str, Any]:
     """
-    Deterministic request material for hashing.
+    Deterministic request material for hashing fail-closed responses.
 
-    include_payload=True is the normal path.
-    include_payload=False is used for fail-closed responses to avoid
-    non-serializable payload causing recursive hashing failures.
+    The payload is replaced by None to avoid a non-serializable payload
+    causing recursive hashing failures. It is never traversed, so an
+    over-budget or cyclic payload is not copied either.
     """
-    d = asdict(request)
-    if not include_payload:
-        d = dict(d)
-        d["payload"] = None
-    return d
+    return {**asdict(replace(request, payload={})), "payload": None}
 
 
 def _validate_request(request: OrchestratorV3Request) -> None:
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from shield_orchestrator.bridges.component_verdicts import ComponentBridgeResult, PreparedRequest
+from shield_orchestrator.errors import TVAError
+from shield_orchestrator.tracing import Tracer, traced, tracing_enabled
+
+from .contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from .options import DEFAULT_OPTIONS, OrchestratorV3Options
+from .orchestrate import (
+    _TIMED_OUT,
+    BRIDGE_SPAN,
+    ORCHESTRATE_SPAN,
+    _complete_response,
+    _component_failure,
+    _deadline,
+    _deadline_exceeded,
+    _fail_closed_response,
+    _internal_error_response,
+    _limit,
+    _new_bridges,
+    _normalize_components,
+    _observed_bridge_calls,
+    _prepare_request,
+    _record_bridge_result,
+    _record_response,
+    _report_observations,
+    _skip_after_deny,
+    _stage_timer,
+)
+from .stage_timings import StageTimer, timed_stage
+
+
+async def orchestrate_async(
+    request: OrchestratorV3Request,
+    *,
+    options: OrchestratorV3Options = DEFAULT_OPTIONS,
+) -> OrchestratorV3Response:
+    """
+    Native asyncio Orchestrator v3 entrypoint.
+
+    Same contract as orchestrate(): validation, receipt synthesis, sink and
+    fail-closed mapping are shared with the synchronous path, so responses are
+    identical. Component bridges are awaited concurrently:
+    - bridges implementing evaluate_v3_async() are awaited directly
+    - sync-only bridges run evaluate_v3() on options.executor, or the event
+      loop's default executor when none is given
+    Results are consumed in the fixed bridge order. Deadline and
+    per-component timeouts from options apply as in orchestrate(). With
+    fast_deny, bridges are still awaited concurrently, but everything after
+    the first DENY is reported SKIPPED exactly as in orchestrate(). Stage
+    timings, when requested, include bridges that ran but were then reported
+    SKIPPED.
+    """
+    timer = _stage_timer(options)
+    with traced(options.tracer, ORCHESTRATE_SPAN) as span:
+        response = await _orchestrate_one_async(request, options, timer)
+        _record_response(span, response)
+    _report_observations(options, timer, response)
+    return response
+
+
+async def _orchestrate_one_async(
+    request: OrchestratorV3Request,
+    options: OrchestratorV3Options,
+    timer: StageTimer | None,
+) -> OrchestratorV3Response:
+    started = time.monotonic()
+    try:
+        prepared = _prepare_request(request, options, timer)
+        bridges = _new_bridges(options)
+        try:
+            results = await _evaluate_bridges_async(
+                bridges,
+                prepared,
+                options,
+                deadline=_deadline(options, started, request.ttl_seconds),
+                timer=timer,
+            )
+            components = _normalize_components(bridges, results, prepared)
+        except Exception as e:
+            raise _component_failure(e) from e
+        return _complete_response(prepared, components, options, timer)
+    except TVAError as e:
+        return _fail_closed_response(request, e)
+    except Exception:
+        return _internal_error_response(request)
+
+
+async def _evaluate_bridges_async(
+    bridges: tuple[Any, ...],
+    prepared: PreparedRequest,
+    options: OrchestratorV3Options,
+    *,
+    deadline: float | None = None,
+    timer: StageTimer | None = None,
+) -> list[Any]:
+    loop = asyncio.get_running_loop()
+    awaitables = [_bridge_awaitable(bridge, prepared, options, loop, timer, options.tracer) for bridge in bridges]
+    if options.bounds_bridges:
+        started = time.monotonic()
+        timeouts = options.component_timeouts or {}
+        awaitables = [
+            _bounded(awaitable, _limit(started, timeouts.get(bridge.COMPONENT), deadline), bridge.abandon)
+            for bridge, awaitable in zip(bridges, awaitables, strict=True)
+        ]
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    if options.fast_deny:
+        results = _skip_after_deny(bridges, results, prepared)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return [
+        _deadline_exceeded(bridge, prepared) if result is _TIMED_OUT else result
+        for bridge, result in zip(bridges, results, strict=True)
+    ]
+
+
+def _bridge_awaitable(
+    bridge: Any,
+    prepared: PreparedRequest,
+    options: OrchestratorV3Options,
+    loop: asyncio.AbstractEventLoop,
+    timer: StageTimer | None = None,
+    tracer: Tracer | None = None,
+) -> Awaitable[ComponentBridgeResult]:
+    # Dispatch on the attribute itself: isinstance() against the runtime
+    # AsyncComponentBridge protocol caches per class and goes stale if a
+    # bridge class gains or loses evaluate_v3_async at runtime.
+    evaluate_async: Callable[[PreparedRequest], Awaitable[ComponentBridgeResult]] | None = getattr(
+        bridge, "evaluate_v3_async", None
+    )
+    if callable(evaluate_async):
+        if timer is None and not tracing_enabled(tracer):
+            return evaluate_async(prepared)
+        return _observed(evaluate_async(prepared), bridge.COMPONENT, timer, tracer)
+    [call] = _observed_bridge_calls((bridge,), [partial(bridge.evaluate_v3, prepared)], timer, tracer)
+    return loop.run_in_executor(options.executor, call)
+
+
+async def _observed(
+    awaitable: Awaitable[ComponentBridgeResult],
+    component: str,
+    timer: StageTimer | None,
+    tracer: Tracer | None,
+) -> ComponentBridgeResult:
+    with timed_stage(timer, component), traced(tracer, BRIDGE_SPAN, component_id=component) as span:
+        result = await awaitable
+        _record_bridge_result(span, result)
+        return result
+
+
+async def _bounded(awaitable: Awaitable[Any], limit: float | None, abandon: Callable[[], None]) -> Any:
+    """Await a bridge call until limit; on expiry abandon and cancel it and yield _TIMED_OUT."""
+    task = asyncio.ensure_future(awaitable)
+    timeout = None if limit is None else max(0.0, limit - time.monotonic())
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if not done:
+        abandon()
+        task.cancel()
+        return _TIMED_OUT
+    return task.result()
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .contracts.v3_2_receipt import validate_receipt
+
+CHECKPOINT_SCHEMA_VERSION = "shield.v3.receipt_archive_checkpoint.v1"
+INVALID_LINE_REASON = "invalid_receipt_line"
+ARCHIVE_SUFFIX = ".jsonl"
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 1.0
+_PREFIX_READ_BYTES = 1 << 20
+
+# One chunk's outcome: passed, failed, and the first failure as (line, reason).
+_ChunkOutcome = tuple[int, int, "tuple[int, str] | None"]
+_CHECKPOINT_ONLY_FIELDS = ("size", "mtime_ns", "offset", "line", "prefix_sha256")
+
+
+@dataclass
+class ArchiveFileResult:
+    """Validation counters for one archive file; also its checkpoint entry."""
+
+    path: str
+    size: int = 0
+    mtime_ns: int = 0
+    receipts: int = 0
+    passed: int = 0
+    failed: int = 0
+    first_failure: dict[str, Any] | None = None
+    complete: bool = False
+    # Resume point: byte offset and line number after the last validated chunk,
+    # and the SHA-256 of the bytes before that offset.
+    offset: int = 0
+    line: int = 0
+    prefix_sha256: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ArchiveReport:
+    """Per-file results of one bulk validation run, in archive order."""
+
+    files: list[ArchiveFileResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def receipts(self) -> int:
+        return sum(result.receipts for result in self.files)
+
+    @property
+    def failed(self) -> int:
+        return sum(result.failed for result in self.files)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "files": [
+                {key: value for key, value in result.as_dict().items() if key not in _CHECKPOINT_ONLY_FIELDS}
+                for result in self.files
+            ],
+            "receipts": self.receipts,
+            "passed": self.receipts - self.failed,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+        }
+
+
+def validate_archive(
+    paths: Iterable[str | os.PathLike[str]],
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    window: int | None = None,
+    checkpoint: str | os.PathLike[str] | None = None,
+    checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+) -> ArchiveReport:
+    """
+    Re-validate archived v3.2 receipts with validate_receipt().
+
+    paths are JSONL files or directories, searched recursively for *.jsonl
+    files in sorted order. Each non-blank line is either
+    {"receipt": {...}, "expected_context_hash": "..."} or a bare receipt,
+    which is checked against its own context_hash. A line that is not a JSON
+    object fails with invalid_receipt_line; any other failure is reported
+    with its validation error.
+
+    Memory stays constant: files are streamed line by line and at most window
+    chunks of chunk_size lines are in flight. workers>1 validates chunks on
+    a process pool; chunks are still accounted in file order.
+
+    With checkpoint, per-file progress is saved atomically at most every
+    checkpoint_interval seconds and whenever a file completes. A rerun with
+    the same checkpoint skips completed files and resumes partial ones after
+    their last validated chunk. A file is validated again from the start
+    when its size or mtime changed, or when the bytes already validated no
+    longer hash to the checkpointed prefix_sha256; checking that rereads,
+    but does not revalidate, the validated prefix.
+    """
+    for name, value in (("workers", workers), ("chunk_size", chunk_size), ("window", window)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value <= 0):
+            raise ValueError(f"{name} must be a positive integer")
+    window = window or workers * 4
+    started = time.perf_counter()
+    saved = _load_checkpoint(checkpoint)
+    report = ArchiveReport(files=[_resume(path, saved.get(str(path))) for path in _archive_files(paths)])
+    saver = _CheckpointSaver(checkpoint, report, checkpoint_interval)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    with pool or nullcontext():
+        in_flight: deque[tuple[ArchiveFileResult, Future[_ChunkOutcome] | None, int, int, str]] = deque()
+        for result, chunk, offset, line, prefix_sha256 in _pending_chunks(report.files, chunk_size):
+            in_flight.append((result, _submit(pool, chunk), offset, line, prefix_sha256))
+            if len(in_flight) >= window:
+                _account(*in_flight.popleft(), saver)
+        while in_flight:
+            _account(*in_flight.popleft(), saver)
+    saver.save()
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="validate_v3_receipt_archive",
+        description="Re-validate archived v3.2 receipts from JSONL files or directories.",
+    )
+    parser.add_argument("paths", nargs="+", help="receipt JSONL files or directories of *.jsonl files")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="validation processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per task")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file to resume from and update")
+    args = parser.parse_args(argv)
+    if args.workers <= 0:
+        parser.error("--workers must be a positive integer")
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be a positive integer")
+    report = validate_archive(
+        args.paths,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        checkpoint=args.checkpoint,
+    )
+    print(json.dumps(report.as_dict(), sort_keys=True))
+    return 0 if report.failed == 0 else 1
+
+
+def _archive_files(paths: Iterable[str | os.PathLike[str]]) -> Iterator[Path]:
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(candidate for candidate in path.rglob(f"*{ARCHIVE_SUFFIX}") if candidate.is_file())
+        else:
+            yield path
+
+
+def _resume(path: Path, saved: dict[str, Any] | None) -> ArchiveFileResult:
+    stat = path.stat()
+    if saved is None or (saved.get("size"), saved.get("mtime_ns")) != (stat.st_size, stat.st_mtime_ns):
+        return ArchiveFileResult(path=str(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    return ArchiveFileResult(**saved)
+
+
+def _pending_chunks(
+    results: list[ArchiveFileResult],
+    chunk_size: int,
+) -> Iterator[tuple[ArchiveFileResult, list[tuple[int, bytes]] | None, int, int, str]]:
+    """
+    Chunks of numbered non-blank lines left to validate, each with the offset,
+    line number and prefix SHA-256 after it; a None chunk marks the end of a
+    file.
+
+    A checkpointed result whose validated prefix no longer matches its
+    prefix_sha256 is replaced in results by a fresh one, so the file is
+    validated from the start.
+    """
+    for index, result in enumerate(results):
+        with open(result.path, "rb") as handle:
+            digest = hashlib.sha256()
+            _read_prefix(handle, result.offset, digest.update)
+            if result.offset and digest.hexdigest() != result.prefix_sha256:
+                result = results[index] = ArchiveFileResult(
+                    path=result.path, size=result.size, mtime_ns=result.mtime_ns
+                )
+                digest = hashlib.sha256()
+            if result.complete:
+                continue
+            offset, line = result.offset, result.line
+            chunk: list[tuple[int, bytes]] = []
+            handle.seek(offset)
+            for raw in handle:
+                offset += len(raw)
+                line += 1
+                digest.update(raw)
+                if raw.strip():
+                    chunk.append((line, raw))
+                if len(chunk) >= chunk_size:
+                    yield result, chunk, offset, line, digest.hexdigest()
+                    chunk = []
+        if chunk:
+            yield result, chunk, offset, line, digest.hexdigest()
+        yield result, None, offset, line, digest.hexdigest()
+
+
+def _read_prefix(handle: BinaryIO, size: int, update: Callable[[bytes], object]) -> None:
+    """Feed the first size bytes of handle to update(), in bounded blocks."""
+    while size > 0 and (block := handle.read(min(size, _PREFIX_READ_BYTES))):
+        update(block)
+        size -= len(block)
+
+
+def _submit(pool: Executor | None, chunk: list[tuple[int, bytes]] | None) -> Future[_ChunkOutcome] | None:
+    if chunk is None:
+        return None
+    if pool is not None:
+        return pool.submit(_validate_chunk, chunk)
+    future: Future[_ChunkOutcome] = Future()
+    future.set_result(_validate_chunk(chunk))
+    return future
+
+
+def _account(
+    result: ArchiveFileResult,
+    future: Future[_ChunkOutcome] | None,
+    offset: int,
+    line: int,
+    prefix_sha256: str,
+    saver: _CheckpointSaver,
+) -> None:
+    if future is None:
+        result.offset, result.line, result.prefix_sha256 = offset, line, prefix_sha256
+        result.complete = True
+        saver.save()
+        return
+    passed, failed, first_failure = future.result()
+    result.receipts += passed + failed
+    result.passed += passed
+    result.failed += failed
+    if first_failure is not None and result.first_failure is None:
+        result.first_failure = {"line": first_failure[0], "reason": first_failure[1]}
+    result.offset, result.line, result.prefix_sha256 = offset, line, prefix_sha256
+    saver.save_if_due()
+
+
+def _validate_chunk(chunk: list[tuple[int, bytes]]) -> _ChunkOutcome:
+    passed = failed = 0
+    first_failure: tuple[int, str] | None = None
+    for line, raw in chunk:
+        reason = _validate_line(raw)
+        if reason is None:
+            passed += 1
+            continue
+        failed += 1
+        if first_failure is None:
+            first_failure = (line, reason)
+    return passed, failed, first_failure
+
+
+def _validate_line(raw: bytes) -> str | None:
+    """None when the archived receipt validates; otherwise the failing reason."""
+    try:
+        record = json.loads(raw)
+    except (ValueError, RecursionError):
+        return INVALID_LINE_REASON
+    if not isinstance(record, dict):
+        return INVALID_LINE_REASON
+    if record.keys() == {"receipt", "expected_context_hash"}:
+        receipt, expected_context_hash = record["receipt"], record["expected_context_hash"]
+    else:
+        receipt, expected_context_hash = record, record.get("context_hash")
+    try:
+        validate_receipt(receipt, expected_context_hash=expected_context_hash)
+    except Exception as error:
+        return str(error) or type(error).__name__
+    return None
+
+
+def _load_checkpoint(checkpoint: str | os.PathLike[str] | None) -> dict[str, dict[str, Any]]:
+    if checkpoint is None or not os.path.exists(checkpoint):
+        return {}
+    with open(checkpoint, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict) or data.get("schema_version") != CHECKPOINT_SCHEMA_VERSION:
+        raise ValueError("checkpoint schema_version mismatch")
+    return {entry["path"]: entry for entry in data["files"]}
+
+
+class _CheckpointSaver:
+    """Atomically rewrites the checkpoint file, at most once per interval unless forced."""
+
+    def __init__(
+        self,
+        checkpoint: str | os.PathLike[str] | None,
+        report: ArchiveReport,
+        interval: float,
+    ) -> None:
+        self._checkpoint = checkpoint
+        self._report = report
+        self._interval = interval
+        self._saved_at = time.monotonic()
+
+    def save_if_due(self) -> None:
+        if time.monotonic() - self._saved_at >= self._interval:
+            self.save()
+
+    def save(self) -> None:
+        self._saved_at = time.monotonic()
+        if self._checkpoint is None:
+            return
+        data = {
+            "schema_version": CHECKPOINT_SCHEMA_VERSION,
+            "files": [result.as_dict() for result in self._report.files],
+        }
+        partial = f"{os.fspath(self._checkpoint)}.partial"
+        with open(partial, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, sort_keys=True)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(partial, self._checkpoint)
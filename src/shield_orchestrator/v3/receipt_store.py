@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .contracts.v3_2_receipt import canonical_json, validate_receipt
+
+FRAME_MAGIC = b"SRS1"
+INDEX_MAGIC = b"SRX1"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+DEFAULT_FRAME_CACHE = 8
+
+# Frame prefix: magic, header length, payload length, header crc32, payload crc32.
+_FRAME_PREFIX = struct.Struct(">4sIIII")
+# Index prefix: magic, size of the sealed segment it covers, body crc32.
+_INDEX_PREFIX = struct.Struct(">4sQI")
+_SEGMENT_NAME = re.compile(r"segment-(\d{8})\.log")
+_LOWER_SHA256 = re.compile(r"[0-9a-f]{64}")
+
+# Where a receipt lives: segment number, frame offset, line within the frame.
+_Location = tuple[int, int, int]
+# One index entry: receipt_hash, request_id, frame offset, line within the frame.
+_IndexEntry = tuple[str, str, int, int]
+
+
+@dataclass(frozen=True)
+class ReceiptStoreStats:
+    """Point-in-time receipt store counters."""
+
+    receipts: int
+    request_ids: int
+    segments: int
+    stored_bytes: int
+
+
+class ReceiptStore:
+    """
+    Local content-addressed store for v3.2 receipts, keyed by receipt_hash.
+
+    Receipts are appended to segment-NNNNNNNN.log files in directory. Each
+    put_many() batch becomes one frame: a header listing
+    (receipt_hash, request_id) pairs and a zlib-compressed payload of the
+    canonical receipts, one per line, holding the bytes receipt_hash covers. A frame is written and fsynced once,
+    so a batch costs a single fsync; starting a new segment also fsyncs the
+    directory.
+
+    - Each receipt must pass validate_receipt() against its own
+      context_hash, and receipt_hash must match its content; otherwise
+      ValueError is raised and nothing from that batch is written.
+    - A receipt whose hash is already stored, or repeated within the batch,
+      is not written again.
+    - When a segment is sealed, because writing moves on to the next one,
+      its (receipt_hash, request_id, frame offset, line) entries are written
+      to segment-NNNNNNNN.idx. Opening the store loads those index files
+      and scans frame headers only in the unsealed last segment, or in a
+      sealed segment whose index is missing, stale or damaged (and then
+      rewrites that index). get() and get_for_request() then look up in
+      O(1) and decompress only the frame that holds the receipt.
+    - A frame torn by a crash at the end of the last segment is truncated
+      on open; damage anywhere else raises ValueError.
+
+    One process may write a directory at a time; within it the store is
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        frame_cache: int = DEFAULT_FRAME_CACHE,
+    ) -> None:
+        for name, value in (("segment_bytes", segment_bytes), ("frame_cache", frame_cache)):
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                raise ValueError(f"{name} must be a positive integer")
+        if isinstance(compression_level, bool) or not isinstance(compression_level, int) or not 0 <= compression_level <= 9:
+            raise ValueError("compression_level must be an integer from 0 to 9")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        self._compression_level = compression_level
+        self._frame_cache_size = frame_cache
+        self._lock = threading.Lock()
+        self._by_hash: dict[str, _Location] = {}
+        self._by_request: dict[str, list[str]] = {}
+        self._readers: dict[int, BinaryIO] = {}
+        self._frames: OrderedDict[tuple[int, int], list[bytes]] = OrderedDict()
+        self._segments: list[int] = []
+        self._tail_entries: list[_IndexEntry] = []
+        self._stored_bytes = 0
+        self._closed = False
+        numbers = self._segment_numbers()
+        for number in numbers:
+            self._load_segment(number, last=number == numbers[-1])
+        if not self._segments:
+            self._start_segment(1)
+        self._writer: BinaryIO = open(self._segment_path(self._segments[-1]), "ab", buffering=0)
+        self._writer_size = self._segment_path(self._segments[-1]).stat().st_size
+
+    def __enter__(self) -> ReceiptStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, receipt_hash: object) -> bool:
+        return receipt_hash in self._by_hash
+
+    def put(self, receipt: dict[str, Any]) -> str:
+        """Store one receipt; returns its receipt_hash."""
+        return self.put_many([receipt])[0]
+
+    def put_many(self, receipts: Iterable[dict[str, Any]]) -> list[str]:
+        """Store a batch with at most one frame and one fsync; returns the receipt hashes in input order."""
+        hashes: list[str] = []
+        pending: dict[str, tuple[str, bytes]] = {}
+        with self._lock:
+            self._require_open()
+            for receipt in receipts:
+                receipt_hash, request_id, serialized = _serialize(receipt)
+                hashes.append(receipt_hash)
+                if receipt_hash not in self._by_hash and receipt_hash not in pending:
+                    pending[receipt_hash] = (request_id, serialized)
+            if pending:
+                self._append_frame(pending)
+        return hashes
+
+    def get(self, receipt_hash: str) -> dict[str, Any] | None:
+        """The stored receipt with receipt_hash, or None."""
+        with self._lock:
+            self._require_open()
+            location = self._by_hash.get(receipt_hash)
+            if location is None:
+                return None
+            segment, offset, line = location
+            raw = self._frame_lines(segment, offset)[line]
+        receipt: dict[str, Any] = json.loads(raw)
+        receipt["receipt_hash"] = receipt_hash
+        return receipt
+
+    def hashes_for_request(self, request_id: str) -> tuple[str, ...]:
+        """Hashes of the distinct receipts stored for request_id, oldest first."""
+        with self._lock:
+            return tuple(self._by_request.get(request_id, ()))
+
+    def get_for_request(self, request_id: str) -> list[dict[str, Any]]:
+        """The distinct receipts stored for request_id, oldest first."""
+        receipts = [self.get(receipt_hash) for receipt_hash in self.hashes_for_request(request_id)]
+        return [receipt for receipt in receipts if receipt is not None]
+
+    def stats(self) -> ReceiptStoreStats:
+        with self._lock:
+            return ReceiptStoreStats(
+                receipts=len(self._by_hash),
+                request_ids=len(self._by_request),
+                segments=len(self._segments),
+                stored_bytes=self._stored_bytes,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._writer.close()
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+            self._frames.clear()
+
+    def _require_open(self) -> None:
+        if self._closed:
+            raise ValueError("receipt store is closed")
+
+    def _segment_path(self, number: int) -> Path:
+        return self._directory / f"segment-{number:08d}.log"
+
+    def _index_path(self, number: int) -> Path:
+        return self._directory / f"segment-{number:08d}.idx"
+
+    def _segment_numbers(self) -> list[int]:
+        matches = (_SEGMENT_NAME.fullmatch(path.name) for path in self._directory.iterdir())
+        return sorted(int(match.group(1)) for match in matches if match is not None)
+
+    def _start_segment(self, number: int) -> None:
+        self._segment_path(number).touch()
+        _fsync_directory(self._directory)
+        self._segments.append(number)
+
+    def _load_segment(self, number: int, *, last: bool) -> None:
+        """Index a segment from its index file when it is sealed and the index is intact, otherwise by scanning."""
+        entries = None if last else self._read_index(number)
+        if entries is None:
+            entries = self._scan_segment(number, last=last)
+            if not last:
+                self._write_index(number, entries)
+        self._index_entries(number, entries)
+        if last:
+            self._tail_entries = entries
+        self._segments.append(number)
+        self._stored_bytes += self._segment_path(number).stat().st_size
+
+    def _scan_segment(self, number: int, *, last: bool) -> list[_IndexEntry]:
+        """Read every frame header in a segment; a torn frame may only end the last one."""
+        path = self._segment_path(number)
+        size = path.stat().st_size
+        offset = 0
+        entries: list[_IndexEntry] = []
+        with open(path, "rb") as handle:
+            while offset < size:
+                frame = _read_frame_header(handle, offset, size)
+                if frame is None:
+                    break
+                header, end = frame
+                entries.extend(_frame_entries(offset, header))
+                offset = end
+        if offset < size:
+            if not last:
+                raise ValueError(f"receipt store segment {path.name} is corrupt at offset {offset}")
+            with open(path, "r+b") as handle:
+                handle.truncate(offset)
+                os.fsync(handle.fileno())
+        return entries
+
+    def _read_index(self, number: int) -> list[_IndexEntry] | None:
+        """The entries of a sealed segment's index file; None when it is missing, stale or damaged."""
+        try:
+            data = self._index_path(number).read_bytes()
+        except FileNotFoundError:
+            return None
+        if len(data) < _INDEX_PREFIX.size:
+            return None
+        magic, segment_size, body_crc = _INDEX_PREFIX.unpack_from(data)
+        body = data[_INDEX_PREFIX.size :]
+        if (
+            magic != INDEX_MAGIC
+            or segment_size != self._segment_path(number).stat().st_size
+            or zlib.crc32(body) != body_crc
+        ):
+            return None
+        return [(receipt_hash, request_id, offset, line) for receipt_hash, request_id, offset, line in json.loads(body)]
+
+    def _write_index(self, number: int, entries: list[_IndexEntry]) -> None:
+        """
+        Replace a sealed segment's index file.
+
+        The index is only a hint, so it is not fsynced: a torn or lost index
+        fails its checks on open and the segment is scanned instead.
+        """
+        body = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+        segment_size = self._segment_path(number).stat().st_size
+        partial = self._index_path(number).with_suffix(".idx.partial")
+        partial.write_bytes(_INDEX_PREFIX.pack(INDEX_MAGIC, segment_size, zlib.crc32(body)) + body)
+        os.replace(partial, self._index_path(number))
+
+    def _index_entries(self, segment: int, entries: list[_IndexEntry]) -> None:
+        for receipt_hash, request_id, offset, line in entries:
+            self._by_hash[receipt_hash] = (segment, offset, line)
+            self._by_request.setdefault(request_id, []).append(receipt_hash)
+
+    def _append_frame(self, pending: dict[str, tuple[str, bytes]]) -> None:
+        entries = [[receipt_hash, request_id] for receipt_hash, (request_id, _) in pending.items()]
+        header_bytes = json.dumps(entries).encode("utf-8")
+        payload = zlib.compress(b"\n".join(serialized for _, serialized in pending.values()), self._compression_level)
+        frame = (
+            _FRAME_PREFIX.pack(
+                FRAME_MAGIC,
+                len(header_bytes),
+                len(payload),
+                zlib.crc32(header_bytes),
+                zlib.crc32(payload),
+            )
+            + header_bytes
+            + payload
+        )
+        if self._writer_size and self._writer_size + len(frame) > self._segment_bytes:
+            self._writer.close()
+            self._write_index(self._segments[-1], self._tail_entries)
+            self._tail_entries = []
+            self._start_segment(self._segments[-1] + 1)
+            self._writer = open(self._segment_path(self._segments[-1]), "ab", buffering=0)
+            self._writer_size = 0
+        offset = self._writer_size
+        try:
+            written = 0
+            while written < len(frame):
+                written += self._writer.write(frame[written:])
+            os.fsync(self._writer.fileno())
+        except BaseException:
+            self._writer.truncate(offset)
+            raise
+        self._writer_size += len(frame)
+        self._stored_bytes += len(frame)
+        appended = _frame_entries(offset, entries)
+        self._index_entries(self._segments[-1], appended)
+        self._tail_entries.extend(appended)
+
+    def _frame_lines(self, segment: int, offset: int) -> list[bytes]:
+        key = (segment, offset)
+        lines = self._frames.get(key)
+        if lines is not None:
+            self._frames.move_to_end(key)
+            return lines
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = self._readers[segment] = open(self._segment_path(segment), "rb")
+        reader.seek(offset)
+        _, header_length, payload_length, _, payload_crc = _FRAME_PREFIX.unpack(reader.read(_FRAME_PREFIX.size))
+        reader.seek(header_length, os.SEEK_CUR)
+        payload = reader.read(payload_length)
+        if zlib.crc32(payload) != payload_crc:
+            raise ValueError(f"receipt store segment {segment:08d} is corrupt at offset {offset}")
+        # Canonical JSON escapes newlines, so each receipt is exactly one line.
+        lines = zlib.decompress(payload).split(b"\n")
+        self._frames[key] = lines
+        if len(self._frames) > self._frame_cache_size:
+            self._frames.popitem(last=False)
+        return lines
+
+
+def _serialize(receipt: dict[str, Any]) -> tuple[str, str, bytes]:
+    """
+    receipt_hash, request_id and the canonical bytes the hash covers.
+
+    Those bytes carry an empty receipt_hash, exactly as build_receipt()
+    hashes them; get() puts the hash back from the index. A receipt whose
+    content matches its hash must still pass the v3.2 validate_receipt()
+    against its own context_hash before it is stored.
+    """
+    if not isinstance(receipt, dict):
+        raise ValueError("receipt must be dict")
+    receipt_hash = receipt.get("receipt_hash")
+    request_id = receipt.get("request_id")
+    if not isinstance(receipt_hash, str) or _LOWER_SHA256.fullmatch(receipt_hash) is None:
+        raise ValueError("receipt_hash must be 64-character lowercase sha256 hex")
+    if not isinstance(request_id, str) or not request_id:
+        raise ValueError("request_id must be a non-empty string")
+    unhashed = canonical_json({**receipt, "receipt_hash": ""}).encode("utf-8")
+    if hashlib.sha256(unhashed).hexdigest() != receipt_hash:
+        raise ValueError("receipt_hash does not match receipt content")
+    validate_receipt(receipt, expected_context_hash=receipt.get("context_hash", ""))
+    return receipt_hash, request_id, unhashed
+
+
+def _frame_entries(offset: int, header: list[list[str]]) -> list[_IndexEntry]:
+    return [(receipt_hash, request_id, offset, line) for line, (receipt_hash, request_id) in enumerate(header)]
+
+
+def _read_frame_header(handle: BinaryIO, offset: int, size: int) -> tuple[list[list[str]], int] | None:
+    """The frame at offset as (index entries, end offset); None when it is torn or damaged."""
+    handle.seek(offset)
+    prefix = handle.read(_FRAME_PREFIX.size)
+    if len(prefix) < _FRAME_PREFIX.size:
+        return None
+    magic, header_length, payload_length, header_crc, _ = _FRAME_PREFIX.unpack(prefix)
+    end = offset + _FRAME_PREFIX.size + header_length + payload_length
+    if magic != FRAME_MAGIC or end > size:
+        return None
+    header = handle.read(header_length)
+    if zlib.crc32(header) != header_crc:
+        return None
+    return json.loads(header), end
+
+
+def _fsync_directory(directory: Path) -> None:
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any
+
+# Timed stages, named like their trace entries, in pipeline order.
+TIMED_STAGES = (
+    "input_validation",
+    "sentinel_ai",
+    "dqsn",
+    "adn",
+    "guardian_wallet",
+    "qwg",
+    "receipt_synthesis",
+    "adaptive_core",
+)
+
+
+@dataclass(frozen=True)
+class V3StageTimings:
+    """
+    Monotonic per-stage durations, in seconds, of one v3 orchestration.
+
+    Delivered out-of-band to OrchestratorV3Options.on_stage_timings; never
+    part of the trace, receipt or context hash. Stages that did not run to
+    completion are absent: a bridge call not made because of fast_deny, or
+    abandoned at its timeout or the deadline. request_id is None when the
+    request failed validation.
+    """
+
+    request_id: str | None
+    outcome: str
+    durations: Mapping[str, float]
+    total_seconds: float
+
+
+class StageTimer:
+    """Per-request stage clock; bridge stages may be timed from worker threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._started = clock()
+        self.request_id: str | None = None
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as stage name, unless it is cancelled rather than completed or failed."""
+        started = self._clock()
+        try:
+            yield
+        except Exception:
+            self.durations[name] = self._clock() - started
+            raise
+        self.durations[name] = self._clock() - started
+
+    def timed(self, name: str, call: Callable[[], Any]) -> Callable[[], Any]:
+        """Wrap call so that each run is timed as stage name."""
+
+        def run() -> Any:
+            with self.stage(name):
+                return call()
+
+        return run
+
+    def finish(self, outcome: str) -> V3StageTimings:
+        durations = dict(self.durations)
+        return V3StageTimings(
+            request_id=self.request_id,
+            outcome=outcome,
+            durations={name: durations[name] for name in TIMED_STAGES if name in durations},
+            total_seconds=self._clock() - self._started,
+        )
+
+
+def timed_stage(timer: StageTimer | None, name: str) -> AbstractContextManager[None]:
+    """timer.stage(name), or a no-op context when timings are not requested."""
+    return nullcontext() if timer is None else timer.stage(name)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from typing import Any
+
+DEFAULT_MAX_DEPTH = 32
+DEFAULT_MAX_NODES = 250_000
+DEFAULT_MAX_STRING_BYTES = 1_048_576
+DEFAULT_MAX_SCALAR_BYTES = 16_777_216
+
+
+class V3WorkBudgetError(ValueError):
+    """Raised as soon as an untrusted v3 value exceeds its work budget."""
+
+
+@dataclass(frozen=True)
+class V3WorkBudget:
+    """
+    Size caps for untrusted v3 values: request payloads and engine responses.
+
+    - max_depth bounds container nesting (and so rejects cyclic values).
+    - max_nodes bounds the number of values, containers included.
+    - max_string_bytes bounds each string or mapping key, in UTF-8 bytes.
+    - max_scalar_bytes bounds the total string, key and integer-digit bytes.
+
+    Budgets only measure: a value within budget is not otherwise validated.
+    """
+
+    max_depth: int = DEFAULT_MAX_DEPTH
+    max_nodes: int = DEFAULT_MAX_NODES
+    max_string_bytes: int = DEFAULT_MAX_STRING_BYTES
+    max_scalar_bytes: int = DEFAULT_MAX_SCALAR_BYTES
+
+    def __post_init__(self) -> None:
+        for item in fields(self):
+            limit = getattr(self, item.name)
+            if isinstance(limit, bool) or not isinstance(limit, int) or limit <= 0:
+                raise ValueError(f"{item.name} must be a positive integer")
+
+    def meter(self) -> WorkMeter:
+        return WorkMeter(self)
+
+    def check(self, value: Any) -> None:
+        """Walk value once, raising V3WorkBudgetError at the first exceeded cap."""
+        self.meter().visit(value, 1)
+
+
+class WorkMeter:
+    """Running counters for one budgeted walk; each method raises once a cap is exceeded."""
+
+    __slots__ = ("_budget", "nodes", "scalar_bytes")
+
+    def __init__(self, budget: V3WorkBudget) -> None:
+        self._budget = budget
+        self.nodes = 0
+        self.scalar_bytes = 0
+
+    def visit(self, value: Any, depth: int) -> None:
+        """Meter value and everything it contains, value being at depth."""
+        self.node(depth)
+        if type(value) is str:
+            self.text(value)
+            return
+        if is_dataclass(value) and not isinstance(value, type):
+            value = {f.name: getattr(value, f.name) for f in fields(value)}
+        elif isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, Mapping):
+            for key, child in value.items():
+                self.key(key)
+                self.visit(child, depth + 1)
+        elif isinstance(value, (list, tuple)):
+            for child in value:
+                self.visit(child, depth + 1)
+        else:
+            self.scalar(value)
+
+    def node(self, depth: int) -> None:
+        if depth > self._budget.max_depth:
+            raise V3WorkBudgetError("container depth exceeds work budget")
+        self.nodes += 1
+        if self.nodes > self._budget.max_nodes:
+            raise V3WorkBudgetError("node count exceeds work budget")
+
+    def text(self, value: str) -> None:
+        size = len(value) if value.isascii() else len(value.encode("utf-8", "surrogatepass"))
+        if size > self._budget.max_string_bytes:
+            raise V3WorkBudgetError("string exceeds work budget")
+        self._add(size)
+
+    def key(self, key: Any) -> None:
+        if isinstance(key, str):
+            self.text(key)
+
+    def scalar(self, value: Any) -> None:
+        if isinstance(value, str):
+            self.text(value)
+        elif isinstance(value, int):
+            # Upper bound on decimal digits, without the quadratic int -> str.
+            self._add(value.bit_length() // 3 + 1)
+
+    def _add(self, size: int) -> None:
+        self.scalar_bytes += size
+        if self.scalar_bytes > self._budget.max_scalar_bytes:
+            raise V3WorkBudgetError("scalar bytes exceed work budget")
+
+
+DEFAULT_WORK_BUDGET = V3WorkBudget()
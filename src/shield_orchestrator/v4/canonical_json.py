@@ -3,7 +3,8 @@ from __future__ import annotations
 import hashlib
 import json
 import unicodedata
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from typing import Any
 
 from shield_orchestrator.v4 import CANONICALIZATION_PROFILE
@@ -12,8 +13,14 @@ SIGNED_PAYLOAD_HASH_PREFIX = "DGB-SHIELD-V4-SIGNED-PAYLOAD"
 COMPONENT_VERDICT_DOMAIN = "DGB-SHIELD-V4-COMPONENT-VERDICT:shield.verdict.v2:policy.v1"
 ORCHESTRATOR_RECEIPT_DOMAIN = "DGB-SHIELD-V4-ORCH-RECEIPT:shield.receipt.v2:policy.v1"
 
+# Containers this many levels deep are streamed member by member; deeper
+# values are encoded whole. Two levels make each component verdict and
+# signature bundle of a receipt a separate chunk.
+_STREAM_DEPTH = 2
+_encode = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode
 
-def _normalise(value: Any, *, path: str) -> Any:
+
+def _normalise_reference(value: Any, *, path: str) -> Any:
     if value is None:
         raise ValueError(f"{path} must omit absent fields instead of using null")
     if isinstance(value, str):
@@ -25,9 +32,9 @@ def _normalise(value: Any, *, path: str) -> Any:
     if isinstance(value, float):
         raise ValueError(f"{path} must not contain floats")
     if isinstance(value, list):
-        return [_normalise(item, path=f"{path}[{index}]") for index, item in enumerate(value)]
+        return [_normalise_reference(item, path=f"{path}[{index}]") for index, item in enumerate(value)]
     if isinstance(value, tuple):
-        return [_normalise(item, path=f"{path}[{index}]") for index, item in enumerate(value)]
+        return [_normalise_reference(item, path=f"{path}[{index}]") for index, item in enumerate(value)]
     if isinstance(value, dict):
         normalised: dict[str, Any] = {}
         for key, item in value.items():
@@ -36,17 +43,80 @@ def _normalise(value: Any, *, path: str) -> Any:
             clean_key = unicodedata.normalize("NFC", key)
             if clean_key in normalised:
                 raise ValueError(f"{path} contains duplicate key after Unicode normalization")
-            normalised[clean_key] = _normalise(item, path=f"{path}.{clean_key}")
+            normalised[clean_key] = _normalise_reference(item, path=f"{path}.{clean_key}")
         return normalised
     raise ValueError(f"{path} contains unsupported type {type(value).__name__}")
 
 
+class _NotCanonical(Exception):
+    """Raised by the fast walk; the reference walk then reports the error with its path."""
+
+
+def _nfc(text: str) -> str:
+    # ASCII and already-NFC strings are returned as-is, without a normalization copy.
+    if text.isascii() or unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+def _needs_normalisation(value: Any) -> bool:
+    """Whether NFC normalization changes any string in value; _NotCanonical when value is rejected."""
+    if isinstance(value, str):
+        return _nfc(value) is not value
+    if isinstance(value, dict):
+        changed = False
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise _NotCanonical
+            changed = _needs_normalisation(item) or _nfc(key) is not key or changed
+        return changed
+    if isinstance(value, (list, tuple)):
+        changed = False
+        for item in value:
+            changed = _needs_normalisation(item) or changed
+        return changed
+    if isinstance(value, int):
+        return False
+    raise _NotCanonical
+
+
+def _normalise(value: Any) -> Any:
+    if isinstance(value, str):
+        return _nfc(value)
+    if isinstance(value, dict):
+        normalised: dict[str, Any] = {}
+        for key, item in value.items():
+            clean_key = _nfc(key)
+            if clean_key in normalised:
+                raise _NotCanonical
+            normalised[clean_key] = _normalise(item)
+        return normalised
+    if isinstance(value, (list, tuple)):
+        return [_normalise(item) for item in value]
+    return value
+
+
+def _canonical_value(payload: dict[str, Any]) -> Any:
+    """
+    The value to serialize for payload: payload itself when every string is
+    already NFC, otherwise a normalized copy.
+
+    The walks here carry no path. When they reject a value, the path-building
+    reference walk runs once to raise the same error message as before.
+    """
+    try:
+        if not _needs_normalisation(payload):
+            return payload
+        return _normalise(payload)
+    except _NotCanonical:
+        return _normalise_reference(payload, path="$")
+
+
 def to_canonical_json(payload: dict[str, Any]) -> str:
     if not isinstance(payload, dict):
         raise ValueError("payload must be dict")
-    normalised = _normalise(payload, path="$")
     return json.dumps(
-        normalised,
+        _canonical_value(payload),
         sort_keys=True,
         separators=(",", ":"),
         ensure_ascii=False,
@@ -58,10 +128,59 @@ def to_canonical_json_bytes(payload: dict[str, Any]) -> bytes:
     return to_canonical_json(payload).encode("utf-8")
 
 
+def write_canonical_json(payload: dict[str, Any], write: Callable[[bytes], object]) -> int:
+    """
+    Stream the canonical UTF-8 bytes of payload to write() and return their length.
+
+    The chunks concatenate to exactly to_canonical_json_bytes(payload), but
+    no full-size str or bytes copy of the document is built.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be dict")
+    length = 0
+
+    def counted(chunk: bytes) -> None:
+        nonlocal length
+        length += len(chunk)
+        write(chunk)
+
+    _write_value(_canonical_value(payload), counted, _STREAM_DEPTH)
+    return length
+
+
+def _write_value(value: Any, write: Callable[[bytes], None], depth: int) -> None:
+    # Mirrors json.dumps(sort_keys=True): members in sorted key order, tuples as lists.
+    if depth and isinstance(value, dict) and value:
+        key_opening = "{"
+        for key, item in sorted(value.items()):
+            write(f"{key_opening}{_encode(key)}:".encode())
+            _write_value(item, write, depth - 1)
+            key_opening = ","
+        write(b"}")
+    elif depth and isinstance(value, (list, tuple)) and value:
+        item_opening = b"["
+        for item in value:
+            write(item_opening)
+            _write_value(item, write, depth - 1)
+            item_opening = b","
+        write(b"]")
+    else:
+        write(_encode(value).encode("utf-8"))
+
+
+def _discard(_chunk: bytes) -> None:
+    return None
+
+
+def canonical_json_byte_length(payload: dict[str, Any]) -> int:
+    """len(to_canonical_json_bytes(payload)), without building the bytes."""
+    return write_canonical_json(payload, _discard)
+
+
 def _reject_duplicate_json_keys(pairs: Iterable[tuple[str, Any]]) -> dict[str, Any]:
     result: dict[str, Any] = {}
     for key, value in pairs:
-        clean_key = unicodedata.normalize("NFC", key)
+        clean_key = _nfc(key)
         if clean_key in result:
             raise ValueError("json contains duplicate key")
         result[clean_key] = value
@@ -75,19 +194,52 @@ def parse_json_no_duplicate_keys(raw_json: str) -> dict[str, Any]:
     return parsed
 
 
-def domain_separated_payload_bytes(*, domain_tag: str, payload: dict[str, Any]) -> bytes:
+def _domain_prefix(domain_tag: str) -> bytes:
     if domain_tag not in {COMPONENT_VERDICT_DOMAIN, ORCHESTRATOR_RECEIPT_DOMAIN}:
         raise ValueError("unsupported Shield v4 domain tag")
-    return (
-        f"{SIGNED_PAYLOAD_HASH_PREFIX}\n{domain_tag}\n".encode("utf-8")
-        + to_canonical_json_bytes(payload)
-    )
+    return f"{SIGNED_PAYLOAD_HASH_PREFIX}\n{domain_tag}\n".encode("utf-8")
+
+
+def domain_separated_payload_bytes(*, domain_tag: str, payload: dict[str, Any]) -> bytes:
+    return _domain_prefix(domain_tag) + to_canonical_json_bytes(payload)
 
 
 def signed_payload_hash(*, domain_tag: str, payload: dict[str, Any]) -> str:
     return hashlib.sha256(domain_separated_payload_bytes(domain_tag=domain_tag, payload=payload)).hexdigest()
 
 
+def signed_payload_hash_streaming(*, domain_tag: str, payload: dict[str, Any]) -> str:
+    """signed_payload_hash() with the canonical bytes streamed into a SHA-256 seeded with the domain prefix."""
+    digest = hashlib.sha256(_domain_prefix(domain_tag))
+    write_canonical_json(payload, digest.update)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class SignedPayloadDigests:
+    payload_sha256: str
+    signed_payload_hash: str
+
+
+def signed_payload_digests(*, domain_tag: str, payload: dict[str, Any]) -> SignedPayloadDigests:
+    """
+    The plain SHA-256 of payload's canonical bytes and its signed_payload_hash(),
+    from one streaming pass that feeds each chunk to both digests.
+    """
+    payload_digest = hashlib.sha256()
+    signed_digest = hashlib.sha256(_domain_prefix(domain_tag))
+
+    def update(chunk: bytes) -> None:
+        payload_digest.update(chunk)
+        signed_digest.update(chunk)
+
+    write_canonical_json(payload, update)
+    return SignedPayloadDigests(
+        payload_sha256=payload_digest.hexdigest(),
+        signed_payload_hash=signed_digest.hexdigest(),
+    )
+
+
 def canonicalization_manifest() -> dict[str, str]:
     return {
         "canonicalization_profile": CANONICALIZATION_PROFILE,
@@ -4,7 +4,7 @@ import hashlib
 from typing import Any
 
 from shield_orchestrator.v4 import CANONICALIZATION_PROFILE, POLICY_VERSION, VERDICT_SCHEMA_VERSION
-from shield_orchestrator.v4.canonical_json import COMPONENT_VERDICT_DOMAIN, signed_payload_hash
+from shield_orchestrator.v4.canonical_json import COMPONENT_VERDICT_DOMAIN, signed_payload_hash_streaming
 from shield_orchestrator.v4.crypto_algorithms import SIGNATURE_POLICY_V1, default_standard_profile_for_algorithm, require_supported_algorithm
 from shield_orchestrator.v4.key_registry import KeyRegistry, KeyRegistryEntry, load_key_registry
 from shield_orchestrator.v4.signature_bundle import SignatureVerifier, verify_signature_bundle
@@ -216,7 +216,7 @@ def validate_component_verdict_envelope(
     payload = unsigned_component_payload(verdict)
     if payload["context_hash"] != _require_hash(expected_context_hash, field="expected_context_hash"):
         raise ValueError("component context_hash mismatch")
-    expected_payload_hash = signed_payload_hash(domain_tag=COMPONENT_VERDICT_DOMAIN, payload=payload)
+    expected_payload_hash = signed_payload_hash_streaming(domain_tag=COMPONENT_VERDICT_DOMAIN, payload=payload)
     if _require_hash(verdict["signed_payload_hash"], field="signed_payload_hash") != expected_payload_hash:
         raise ValueError("component signed payload hash mismatch")
     loaded_registry = load_key_registry(registry) if isinstance(registry, dict) else registry
@@ -7,6 +7,8 @@ import unicodedata
 from dataclasses import dataclass
 from typing import Any, Protocol, TypeAlias
 
+from shield_orchestrator.metrics import ShieldMetrics
+from shield_orchestrator.tracing import PhaseSpans, Tracer, traced, tracing_enabled
 from shield_orchestrator.v4 import (
     CANONICALIZATION_PROFILE,
     KEY_REGISTRY_SCHEMA_VERSION,
@@ -17,7 +19,8 @@ from shield_orchestrator.v4 import (
 from shield_orchestrator.v4.canonical_json import (
     COMPONENT_VERDICT_DOMAIN,
     ORCHESTRATOR_RECEIPT_DOMAIN,
-    signed_payload_hash,
+    signed_payload_digests,
+    signed_payload_hash_streaming,
     to_canonical_json,
 )
 from shield_orchestrator.v4.component_verdicts import (
@@ -31,7 +34,6 @@ from shield_orchestrator.v4.contracts.v4_receipt import (
     REQUIRED_RECEIPT_FIELDS,
     UNSIGNED_RECEIPT_EXCLUDED_FIELDS,
     _validate_receipt_payload_semantics,
-    build_receipt_hash,
     validate_receipt_envelope,
 )
 from shield_orchestrator.v4.crypto_algorithms import (
@@ -155,6 +157,10 @@ ARTIFACT_FIELDS = COMMON_FIELDS | {
     "registry_version",
 }
 
+VERIFY_SPAN = "shield.v4.verify_receipt"
+VERIFY_PHASE_SPAN_PREFIX = "shield.v4.verify"
+VERIFY_PHASES = ("preflight", "plan", "dry_run", "signatures", "envelope", "audit_commit")
+
 MAX_AUDIT_RECORDS = 24
 MAX_AUDIT_RECORD_BYTES = 2_048
 MAX_AUDIT_BATCH_BYTES = 49_152
@@ -881,8 +887,80 @@ def verify_v4_receipt_with_audit(
     component_verifier: SignatureVerifier,
     receipt_verifier: SignatureVerifier,
     audit_sink: VerificationAuditSink,
+    tracer: Tracer | None = None,
+    metrics: ShieldMetrics | None = None,
+) -> dict[str, Any]:
+    """Verify one bounded six-bundle chain and return after durable audit ACK.
+
+    A tracer receives one span for the call, ending with its V4_* reason id,
+    and one child span per phase in VERIFY_PHASES; spans carry reason ids,
+    artifact ids and counts only, never receipt content or keys. metrics
+    counts each result by its V4_* reason id; argument errors raised before
+    verification starts carry no reason id and are not counted.
+    """
+    kwargs = {
+        "artifact_transport_hash": artifact_transport_hash,
+        "expected_context_hash": expected_context_hash,
+        "expected_request_id": expected_request_id,
+        "registry": registry,
+        "minimum_registry_version": minimum_registry_version,
+        "verification_time": verification_time,
+        "component_verifier": component_verifier,
+        "receipt_verifier": receipt_verifier,
+        "audit_sink": audit_sink,
+    }
+    if metrics is None:
+        return _traced_verify(receipt, tracer, kwargs)
+    try:
+        checked_receipt = _traced_verify(receipt, tracer, kwargs)
+    except (ShieldV4VerificationError, ShieldV4AuditSinkError) as error:
+        metrics.record_v4_result(_result_reason_id(error))
+        raise
+    metrics.record_v4_result(V4_VERIFY_OK)
+    return checked_receipt
+
+
+def _traced_verify(receipt: dict[str, Any], tracer: Tracer | None, kwargs: dict[str, Any]) -> dict[str, Any]:
+    if not tracing_enabled(tracer):
+        return _verify_v4_receipt_with_audit(receipt, phases=_UNTRACED_PHASES, **kwargs)
+    phases = PhaseSpans(tracer, VERIFY_PHASE_SPAN_PREFIX)
+    with traced(tracer, VERIFY_SPAN) as span:
+        try:
+            checked_receipt = _verify_v4_receipt_with_audit(receipt, phases=phases, **kwargs)
+        except BaseException as error:
+            phases.close(error)
+            if isinstance(error, (ShieldV4VerificationError, ShieldV4AuditSinkError)):
+                span.set("reason_id", _result_reason_id(error))
+            raise
+        phases.close()
+        span.set("reason_id", V4_VERIFY_OK)
+        return checked_receipt
+
+
+def _result_reason_id(error: ShieldV4VerificationError | ShieldV4AuditSinkError) -> str:
+    if isinstance(error, ShieldV4VerificationError):
+        return error.reason_id
+    return str(error)
+
+
+_UNTRACED_PHASES = PhaseSpans(None, VERIFY_PHASE_SPAN_PREFIX)
+
+
+def _verify_v4_receipt_with_audit(
+    receipt: dict[str, Any],
+    *,
+    artifact_transport_hash: str,
+    expected_context_hash: str,
+    expected_request_id: str,
+    registry: KeyRegistry,
+    minimum_registry_version: int,
+    verification_time: str,
+    component_verifier: SignatureVerifier,
+    receipt_verifier: SignatureVerifier,
+    audit_sink: VerificationAuditSink,
+    phases: PhaseSpans,
 ) -> dict[str, Any]:
-    """Verify one bounded six-bundle chain and return after durable audit ACK."""
+    phases.enter("preflight")
     transport_hash = _require_hash(artifact_transport_hash, field="artifact_transport_hash")
     context_hash = _require_hash(expected_context_hash, field="expected_context_hash")
     timestamp = _require_exact_timestamp(verification_time)
@@ -952,6 +1030,7 @@ def verify_v4_receipt_with_audit(
             audit_sink=audit_sink, events=events, reason_id=V4_POLICY_INVALID
         )
 
+    phases.enter("plan")
     try:
         if receipt.get("contract_version") != 4:
             raise ValueError("receipt contract version mismatch")
@@ -1031,16 +1110,18 @@ def verify_v4_receipt_with_audit(
         require_canonical_signature_bundle_budget(receipt["signature_bundle"])
         require_canonical_receipt_budget(receipt)
 
-        expected_receipt_hash = build_receipt_hash(unsigned_receipt)
-        if _require_hash(receipt.get("receipt_hash"), field="receipt_hash") != expected_receipt_hash:
-            raise ValueError("receipt hash mismatch")
-        expected_signed_hash = signed_payload_hash(
+        receipt_digests = signed_payload_digests(
             domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN,
             payload=unsigned_receipt,
         )
+        if (
+            _require_hash(receipt.get("receipt_hash"), field="receipt_hash")
+            != receipt_digests.payload_sha256
+        ):
+            raise ValueError("receipt hash mismatch")
         if (
             _require_hash(receipt.get("signed_payload_hash"), field="signed_payload_hash")
-            != expected_signed_hash
+            != receipt_digests.signed_payload_hash
         ):
             raise ValueError("signed payload hash mismatch")
 
@@ -1048,7 +1129,7 @@ def verify_v4_receipt_with_audit(
         for component in component_values:
             component_id = component["component_id"]
             payload = component_payloads[component_id]
-            expected_component_hash = signed_payload_hash(
+            expected_component_hash = signed_payload_hash_streaming(
                 domain_tag=COMPONENT_VERDICT_DOMAIN,
                 payload=payload,
             )
@@ -1076,7 +1157,7 @@ def verify_v4_receipt_with_audit(
     receipt_artifact = _artifact_fields(
         artifact_type="orchestrator_receipt",
         artifact_id=ORCHESTRATOR_ARTIFACT_ID,
-        artifact_hash=expected_signed_hash,
+        artifact_hash=receipt_digests.signed_payload_hash,
         request_id=receipt["request_id"],
         context_hash=context_hash,
         registry_version=checked_registry.registry_version,
@@ -1094,6 +1175,7 @@ def verify_v4_receipt_with_audit(
         )
         for prepared in prehashed
     ]
+    phases.enter("dry_run")
     try:
         _validate_complete_plan(plans)
         preflight_remaining = {
@@ -1133,6 +1215,7 @@ def verify_v4_receipt_with_audit(
         events[:] = [events[0]]
         _commit_rejection(audit_sink=audit_sink, events=events, reason_id=reason_id)
 
+    phases.enter("signatures", signature_count=len(plans))
     failed = _run_planned_callbacks(
         plans=plans,
         events=events,
@@ -1140,6 +1223,8 @@ def verify_v4_receipt_with_audit(
     )
     if failed is not None:
         failed_plan, reason_id = failed
+        phases.scope.set("artifact_id", failed_plan.artifact_id)
+        phases.scope.set("reason_id", reason_id)
         events.append(
             _artifact_event(
                 artifact=failed_plan.artifact,
@@ -1150,6 +1235,7 @@ def verify_v4_receipt_with_audit(
         )
         _commit_rejection(audit_sink=audit_sink, events=events, reason_id=reason_id)
 
+    phases.enter("envelope")
     remaining = {
         _cache_token(
             entry=plan.entry,
@@ -1197,6 +1283,7 @@ def verify_v4_receipt_with_audit(
         )
         _commit_rejection(audit_sink=audit_sink, events=events, reason_id=reason_id)
 
+    phases.enter("audit_commit", record_count=len(events) + 1)
     events.append(
         _artifact_event(
             artifact=receipt_artifact,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from shield_orchestrator.v4.canonical_json import to_canonical_json
+from shield_orchestrator.v4.canonical_json import canonical_json_byte_length
 from shield_orchestrator.v4.crypto_algorithms import (
     CLASSICAL_ED25519,
     FN_DSA,
@@ -147,7 +147,7 @@ def snapshot_bounded_receipt(receipt: Any) -> BoundedJsonSnapshot:
 
 
 def require_canonical_receipt_budget(receipt: dict[str, Any]) -> int:
-    canonical_bytes = len(to_canonical_json(receipt).encode("utf-8"))
+    canonical_bytes = canonical_json_byte_length(receipt)
     if canonical_bytes > MAX_CANONICAL_RECEIPT_BYTES:
         raise ShieldV4WorkBudgetError("canonical receipt exceeds byte budget")
     return canonical_bytes
@@ -165,7 +165,7 @@ def require_signature_bundle_budget(bundle: Any) -> dict[str, Any]:
 
 
 def require_canonical_signature_bundle_budget(bundle: dict[str, Any]) -> int:
-    canonical_bytes = len(to_canonical_json(bundle).encode("utf-8"))
+    canonical_bytes = canonical_json_byte_length(bundle)
     if canonical_bytes > MAX_SIGNATURE_BUNDLE_BYTES:
         raise ShieldV4WorkBudgetError("signature bundle exceeds canonical byte budget")
     return canonical_bytes
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+import pytest
+
+
+class Counters:
+    def __init__(self) -> None:
+        self.constructed: dict[str, int] = {}
+        self.batch_calls = 0
+        self.single_calls = 0
+
+
+@pytest.fixture
+def fake_engines(monkeypatch: pytest.MonkeyPatch) -> Counters:
+    """Install stand-in modules for the five component engine packages.
+
+    Each engine echoes the decision carried in its component input:
+    "RAISE" makes the engine raise and "UNHASHABLE" returns a response that
+    cannot be canonically hashed.
+    """
+    counters = Counters()
+
+    def constructed(name: str) -> None:
+        counters.constructed[name] = counters.constructed.get(name, 0) + 1
+
+    def respond(component: str, decision: Any) -> dict[str, Any]:
+        if decision == "RAISE":
+            raise RuntimeError("engine failure for one input")
+        if decision == "UNHASHABLE":
+            return {"decision": "ALLOW", "component": component, "reason_codes": [], "blob": object()}
+        return {"decision": decision, "component": component}
+
+    class FakeADNv3:
+        def __init__(self) -> None:
+            constructed("adn")
+
+        def evaluate(self, req: dict[str, Any]) -> dict[str, Any]:
+            counters.single_calls += 1
+            return respond("adn", req["events"][0]["decision"])
+
+        def evaluate_many(self, reqs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            counters.batch_calls += 1
+            return [respond("adn", req["events"][0]["decision"]) for req in reqs]
+
+    class FakeGuardianWalletV3:
+        def __init__(self) -> None:
+            constructed("guardian_wallet")
+
+        def evaluate(self, req: dict[str, Any]) -> dict[str, Any]:
+            return respond("guardian_wallet", req["wallet_ctx"]["decision"])
+
+    class FakeThresholds:
+        pass
+
+    class FakeSentinelV3:
+        def __init__(self, *, thresholds: FakeThresholds) -> None:
+            constructed("sentinel_ai")
+
+        def evaluate(self, req: dict[str, Any]) -> dict[str, Any]:
+            return respond("sentinel", req["telemetry"]["decision"])
+
+    def fake_dqsn_evaluate_v3(req: dict[str, Any]) -> dict[str, Any]:
+        return respond("dqsn", req["signals"][0]["decision"])
+
+    class FakeRiskContext:
+        def __init__(self, **kwargs: Any) -> None:
+            self.device_id = kwargs["device_id"]
+
+    class FakeDecisionEngine:
+        def __init__(self) -> None:
+            constructed("qwg")
+
+        def evaluate_transaction_v3(self, ctx: FakeRiskContext) -> dict[str, Any]:
+            return respond("qwg", ctx.device_id)
+
+    dqsn_api = types.ModuleType("dqsnetwork.v3_api")
+    dqsn_api.evaluate_v3 = fake_dqsn_evaluate_v3  # type: ignore[attr-defined]
+    sentinel_config = types.ModuleType("sentinel_ai_v2.config")
+    sentinel_config.CircuitBreakerThresholds = FakeThresholds  # type: ignore[attr-defined]
+    sentinel_v3 = types.ModuleType("sentinel_ai_v2.v3")
+    sentinel_v3.SentinelV3 = FakeSentinelV3  # type: ignore[attr-defined]
+    modules = {
+        "adn_v3": types.SimpleNamespace(ADNv3=FakeADNv3),
+        "dgb_wallet_guardian": types.SimpleNamespace(GuardianWalletV3=FakeGuardianWalletV3),
+        "dqsnetwork": types.ModuleType("dqsnetwork"),
+        "dqsnetwork.v3_api": dqsn_api,
+        "sentinel_ai_v2": types.ModuleType("sentinel_ai_v2"),
+        "sentinel_ai_v2.config": sentinel_config,
+        "sentinel_ai_v2.v3": sentinel_v3,
+        "qwg": types.SimpleNamespace(
+            DecisionEngine=FakeDecisionEngine,
+            RiskContext=FakeRiskContext,
+            RiskLevel=str,
+        ),
+    }
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    return counters
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.engine_registry import EngineImportRegistry
+from shield_orchestrator.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    ShieldMetrics,
+)
+from shield_orchestrator.testing.stand_in_engines import StandInEngines, StandInProfile
+from shield_orchestrator.v3.contracts.envelope import (
+    OrchestratorV3Request,
+    OrchestratorV3Response,
+    TraceEntry,
+)
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+from shield_orchestrator.v4.component_verdicts import verify_test_only_component_signature
+from shield_orchestrator.v4.key_registry import load_key_registry
+from shield_orchestrator.v4.orchestrate import verify_test_only_orchestrator_signature
+from shield_orchestrator.v4.verification_audit import (
+    AUDIT_APPEND_ACK_SCHEMA_VERSION,
+    ShieldV4AuditSinkError,
+    ShieldV4VerificationError,
+    audit_batch_sha256,
+    verify_v4_receipt_with_audit,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE = ROOT / "tests/fixtures/v4/full_multi_repo_v4_allow_flow.json"
+CTX = "a" * 64
+BRIDGES = ("sentinel_ai", "dqsn", "adn", "guardian_wallet", "qwg")
+
+
+def _request(index: int = 0) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"peers": 8}},
+                "dqsn": {"signals": [{"score": 0.1}]},
+                "adn": {"events": [{"kind": "tx"}]},
+                "guardian_wallet": {"wallet_ctx": {"balance": 10}},
+                "qwg": {"risk_context": {"tx_amount": 5}},
+            },
+        },
+    )
+
+
+def test_registry_renders_the_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests\nby \\ path.", ("path",))
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+    registry.counter("idle_total", "Never incremented.")
+
+    requests.inc('/a"b\n\\')
+    requests.inc("/", amount=2.5)
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value)
+
+    assert PROMETHEUS_CONTENT_TYPE.startswith("text/plain; version=0.0.4")
+    assert registry.render() == (
+        "# HELP requests_total Requests\\nby \\\\ path.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{path="/"} 2.5\n'
+        'requests_total{path="/a\\"b\\n\\\\"} 1\n'
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{le="0.1"} 2\n'
+        'latency_seconds_bucket{le="1"} 3\n'
+        'latency_seconds_bucket{le="+Inf"} 4\n'
+        "latency_seconds_sum 3.65\n"
+        "latency_seconds_count 4\n"
+        "# HELP idle_total Never incremented.\n"
+        "# TYPE idle_total counter\n"
+    )
+    assert (requests.value("/"), latency.count()) == (2.5, 4)
+    assert MetricsRegistry().render() == ""
+
+
+@pytest.mark.parametrize(
+    "build, message",
+    [
+        (lambda: Counter("bad-name", "x"), "invalid metric name"),
+        (lambda: Counter("ok", "x", ("le",)), "invalid label name"),
+        (lambda: Counter("ok", "x", ("__reserved",)), "invalid label name"),
+        (lambda: Histogram("ok", "x", buckets=()), "buckets must be"),
+        (lambda: Histogram("ok", "x", buckets=(1, 1)), "buckets must be"),
+        (lambda: Histogram("ok", "x", buckets=(1, float("inf"))), "buckets must be"),
+        (lambda: Counter("ok", "x").inc(amount=-1), "counters can only increase"),
+        (lambda: Counter("ok", "x", ("a",)).inc(), r"ok takes labels \('a',\)"),
+    ],
+)
+def test_invalid_metrics_are_rejected(build: Any, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        build()
+
+
+def test_shared_registries_reject_duplicate_families() -> None:
+    registry = MetricsRegistry()
+    ShieldMetrics(registry)
+
+    with pytest.raises(ValueError, match="metric already registered: shield_v3_responses_total"):
+        ShieldMetrics(registry)
+
+
+def test_concurrent_increments_are_not_lost() -> None:
+    counter = Counter("hits_total", "Hits.", ("worker",))
+    histogram = Histogram("work_seconds", "Work.")
+
+    def work() -> None:
+        for _ in range(2000):
+            counter.inc("w")
+            histogram.observe(0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (counter.value("w"), histogram.count()) == (16000, 16000)
+
+
+def test_orchestrate_counts_outcomes_reasons_component_errors_and_latency() -> None:
+    metrics = ShieldMetrics(latency_buckets=(0.01, 1.0))
+    engines = StandInEngines({"dqsn": StandInProfile(failure_rate=1.0), "adn": StandInProfile(latency_ms=20)})
+    options = OrchestratorV3Options(engine_registry=EngineImportRegistry(), metrics=metrics)
+
+    with engines.installed():
+        resp = orchestrate(_request(), options=options)
+        assert resp == orchestrate(_request(), options=OrchestratorV3Options(engine_registry=EngineImportRegistry()))
+        missing = orchestrate(OrchestratorV3Request(3, "wallet-1", "SEND", "n", 60, {"context_hash": CTX}), options=options)
+
+    assert (resp.outcome, missing.outcome) == ("DENY", "DENY")
+    assert metrics.v3_responses.value("DENY") == 2
+    for reason_id in (*resp.reason_ids, *missing.reason_ids):
+        assert metrics.v3_reason_ids.value(reason_id) >= 1
+    assert metrics.v3_component_errors.value("dqsn", "component_engine_unavailable_or_failed") == 1
+    assert metrics.v3_component_errors.value("qwg", "missing_component_input") == 1
+    assert [metrics.v3_bridge_duration.count(component) for component in BRIDGES] == [2] * 5
+    rendered = metrics.render()
+    assert 'shield_v3_bridge_duration_seconds_bucket{component_id="adn",le="0.01"} 1' in rendered
+    assert 'shield_v3_bridge_duration_seconds_bucket{component_id="adn",le="1"} 2' in rendered
+    assert 'shield_v3_responses_total{outcome="DENY"} 2' in rendered
+
+
+def test_batches_observe_each_bridge_once_and_async_matches_sync() -> None:
+    metrics = ShieldMetrics()
+    options = OrchestratorV3Options(engine_registry=EngineImportRegistry(), metrics=metrics)
+
+    with StandInEngines().installed():
+        responses = orchestrate_many([_request(0), _request(1), _request(2)], options=options)
+        asyncio.run(orchestrate_async(_request(3), options=options))
+
+    assert [resp.outcome for resp in responses] == ["ALLOW"] * 3
+    assert metrics.v3_responses.value("ALLOW") == 4
+    assert [metrics.v3_bridge_duration.count(component) for component in BRIDGES] == [2] * 5
+
+
+def test_trace_errors_without_a_note_are_labelled_none() -> None:
+    metrics = ShieldMetrics()
+    entry = TraceEntry(stage="sentinel_ai", component="sentinel_ai", status="ERROR")
+
+    metrics.record_v3_response(OrchestratorV3Response(3, CTX, "DENY", (), (entry,)))
+
+    assert metrics.v3_component_errors.value("sentinel_ai", "none") == 1
+
+
+class Sink:
+    def __init__(self, durable: bool = True) -> None:
+        self.durable = durable
+
+    def append_batch(self, records: tuple[bytes, ...]) -> dict[str, Any]:
+        return {
+            "schema_version": AUDIT_APPEND_ACK_SCHEMA_VERSION,
+            "batch_sha256": audit_batch_sha256(records),
+            "record_count": len(records),
+            "durably_committed": self.durable,
+        }
+
+
+def _verify_v4(metrics: ShieldMetrics, **overrides: Any) -> dict[str, Any]:
+    fixture = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    receipt = fixture["receipt"]
+    kwargs: dict[str, Any] = {
+        "artifact_transport_hash": hashlib.sha256(json.dumps(receipt, sort_keys=True).encode()).hexdigest(),
+        "expected_context_hash": fixture["expected_context_hash"],
+        "expected_request_id": fixture["expected_request_id"],
+        "registry": load_key_registry(fixture["trusted_key_registry"]),
+        "minimum_registry_version": 1,
+        "verification_time": fixture["verification_time"],
+        "component_verifier": verify_test_only_component_signature,
+        "receipt_verifier": verify_test_only_orchestrator_signature,
+        "audit_sink": Sink(),
+        "metrics": metrics,
+    }
+    return verify_v4_receipt_with_audit(receipt, **{**kwargs, **overrides})
+
+
+def test_v4_results_are_counted_by_reason_id() -> None:
+    metrics = ShieldMetrics()
+
+    _verify_v4(metrics)
+    with pytest.raises(ShieldV4VerificationError):
+        _verify_v4(metrics, receipt_verifier=lambda entry, key: False)
+    with pytest.raises(ShieldV4AuditSinkError):
+        _verify_v4(metrics, audit_sink=Sink(durable=False))
+    with pytest.raises(ValueError):
+        _verify_v4(metrics, expected_context_hash="not-a-hash")
+
+    rendered = metrics.render()
+    assert 'shield_v4_verifications_total{reason_id="V4_VERIFY_OK"} 1' in rendered
+    assert 'shield_v4_verifications_total{reason_id="V4_SIGNATURE_INVALID"} 1' in rendered
+    assert 'shield_v4_verifications_total{reason_id="V4_AUDIT_SINK_FAILURE"} 1' in rendered
+    assert rendered.count("shield_v4_verifications_total{") == 3
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.tracing import NOOP_TRACER, PhaseSpans, traced, tracing_enabled
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+from shield_orchestrator.v4.component_verdicts import verify_test_only_component_signature
+from shield_orchestrator.v4.key_registry import load_key_registry
+from shield_orchestrator.v4.orchestrate import verify_test_only_orchestrator_signature
+from shield_orchestrator.v4.verification_audit import (
+    AUDIT_APPEND_ACK_SCHEMA_VERSION,
+    VERIFY_PHASES,
+    ShieldV4AuditSinkError,
+    ShieldV4VerificationError,
+    audit_batch_sha256,
+    verify_v4_receipt_with_audit,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE = ROOT / "tests/fixtures/v4/full_multi_repo_v4_allow_flow.json"
+CTX = "a" * 64
+SECRET = "SECRET-PAYLOAD-VALUE"
+V3_BRIDGES = ("sentinel_ai", "dqsn", "adn", "guardian_wallet", "qwg")
+
+
+class RecordingTracer:
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.ended: list[tuple[str, dict[str, Any], BaseException | None]] = []
+
+    def start_span(self, name: str, attributes: Mapping[str, Any]) -> Any:
+        self.started.append(name)
+        return name, dict(attributes)
+
+    def end_span(self, span: Any, attributes: Mapping[str, Any], error: BaseException | None) -> None:
+        name, started_with = span
+        self.ended.append((name, {**started_with, **attributes}, error))
+
+    def named(self, name: str) -> list[dict[str, Any]]:
+        return [attributes for ended, attributes, _ in self.ended if ended == name]
+
+
+class BrokenTracer:
+    def start_span(self, name: str, attributes: Mapping[str, Any]) -> Any:
+        if name.endswith("bridge"):
+            raise RuntimeError("collector down")
+        return name
+
+    def end_span(self, span: Any, attributes: Mapping[str, Any], error: BaseException | None) -> None:
+        raise RuntimeError("collector down")
+
+
+def _request(index: int = 0, deny: str | None = None) -> OrchestratorV3Request:
+    inputs = {
+        "sentinel_ai": {"telemetry": {"decision": "ALLOW", "secret": SECRET}},
+        "dqsn": {"signals": [{"decision": "ALLOW"}]},
+        "adn": {"events": [{"decision": "ALLOW"}]},
+        "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+        "qwg": {"risk_context": {"device_id": "ALLOW"}},
+    }
+    if deny == "adn":
+        inputs["adn"] = {"events": [{"decision": "DENY"}]}
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={"request_id": f"req-{index}", "context_hash": CTX, "component_inputs": inputs, "note": SECRET},
+    )
+
+
+def test_disabled_tracing_shares_one_no_op_context() -> None:
+    assert not tracing_enabled(None)
+    assert not tracing_enabled(NOOP_TRACER)
+    assert traced(None, "a") is traced(NOOP_TRACER, "b")
+    with traced(None, "a") as span:
+        span.set("outcome", "ALLOW")
+        assert span.attributes == {}
+    assert NOOP_TRACER.start_span("a", {}) is None
+    assert NOOP_TRACER.end_span(None, {}, None) is None
+
+
+def test_spans_receive_attributes_and_errors_and_survive_tracer_failures() -> None:
+    tracer = RecordingTracer()
+    with pytest.raises(ValueError), traced(tracer, "outer", component_id="qwg") as span:
+        span.set("reason_ids", ("QWG_DENY_KEY_RISK",))
+        raise ValueError("boom")
+
+    [(name, attributes, error)] = tracer.ended
+    assert (name, attributes) == ("outer", {"component_id": "qwg", "reason_ids": ("QWG_DENY_KEY_RISK",)})
+    assert isinstance(error, ValueError)
+
+    broken = BrokenTracer()
+    with traced(broken, "shield.v3.bridge") as span:
+        span.set("outcome", "ALLOW")
+    with traced(broken, "shield.v3.orchestrate"):
+        pass
+
+
+def test_phase_spans_end_each_phase_when_the_next_begins() -> None:
+    tracer = RecordingTracer()
+    phases = PhaseSpans(tracer, "job")
+    phases.enter("load")
+    phases.enter("save", record_count=2)
+    phases.scope.set("artifact_id", "qwg")
+    phases.close(RuntimeError("disk full"))
+    phases.close()
+
+    assert [(name, attributes) for name, attributes, _ in tracer.ended] == [
+        ("job.load", {}),
+        ("job.save", {"record_count": 2, "artifact_id": "qwg"}),
+    ]
+    assert [type(error) for _, _, error in tracer.ended] == [type(None), RuntimeError]
+    PhaseSpans(None, "job").enter("ignored")
+
+
+def test_orchestrate_emits_bridge_receipt_and_call_spans(fake_engines: Any) -> None:
+    tracer = RecordingTracer()
+
+    resp = orchestrate(_request(deny="adn"), options=OrchestratorV3Options(tracer=tracer))
+
+    assert resp == orchestrate(_request(deny="adn"))
+    assert tracer.started == ["shield.v3.orchestrate", *["shield.v3.bridge"] * 5, "shield.v3.build_receipt"]
+    bridges = tracer.named("shield.v3.bridge")
+    assert [span["component_id"] for span in bridges] == list(V3_BRIDGES)
+    assert bridges[2]["decision"] == "DENY"
+    assert bridges[2]["reason_ids"] == ("ADN_DENY_DEFENSE_TRIGGERED",)
+    assert tracer.named("shield.v3.build_receipt")[0]["outcome"] == "DENY"
+    assert tracer.named("shield.v3.orchestrate") == [{"outcome": "DENY", "reason_ids": resp.reason_ids}]
+    assert SECRET not in repr(tracer.ended)
+
+
+def test_tracing_never_changes_responses(fake_engines: Any) -> None:
+    options = OrchestratorV3Options(tracer=BrokenTracer(), max_workers=5)
+
+    assert orchestrate(_request(), options=options) == orchestrate(_request())
+    assert orchestrate_many([_request(0), _request(1)], options=options) == orchestrate_many([_request(0), _request(1)])
+    assert orchestrate(_request(), options=OrchestratorV3Options(tracer=NOOP_TRACER)) == orchestrate(_request())
+
+
+def test_batch_and_async_spans(fake_engines: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    tracer = RecordingTracer()
+    options = OrchestratorV3Options(tracer=tracer)
+
+    orchestrate_many([_request(0), _request(1)], options=options)
+
+    assert tracer.named("shield.v3.orchestrate_many") == [{"batch_size": 2, "outcomes": ("ALLOW", "ALLOW")}]
+    assert [span["batch_size"] for span in tracer.named("shield.v3.bridge")] == [2] * 5
+    assert len(tracer.named("shield.v3.build_receipt")) == 2
+
+    async def evaluate_v3_async(self: Any, request: Any) -> Any:
+        return DQSNBridge.evaluate_v3(self, request)
+
+    monkeypatch.setattr(DQSNBridge, "evaluate_v3_async", evaluate_v3_async, raising=False)
+    tracer = RecordingTracer()
+
+    resp = asyncio.run(orchestrate_async(_request(), options=OrchestratorV3Options(tracer=tracer)))
+
+    assert resp == orchestrate(_request())
+    assert sorted(span["component_id"] for span in tracer.named("shield.v3.bridge")) == sorted(V3_BRIDGES)
+    assert tracer.named("shield.v3.orchestrate") == [{"outcome": "ALLOW", "reason_ids": resp.reason_ids}]
+
+
+class Sink:
+    def __init__(self, durable: bool = True) -> None:
+        self.durable = durable
+
+    def append_batch(self, records: tuple[bytes, ...]) -> dict[str, Any]:
+        return {
+            "schema_version": AUDIT_APPEND_ACK_SCHEMA_VERSION,
+            "batch_sha256": audit_batch_sha256(records),
+            "record_count": len(records),
+            "durably_committed": self.durable,
+        }
+
+
+def _verify_v4(tracer: RecordingTracer, **overrides: Any) -> dict[str, Any]:
+    fixture = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    receipt = fixture["receipt"]
+    kwargs: dict[str, Any] = {
+        "artifact_transport_hash": hashlib.sha256(json.dumps(receipt, sort_keys=True).encode()).hexdigest(),
+        "expected_context_hash": fixture["expected_context_hash"],
+        "expected_request_id": fixture["expected_request_id"],
+        "registry": load_key_registry(fixture["trusted_key_registry"]),
+        "minimum_registry_version": 1,
+        "verification_time": fixture["verification_time"],
+        "component_verifier": verify_test_only_component_signature,
+        "receipt_verifier": verify_test_only_orchestrator_signature,
+        "audit_sink": Sink(),
+        "tracer": tracer,
+    }
+    return verify_v4_receipt_with_audit(receipt, **{**kwargs, **overrides})
+
+
+def test_v4_verification_emits_one_span_per_phase() -> None:
+    tracer = RecordingTracer()
+
+    result = _verify_v4(tracer)
+
+    assert result["final_outcome"] == "ALLOW"
+    assert tracer.started == ["shield.v4.verify_receipt", *(f"shield.v4.verify.{phase}" for phase in VERIFY_PHASES)]
+    assert tracer.named("shield.v4.verify_receipt") == [{"reason_id": "V4_VERIFY_OK"}]
+    assert tracer.named("shield.v4.verify.signatures")[0]["signature_count"] == 12
+    assert tracer.named("shield.v4.verify.audit_commit") == [{"record_count": 14}]
+    assert all(error is None for _, _, error in tracer.ended)
+
+
+def test_v4_rejections_end_the_failing_phase_with_its_reason_id() -> None:
+    tracer = RecordingTracer()
+    with pytest.raises(ShieldV4VerificationError):
+        _verify_v4(tracer, component_verifier=lambda entry, key: False)
+
+    assert tracer.started[-1] == "shield.v4.verify.signatures"
+    name, attributes, error = tracer.ended[-2]
+    assert name == "shield.v4.verify.signatures"
+    assert (attributes["reason_id"], isinstance(error, ShieldV4VerificationError)) == ("V4_SIGNATURE_INVALID", True)
+    assert attributes["artifact_id"] in V3_BRIDGES
+    assert tracer.named("shield.v4.verify_receipt") == [{"reason_id": "V4_SIGNATURE_INVALID"}]
+
+    tracer = RecordingTracer()
+    with pytest.raises(ShieldV4AuditSinkError):
+        _verify_v4(tracer, audit_sink=Sink(durable=False))
+    assert tracer.named("shield.v4.verify_receipt") == [{"reason_id": "V4_AUDIT_SINK_FAILURE"}]
+
+    tracer = RecordingTracer()
+    with pytest.raises(ValueError):
+        _verify_v4(tracer, expected_context_hash="not-a-hash")
+    assert tracer.ended[-1][1] == {}
+    assert tracer.started == ["shield.v4.verify_receipt", "shield.v4.verify.preflight"]
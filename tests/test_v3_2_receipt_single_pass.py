@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import copy
+import random
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v3.contracts import v3_2_receipt
+from shield_orchestrator.v3.contracts.v3_2_receipt import (
+    SUPPORTED_COMPONENTS,
+    build_receipt,
+    canonical_sha256,
+    validate_receipt,
+)
+
+CTX = "a" * 64
+EVID = "b" * 64
+DECISIONS = ("ALLOW", "ESCALATE", "DENY", "ERROR", "SKIPPED")
+FAMILIES = {
+    "adn": "defense_signal",
+    "dqsn": "network_observation",
+    "guardian_wallet": "wallet_context",
+    "qwg": "wallet_posture",
+    "sentinel_ai": "telemetry",
+}
+REASONS = {
+    "adn": "ADN_OK_COORDINATION_ALLOW",
+    "dqsn": "DQSN_OK_NETWORK_ALLOW",
+    "guardian_wallet": "GW_OK_HEALTHY_ALLOW",
+    "qwg": "QWG_OK_POSTURE_ALLOW",
+    "sentinel_ai": "SNTL_OK_TELEMETRY_ALLOW",
+}
+
+
+def verdict(component_id: str, decision: str = "ALLOW") -> dict[str, Any]:
+    return {
+        "component_id": component_id,
+        "contract_version": 3,
+        "schema_version": "shield.verdict.v1",
+        "request_id": "req-1",
+        "context_hash": CTX,
+        "decision": decision,
+        "reason_ids": [REASONS[component_id]],
+        "evidence_hash": EVID,
+        "evidence_families": [FAMILIES[component_id]],
+        "metadata": {"trace": [{"depth": 1}]},
+        "fail_closed": True,
+    }
+
+
+def receipt(decisions: dict[str, str] | None = None) -> dict[str, Any]:
+    decisions = decisions or {}
+    return build_receipt(
+        request_id="req-1",
+        context_hash=CTX,
+        component_verdicts=[verdict(c, decisions.get(c, "ALLOW")) for c in reversed(SUPPORTED_COMPONENTS)],
+    )
+
+
+def rehashed(value: dict[str, Any]) -> dict[str, Any]:
+    """Re-sign a tampered receipt the way an attacker would: hash its raw content."""
+    value["receipt_hash"] = canonical_sha256({**value, "receipt_hash": ""})
+    return value
+
+
+def _verdicts(r: dict[str, Any]) -> list[dict[str, Any]]:
+    return r["component_verdicts"]
+
+
+MUTATIONS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "unchanged": lambda r: r,
+    "not_a_dict": lambda r: list(r),
+    "extra_field": lambda r: {**r, "extra": True},
+    "schema_version": lambda r: {**r, "schema_version": "shield.receipt.v2"},
+    "contract_version_float": lambda r: {**r, "contract_version": 3.0},
+    "contract_version_bool": lambda r: {**r, "contract_version": True},
+    "fail_closed_int": lambda r: {**r, "fail_closed": 1},
+    "request_id_padded": lambda r: {**r, "request_id": " req-1 "},
+    "request_id_empty": lambda r: {**r, "request_id": "  "},
+    "request_id_int": lambda r: {**r, "request_id": 7},
+    "context_hash_upper": lambda r: {**r, "context_hash": CTX.upper()},
+    "context_hash_other": lambda r: {**r, "context_hash": "c" * 64},
+    "verdicts_tuple": lambda r: {**r, "component_verdicts": tuple(_verdicts(r))},
+    "verdicts_unsorted": lambda r: {**r, "component_verdicts": _verdicts(r)[::-1]},
+    "verdict_missing": lambda r: {**r, "component_verdicts": _verdicts(r)[1:]},
+    "verdict_duplicated": lambda r: {**r, "component_verdicts": [_verdicts(r)[0], *_verdicts(r)[:-1]]},
+    "verdict_padded_id_extra": lambda r: {
+        **r,
+        "component_verdicts": [{**_verdicts(r)[0], "component_id": " adn"}, *_verdicts(r)],
+    },
+    "verdict_decision": lambda r: _set_verdict(r, 2, "decision", "DENY"),
+    "verdict_metadata": lambda r: _set_verdict(r, 3, "metadata", {"note": "changed"}),
+    "verdict_metadata_authority": lambda r: _set_verdict(r, 3, "metadata", {"nested": {"override": 1}}),
+    "verdict_metadata_nan": lambda r: _set_verdict(r, 3, "metadata", {"score": float("nan")}),
+    "verdict_metadata_set": lambda r: _set_verdict(r, 3, "metadata", {"score": {1}}),
+    "verdict_context": lambda r: _set_verdict(r, 0, "context_hash", "c" * 64),
+    "verdict_contract_float": lambda r: _set_verdict(r, 1, "contract_version", 3.0),
+    "verdict_families_unhashable": lambda r: _set_verdict(r, 1, "evidence_families", [["network_observation"]]),
+    "verdict_not_a_dict": lambda r: {**r, "component_verdicts": [*_verdicts(r)[:4], "qwg"]},
+    "final_outcome": lambda r: {**r, "final_outcome": "DENY"},
+    "dominant_reason_ids_tuple": lambda r: {**r, "dominant_reason_ids": tuple(r["dominant_reason_ids"])},
+    "handoff_int": lambda r: {**r, "adamantineos_handoff": {**r["adamantineos_handoff"], "handoff_allowed": 1}},
+    "handoff_extra": lambda r: {**r, "adamantineos_handoff": {**r["adamantineos_handoff"], "x": 1}},
+    "receipt_hash_other": lambda r: {**r, "receipt_hash": "c" * 64},
+    "receipt_hash_upper": lambda r: {**r, "receipt_hash": r["receipt_hash"].upper()},
+    "receipt_hash_list": lambda r: {**r, "receipt_hash": [r["receipt_hash"]]},
+}
+
+
+def _set_verdict(r: dict[str, Any], index: int, field: str, value: Any) -> dict[str, Any]:
+    verdicts = [dict(item) if isinstance(item, dict) else item for item in _verdicts(r)]
+    verdicts[index][field] = value
+    return {**r, "component_verdicts": verdicts}
+
+
+def _decide(validate: Callable[..., dict[str, Any]], candidate: Any, expected_context_hash: str) -> Any:
+    try:
+        return "accept", repr(validate(copy.deepcopy(candidate), expected_context_hash=expected_context_hash))
+    except Exception as error:
+        return "reject", type(error), str(error)
+
+
+def _assert_same_decision(candidate: Any, expected_context_hash: str = CTX) -> Any:
+    single_pass = _decide(validate_receipt, candidate, expected_context_hash)
+    assert single_pass == _decide(v3_2_receipt._validate_receipt_by_rebuild, candidate, expected_context_hash)
+    return single_pass
+
+
+@pytest.mark.parametrize("decisions", [{}, {"qwg": "ESCALATE"}, {"adn": "DENY"}, {"dqsn": "ERROR"}, {"qwg": "SKIPPED"}])
+@pytest.mark.parametrize("name", sorted(MUTATIONS))
+@pytest.mark.parametrize("resign", [False, True])
+def test_single_pass_matches_rebuild_for_every_mutation(decisions: dict[str, str], name: str, resign: bool) -> None:
+    candidate = MUTATIONS[name](receipt(decisions))
+    if resign and isinstance(candidate, dict) and isinstance(candidate.get("receipt_hash"), str):
+        try:
+            candidate = rehashed(candidate)
+        except (TypeError, ValueError):
+            pass
+
+    _assert_same_decision(candidate)
+    _assert_same_decision(candidate, expected_context_hash="c" * 64)
+    _assert_same_decision(candidate, expected_context_hash="bad")
+
+
+def test_random_mutations_match_rebuild() -> None:
+    rng = random.Random(20261018)
+    names = sorted(MUTATIONS)
+    accepted = 0
+    for _ in range(300):
+        candidate = receipt({c: rng.choice(DECISIONS) for c in SUPPORTED_COMPONENTS})
+        for name in rng.sample(names, rng.randint(0, 3)):
+            if isinstance(candidate, dict) and set(candidate) == v3_2_receipt.REQUIRED_RECEIPT_FIELDS:
+                candidate = MUTATIONS[name](candidate)
+        if rng.random() < 0.5 and isinstance(candidate, dict) and isinstance(candidate.get("receipt_hash"), str):
+            try:
+                candidate = rehashed(candidate)
+            except (TypeError, ValueError):
+                pass
+        accepted += _assert_same_decision(candidate)[0] == "accept"
+    assert 0 < accepted < 300
+
+
+def test_built_receipts_take_the_single_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_rebuild(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("rebuilt")
+
+    expected = receipt({"adn": "DENY"})
+    monkeypatch.setattr(v3_2_receipt, "_validate_receipt_by_rebuild", no_rebuild)
+
+    checked = validate_receipt(copy.deepcopy(expected), expected_context_hash=CTX)
+
+    assert checked == expected
+    assert checked["component_verdicts"][0] is not expected["component_verdicts"][0]
+    with pytest.raises(AssertionError, match="rebuilt"):
+        validate_receipt({**expected, "final_outcome": "ALLOW"}, expected_context_hash=CTX)
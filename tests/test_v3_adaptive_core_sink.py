@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.adaptive_core_bridge import AdaptiveCoreBridge
+from shield_orchestrator.bridges.adaptive_core_sink import QUEUED_TRACE_ENTRY, AdaptiveCoreSink
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, TraceEntry
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+
+CTX = "a" * 64
+REAL_REPORT = AdaptiveCoreBridge.report_v3
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(index: int = 0) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={"request_id": f"req-{index}", "context_hash": CTX},
+    )
+
+
+class GatedReports:
+    """Patched AdaptiveCoreBridge.report_v3 that holds the sink worker until released."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.nonces: list[str] = []
+
+    def __call__(self, bridge: Any, request: OrchestratorV3Request, **kwargs: Any) -> TraceEntry:
+        self.started.set()
+        self.release.wait(5)
+        self.nonces.append(request.nonce)
+        return REAL_REPORT(bridge, request, **kwargs)
+
+
+@pytest.fixture
+def gated(monkeypatch: pytest.MonkeyPatch) -> Iterator[GatedReports]:
+    reports = GatedReports()
+
+    def report_v3(self: Any, request: OrchestratorV3Request, **kwargs: Any) -> TraceEntry:
+        return reports(self, request, **kwargs)
+
+    monkeypatch.setattr(AdaptiveCoreBridge, "report_v3", report_v3)
+    yield reports
+    reports.release.set()
+
+
+def test_sink_moves_reports_off_the_request_path(fake_engines: Any) -> None:
+    entries: list[TraceEntry] = []
+    sink = AdaptiveCoreSink(on_report=entries.append)
+    options = OrchestratorV3Options(adaptive_core_sink=sink)
+    requests = [_request(index) for index in range(3)]
+
+    single = [orchestrate(request, options=options) for request in requests]
+    batch = orchestrate_many(requests, options=options)
+    inline = [orchestrate(request) for request in requests]
+
+    assert sink.flush(timeout=5)
+    for queued, direct in zip(single, inline, strict=True):
+        assert queued.trace[-1] == QUEUED_TRACE_ENTRY
+        assert (queued.outcome, queued.reason_ids, queued.receipt) == (direct.outcome, direct.reason_ids, direct.receipt)
+        assert queued.trace[:-1] == direct.trace[:-1]
+    assert batch == single
+    assert entries == [resp.trace[-1] for resp in inline] * 2
+    stats = sink.stats()
+    assert (stats.submitted, stats.reported, stats.failed, stats.dropped, stats.pending) == (6, 6, 0, 0, 0)
+    sink.shutdown()
+
+
+def test_slow_sink_does_not_delay_responses(fake_engines: Any, gated: GatedReports) -> None:
+    clock = FakeClock()
+    sink = AdaptiveCoreSink(clock=clock)
+    options = OrchestratorV3Options(adaptive_core_sink=sink)
+
+    first = orchestrate(_request(0), options=options)
+    assert gated.started.wait(5)
+    second = orchestrate(_request(1), options=options)
+    clock.now = 2.5
+
+    assert first.trace[-1] == second.trace[-1] == QUEUED_TRACE_ENTRY
+    assert not sink.flush(timeout=0.01)
+    stats = sink.stats()
+    assert (stats.pending, stats.lag_seconds, stats.reported) == (1, 2.5, 0)
+
+    gated.release.set()
+    assert sink.flush(timeout=5)
+    stats = sink.stats()
+    assert (stats.pending, stats.lag_seconds, stats.max_lag_seconds, stats.reported) == (0, 0.0, 2.5, 2)
+    sink.shutdown()
+
+
+def test_drop_oldest_policy_discards_the_oldest_pending_report(gated: GatedReports) -> None:
+    sink = AdaptiveCoreSink(max_queue=2, policy="drop_oldest")
+
+    entry = sink.report_v3(_request(0), outcome="ALLOW", reason_ids=())
+    assert gated.started.wait(5)
+    for index in range(1, 4):
+        sink.report_v3(_request(index), outcome="ALLOW", reason_ids=())
+    assert sink.stats().dropped == 1
+
+    gated.release.set()
+    assert sink.flush(timeout=5)
+    assert entry == QUEUED_TRACE_ENTRY
+    assert gated.nonces == ["nonce-0", "nonce-2", "nonce-3"]
+    stats = sink.stats()
+    assert (stats.submitted, stats.reported, stats.dropped, stats.policy) == (4, 3, 1, "drop_oldest")
+    sink.shutdown()
+
+
+def test_block_policy_waits_for_room_then_drops_on_timeout(gated: GatedReports) -> None:
+    sink = AdaptiveCoreSink(max_queue=1, policy="block", block_timeout_seconds=0.02)
+
+    sink.report_v3(_request(0), outcome="ALLOW", reason_ids=())
+    assert gated.started.wait(5)
+    sink.report_v3(_request(1), outcome="ALLOW", reason_ids=())
+    sink.report_v3(_request(2), outcome="ALLOW", reason_ids=())
+    assert sink.stats().dropped == 1
+
+    unbounded = AdaptiveCoreSink(max_queue=1, policy="block")
+    unbounded.report_v3(_request(3), outcome="ALLOW", reason_ids=())
+    unbounded.report_v3(_request(4), outcome="ALLOW", reason_ids=())
+    blocked = threading.Thread(target=unbounded.report_v3, args=(_request(5),), kwargs={"outcome": "ALLOW", "reason_ids": ()})
+    blocked.start()
+    blocked.join(0.05)
+    assert blocked.is_alive()
+
+    gated.release.set()
+    blocked.join(5)
+    assert sink.flush(timeout=5) and unbounded.flush(timeout=5)
+    assert sorted(gated.nonces) == ["nonce-0", "nonce-1", "nonce-3", "nonce-4", "nonce-5"]
+    assert unbounded.stats().dropped == 0
+    sink.shutdown()
+    unbounded.shutdown()
+
+
+def test_sink_failures_are_counted_and_never_reach_the_response(
+    fake_engines: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def boom(*args: Any, **kwargs: Any) -> TraceEntry:
+        raise RuntimeError("sink failed")
+
+    monkeypatch.setattr(AdaptiveCoreBridge, "report_v3", boom)
+    sink = AdaptiveCoreSink()
+
+    resp = orchestrate(_request(), options=OrchestratorV3Options(adaptive_core_sink=sink))
+
+    assert sink.flush(timeout=5)
+    assert resp.trace[-1] == QUEUED_TRACE_ENTRY
+    assert (sink.stats().failed, sink.stats().reported) == (1, 0)
+    sink.shutdown()
+
+
+def test_shutdown_drains_pending_reports_and_drops_later_ones(gated: GatedReports) -> None:
+    sink = AdaptiveCoreSink()
+    sink.report_v3(_request(0), outcome="ALLOW", reason_ids=())
+    assert gated.started.wait(5)
+    sink.report_v3(_request(1), outcome="ALLOW", reason_ids=())
+
+    sink.shutdown(wait=False)
+    sink.report_v3(_request(2), outcome="ALLOW", reason_ids=())
+    gated.release.set()
+    sink.shutdown()
+
+    stats = sink.stats()
+    assert gated.nonces == ["nonce-0", "nonce-1"]
+    assert (stats.reported, stats.dropped, stats.closed) == (2, 1, True)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"max_queue": 0}, "max_queue must be a positive integer"),
+        ({"max_queue": True}, "max_queue must be a positive integer"),
+        ({"policy": "drop_newest"}, "policy must be"),
+        ({"block_timeout_seconds": 0}, "block_timeout_seconds must be a positive number"),
+        ({"block_timeout_seconds": True}, "block_timeout_seconds must be a positive number"),
+    ],
+)
+def test_sink_rejects_invalid_configuration(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        AdaptiveCoreSink(**kwargs)
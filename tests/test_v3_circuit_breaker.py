@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.circuit_breaker import CircuitBreaker, CircuitBreakers
+from shield_orchestrator.bridges.component_bridge import CIRCUIT_OPEN_NOTE
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import (
+    COMPONENT_BRIDGES,
+    DEADLINE_EXCEEDED_NOTE,
+    orchestrate,
+    orchestrate_many,
+)
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+
+CTX = "a" * 64
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(index: int, *, adn: str = "ALLOW") -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+                "dqsn": {"signals": [{"decision": "ALLOW"}]},
+                "adn": {"events": [{"decision": adn}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+                "qwg": {"risk_context": {"device_id": "ALLOW"}},
+            },
+        },
+    )
+
+
+def _adn_note(resp: OrchestratorV3Response) -> str | None:
+    return next(entry.notes for entry in resp.trace if entry.stage == "adn")
+
+
+def test_breaker_opens_half_opens_and_closes() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "open"
+
+    clock.now = 10
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+
+    stats = breaker.stats()
+    assert (stats.state, stats.consecutive_failures, stats.short_circuited) == ("closed", 1, 2)
+    assert (stats.opened, stats.half_opened, stats.closed) == (2, 2, 1)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"failure_threshold": 0}, "failure_threshold must be a positive integer"),
+        ({"failure_threshold": True}, "failure_threshold must be a positive integer"),
+        ({"half_open_max_calls": 0}, "half_open_max_calls must be a positive integer"),
+        ({"reset_timeout_seconds": -1}, "reset_timeout_seconds must be a non-negative number"),
+        ({"reset_timeout_seconds": "5"}, "reset_timeout_seconds must be a non-negative number"),
+    ],
+)
+def test_breaker_rejects_invalid_configuration(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        CircuitBreaker(**kwargs)
+
+
+def test_open_breaker_short_circuits_without_calling_the_engine(fake_engines: Any) -> None:
+    clock = FakeClock()
+    breakers = CircuitBreakers.for_bridges(
+        COMPONENT_BRIDGES,
+        failure_threshold=5,
+        failure_thresholds={"adn": 2},
+        reset_timeout_seconds=30,
+        clock=clock,
+    )
+    options = OrchestratorV3Options(circuit_breakers=breakers)
+
+    notes = [_adn_note(orchestrate(_request(index, adn="RAISE"), options=options)) for index in range(2)]
+    calls_when_opened = fake_engines.single_calls
+    short_circuited = orchestrate(_request(2), options=options)
+
+    assert notes == ["component_engine_unavailable_or_failed"] * 2
+    assert _adn_note(short_circuited) == CIRCUIT_OPEN_NOTE
+    assert short_circuited.outcome == "DENY"
+    assert fake_engines.single_calls == calls_when_opened
+    assert breakers.get("sentinel_ai").state == "closed"  # type: ignore[union-attr]
+
+    clock.now = 30
+    recovered = orchestrate(_request(3), options=options)
+
+    assert recovered.outcome == "ALLOW"
+    assert breakers.stats()["adn"].closed == 1
+
+
+def test_batch_path_records_failures_and_short_circuits(
+    fake_engines: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    breakers = CircuitBreakers.for_bridges(COMPONENT_BRIDGES, failure_threshold=3)
+    options = OrchestratorV3Options(circuit_breakers=breakers)
+
+    orchestrate_many([_request(0, adn="RAISE"), _request(1)], options=options)
+    assert breakers.stats()["adn"].consecutive_failures == 0
+
+    orchestrate_many([_request(2, adn="RAISE"), _request(3, adn="RAISE")], options=options)
+    monkeypatch.setitem(sys.modules, "adn_v3", None)
+    orchestrate_many([_request(4)], options=options)
+    assert breakers.get("adn").state == "open"  # type: ignore[union-attr]
+
+    responses = orchestrate_many([_request(5), _request(6)], options=options)
+
+    assert [_adn_note(resp) for resp in responses] == [CIRCUIT_OPEN_NOTE] * 2
+    assert breakers.stats()["adn"].short_circuited == 1
+
+
+def test_timeouts_count_as_breaker_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    def hung(self: Any, payload: Any, *, request_id: str) -> Any:
+        release.wait(5)
+        return {"decision": "ALLOW"}
+
+    monkeypatch.setattr(ADNBridge, "_evaluate_engine", hung)
+    breakers = CircuitBreakers.for_bridges(COMPONENT_BRIDGES, failure_threshold=1)
+    options = OrchestratorV3Options(circuit_breakers=breakers, component_timeouts={"adn": 0.05})
+    try:
+        first = orchestrate(_request(0), options=options)
+        second = orchestrate(_request(1), options=options)
+    finally:
+        release.set()
+
+    assert _adn_note(first) == DEADLINE_EXCEEDED_NOTE
+    assert _adn_note(second) == CIRCUIT_OPEN_NOTE
+
+
+@pytest.mark.parametrize(
+    "run",
+    [orchestrate, lambda request, **kwargs: asyncio.run(orchestrate_async(request, **kwargs))],
+    ids=["sync", "async"],
+)
+def test_late_successes_of_timed_out_calls_do_not_reset_the_breaker(
+    monkeypatch: pytest.MonkeyPatch,
+    run: Any,
+) -> None:
+    finished = threading.Semaphore(0)
+    evaluate_v3 = ADNBridge.evaluate_v3
+
+    def slow(self: Any, payload: Any, *, request_id: str) -> Any:
+        time.sleep(0.3)
+        return {"decision": "ALLOW"}
+
+    def tracked(self: Any, request: Any) -> Any:
+        try:
+            return evaluate_v3(self, request)
+        finally:
+            finished.release()
+
+    monkeypatch.setattr(ADNBridge, "_evaluate_engine", slow)
+    monkeypatch.setattr(ADNBridge, "evaluate_v3", tracked)
+    breakers = CircuitBreakers.for_bridges(COMPONENT_BRIDGES, failure_threshold=3)
+    options = OrchestratorV3Options(circuit_breakers=breakers, component_timeouts={"adn": 0.05})
+
+    for index in range(3):
+        assert _adn_note(run(_request(index), options=options)) == DEADLINE_EXCEEDED_NOTE
+        # Let the abandoned call succeed before the next request.
+        assert finished.acquire(timeout=5)
+
+    assert breakers.get("adn").state == "open"  # type: ignore[union-attr]
+    assert _adn_note(run(_request(3), options=options)) == CIRCUIT_OPEN_NOTE
+
+
+def test_abandoned_bridges_count_one_failure_and_drop_later_outcomes() -> None:
+    breaker = CircuitBreaker(failure_threshold=5)
+    bridge = ADNBridge(circuit_breaker=breaker)
+
+    bridge.abandon()
+    bridge.abandon()
+    bridge._record_engine_outcome(True)
+
+    assert breaker.stats().consecutive_failures == 1
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import copy
+import itertools
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v3.contracts import v3_2_receipt
+from shield_orchestrator.v3.contracts.v3_2_receipt import (
+    SUPPORTED_COMPONENTS,
+    VERDICT_SCHEMA_VERSION,
+    VERDICT_VALIDATOR,
+    compile_verdict_validator,
+    validate_component_verdict,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+CTX = "a" * 64
+EVID = "b" * 64
+FAMILIES = {
+    "adn": "defense_signal",
+    "dqsn": "network_observation",
+    "guardian_wallet": "wallet_context",
+    "qwg": "wallet_posture",
+    "sentinel_ai": "telemetry",
+}
+REASONS = {
+    "adn": "ADN_OK_COORDINATION_ALLOW",
+    "dqsn": "DQSN_OK_NETWORK_ALLOW",
+    "guardian_wallet": "GW_OK_HEALTHY_ALLOW",
+    "qwg": "QWG_OK_POSTURE_ALLOW",
+    "sentinel_ai": "SNTL_OK_TELEMETRY_ALLOW",
+}
+HASHES = [CTX, EVID, "c" * 64, CTX.upper(), " " + "a" * 63, "0x" + "a" * 62, "a_" + "a" * 62, "a" * 63, "g" * 64, 7, None]
+# Field values that probe every branch of the reference checks, including the
+# lenient ones it accepts (padded strings, equal-but-not-identical numbers).
+FIELD_VALUES: dict[str, list[Any]] = {
+    "component_id": ["adn", " adn ", "qwg", "ADN", "", "  ", 3, ["adn"], None],
+    "contract_version": [3, 3.0, True, 2, "3", None],
+    "schema_version": [VERDICT_SCHEMA_VERSION, "shield.verdict.v2", None],
+    "context_hash": HASHES,
+    "decision": ["ALLOW", "DENY", "SKIPPED", " DENY ", "allow", "", 1, ["ALLOW"]],
+    "reason_ids": [
+        ["ADN_OK_COORDINATION_ALLOW"],
+        [" ADN_OK_COORDINATION_ALLOW"],
+        ["ADN_OK_COORDINATION_ALLOW", "ADN_DENY_DEFENSE_TRIGGERED"],
+        ["QWG_DENY_KEY_RISK"],
+        [],
+        ("ADN_OK_COORDINATION_ALLOW",),
+        [["ADN_OK_COORDINATION_ALLOW"]],
+        [""],
+        "ADN_OK_COORDINATION_ALLOW",
+    ],
+    "evidence_hash": HASHES,
+    "evidence_families": [
+        ["defense_signal"],
+        ["defense_signal", "policy_context"],
+        ["defense_signal", "defense_signal"],
+        ["defense_signal", " defense_signal"],
+        ["telemetry"],
+        [],
+        [["defense_signal"]],
+        [{"defense_signal": 1}],
+        [3],
+        ("defense_signal",),
+    ],
+    "metadata": [
+        {},
+        {"trace": [{"depth": [{"x": 1}]}]},
+        {"override": False},
+        {"trace": [{"nested": {"can_sign": 1}}]},
+        {"trace": ({"override": 1},)},
+        [],
+        None,
+    ],
+    "fail_closed": [True, 1, False, None],
+}
+
+
+def verdict(component_id: str = "adn") -> dict[str, Any]:
+    return {
+        "component_id": component_id,
+        "contract_version": 3,
+        "schema_version": VERDICT_SCHEMA_VERSION,
+        "request_id": "req-1",
+        "context_hash": CTX,
+        "decision": "ALLOW",
+        "reason_ids": [REASONS[component_id]],
+        "evidence_hash": EVID,
+        "evidence_families": [FAMILIES[component_id]],
+        "metadata": {"bridge_source": "engine", "samples": [{"score": 0.5}]},
+        "fail_closed": True,
+    }
+
+
+def _decide(validate: Any, candidate: Any, expected_context_hash: Any) -> Any:
+    try:
+        return "accept", repr(validate(copy.deepcopy(candidate), expected_context_hash=expected_context_hash))
+    except Exception as error:
+        return "reject", type(error), str(error)
+
+
+def _assert_same_decision(candidate: Any, expected_context_hash: Any = CTX) -> Any:
+    compiled = _decide(VERDICT_VALIDATOR.validate, candidate, expected_context_hash)
+    assert compiled == _decide(v3_2_receipt._validate_component_verdict_reference, candidate, expected_context_hash)
+    return compiled
+
+
+@pytest.mark.parametrize("component_id", SUPPORTED_COMPONENTS)
+@pytest.mark.parametrize("field", sorted(FIELD_VALUES))
+def test_each_field_value_is_decided_like_the_reference(component_id: str, field: str) -> None:
+    for value in FIELD_VALUES[field]:
+        for expected_context_hash in (CTX, "c" * 64, CTX.upper(), None):
+            _assert_same_decision({**verdict(component_id), field: value}, expected_context_hash)
+
+
+def test_field_pairs_keep_the_reference_check_order() -> None:
+    decisions = set()
+    for (first, first_values), (second, second_values) in itertools.combinations(sorted(FIELD_VALUES.items()), 2):
+        for first_value, second_value in itertools.product(first_values, second_values):
+            decisions.add(_assert_same_decision({**verdict(), first: first_value, second: second_value})[0])
+    assert decisions == {"accept", "reject"}
+
+
+@pytest.mark.parametrize(
+    "candidate",
+    [
+        "not-a-dict",
+        {k: v for k, v in verdict().items() if k != "metadata"},
+        {**verdict(), "extra": True},
+    ],
+)
+def test_shape_errors_match_the_reference(candidate: Any) -> None:
+    assert _assert_same_decision(candidate)[0] == "reject"
+
+
+def test_accepted_verdicts_are_copies() -> None:
+    original = verdict("qwg")
+
+    checked = validate_component_verdict(original, expected_context_hash=CTX)
+
+    assert checked == original
+    assert checked is not original
+
+
+def test_validators_are_compiled_once_per_schema_version() -> None:
+    assert compile_verdict_validator() is compile_verdict_validator(VERDICT_SCHEMA_VERSION) is VERDICT_VALIDATOR
+    assert VERDICT_VALIDATOR.schema_version == VERDICT_SCHEMA_VERSION
+    with pytest.raises(ValueError, match="unsupported verdict schema_version"):
+        compile_verdict_validator("shield.verdict.v2")
+
+
+def test_benchmark_script_compiles() -> None:
+    path = ROOT / "scripts/benchmark_v3_verdict_validator.py"
+    compile(path.read_text(encoding="utf-8"), str(path), "exec")
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.v3.orchestrate as orchestrate_module
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.contracts.reason_ids import ReasonId
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+CTX = "a" * 64
+REQ = "req-concurrent-fanout"
+BRIDGES = (SentinelBridge, DQSNBridge, ADNBridge, GuardianWalletBridge, QWGBridge)
+
+
+def _request() -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce="nonce-1",
+        ttl_seconds=60,
+        payload={
+            "request_id": REQ,
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {}},
+                "dqsn": {"signals": []},
+                "adn": {"events": []},
+                "guardian_wallet": {"wallet_ctx": {}},
+                "qwg": {"risk_context": {}},
+            },
+        },
+    )
+
+
+def _patch_engines(monkeypatch: pytest.MonkeyPatch, *, decisions: dict[str, str] | None = None) -> None:
+    decisions = decisions or {}
+    for bridge_cls in BRIDGES:
+        component = bridge_cls.COMPONENT
+
+        def engine(self: Any, payload: Any, *, request_id: str, _component: str = component) -> dict[str, Any]:
+            return {"decision": decisions.get(_component, "ALLOW"), "component": _component}
+
+        monkeypatch.setattr(bridge_cls, "_evaluate_engine", engine)
+
+
+@pytest.mark.parametrize("decisions", [{}, {"adn": "BLOCK"}, {"qwg": "WARN"}, {"dqsn": "???"}])
+def test_concurrent_fanout_matches_sequential_byte_for_byte(
+    monkeypatch: pytest.MonkeyPatch,
+    decisions: dict[str, str],
+) -> None:
+    _patch_engines(monkeypatch, decisions=decisions)
+
+    sequential = orchestrate(_request())
+    concurrent = orchestrate(_request(), options=OrchestratorV3Options(max_workers=5))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        shared = orchestrate(_request(), options=OrchestratorV3Options(executor=pool))
+
+    assert concurrent == sequential
+    assert shared == sequential
+    assert [entry.stage for entry in concurrent.trace[1:6]] == [
+        "sentinel_ai",
+        "dqsn",
+        "adn",
+        "guardian_wallet",
+        "qwg",
+    ]
+
+
+def test_concurrent_fanout_runs_bridges_in_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    barrier = threading.Barrier(len(BRIDGES), timeout=5)
+    for bridge_cls in BRIDGES:
+        component = bridge_cls.COMPONENT
+
+        def engine(self: Any, payload: Any, *, request_id: str, _component: str = component) -> dict[str, Any]:
+            barrier.wait()
+            return {"decision": "ALLOW", "component": _component}
+
+        monkeypatch.setattr(bridge_cls, "_evaluate_engine", engine)
+
+    resp = orchestrate(_request(), options=OrchestratorV3Options(max_workers=8))
+
+    assert resp.outcome == "ALLOW"
+    assert not barrier.broken
+
+
+@pytest.mark.parametrize(
+    "error, reason_id",
+    [
+        (TypeError("not serializable"), ReasonId.HASHING_FAILED.value),
+        (RuntimeError("component exploded"), ReasonId.COMPONENT_ERROR.value),
+    ],
+)
+def test_concurrent_fanout_keeps_fail_closed_mapping(
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception,
+    reason_id: str,
+) -> None:
+    def boom(self: Any, request: Any) -> Any:
+        raise error
+
+    monkeypatch.setattr(orchestrate_module.DQSNBridge, "evaluate_v3", boom)
+
+    sequential = orchestrate(_request())
+    concurrent = orchestrate(_request(), options=OrchestratorV3Options(max_workers=3))
+
+    assert concurrent == sequential
+    assert concurrent.outcome == "DENY"
+    assert concurrent.reason_ids == (reason_id,)
+
+
+@pytest.mark.parametrize("max_workers", [0, -1, True, 1.5, "2"])
+def test_options_reject_invalid_max_workers(max_workers: Any) -> None:
+    with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+        OrchestratorV3Options(max_workers=max_workers)
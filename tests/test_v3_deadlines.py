@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.v3.orchestrate as orchestrate_module
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.contracts.reason_ids import ReasonId
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import DEADLINE_EXCEEDED_NOTE, orchestrate, orchestrate_many
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+
+CTX = "a" * 64
+BRIDGES = (SentinelBridge, DQSNBridge, ADNBridge, GuardianWalletBridge, QWGBridge)
+
+
+def _request(nonce: str = "nonce-1", *, ttl_seconds: int = 60) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=nonce,
+        ttl_seconds=ttl_seconds,
+        payload={
+            "request_id": f"req-{nonce}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {}},
+                "dqsn": {"signals": []},
+                "adn": {"events": []},
+                "guardian_wallet": {"wallet_ctx": {}},
+                "qwg": {"risk_context": {}},
+            },
+        },
+    )
+
+
+@pytest.fixture
+def release() -> Iterator[threading.Event]:
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def _patch_engines(monkeypatch: pytest.MonkeyPatch, release: threading.Event, *, hung: set[str]) -> None:
+    for bridge_cls in BRIDGES:
+        component = bridge_cls.COMPONENT
+
+        def engine(self: Any, payload: Any, *, request_id: str, _component: str = component) -> dict[str, Any]:
+            if _component in hung:
+                release.wait(5)
+            return {"decision": "ALLOW", "component": _component}
+
+        monkeypatch.setattr(bridge_cls, "_evaluate_engine", engine)
+
+
+def _notes(resp: OrchestratorV3Response) -> dict[str, str | None]:
+    return {entry.stage: entry.notes for entry in resp.trace[1:6]}
+
+
+@pytest.mark.parametrize("max_workers", [1, 5])
+def test_component_timeout_yields_error_verdict_instead_of_blocking(
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+    max_workers: int,
+) -> None:
+    _patch_engines(monkeypatch, release, hung={"adn"})
+    options = OrchestratorV3Options(max_workers=max_workers, component_timeouts={"adn": 0.05})
+
+    began = time.monotonic()
+    resp = orchestrate(_request(), options=options)
+
+    assert time.monotonic() - began < 2
+    assert resp.outcome == "DENY"
+    assert _notes(resp)["adn"] == DEADLINE_EXCEEDED_NOTE
+    assert _notes(resp)["qwg"] == "real_component_engine"
+    adn = next(entry for entry in resp.trace if entry.stage == "adn")
+    assert adn.status == "ERROR"
+
+
+def test_sequential_deadline_skips_bridges_not_yet_started(
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+) -> None:
+    _patch_engines(monkeypatch, release, hung={"adn"})
+
+    resp = orchestrate(_request(), options=OrchestratorV3Options(deadline_seconds=0.05))
+
+    assert _notes(resp) == {
+        "sentinel_ai": "real_component_engine",
+        "dqsn": "real_component_engine",
+        "adn": DEADLINE_EXCEEDED_NOTE,
+        "guardian_wallet": DEADLINE_EXCEEDED_NOTE,
+        "qwg": DEADLINE_EXCEEDED_NOTE,
+    }
+
+
+def test_bounded_fast_bridges_match_unbounded_response(
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+) -> None:
+    _patch_engines(monkeypatch, release, hung=set())
+    expected = orchestrate(_request())
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        shared = orchestrate(_request(), options=OrchestratorV3Options(executor=pool, enforce_ttl_deadline=True))
+    ttl = orchestrate(_request(), options=OrchestratorV3Options(enforce_ttl_deadline=True))
+    partial = orchestrate(_request(), options=OrchestratorV3Options(component_timeouts={"qwg": 30}))
+
+    assert shared == expected
+    assert ttl == expected
+    assert partial == expected
+
+
+def test_bridge_raising_timeout_error_is_a_component_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def boom(self: Any, request: Any) -> Any:
+        raise TimeoutError("engine gave up")
+
+    monkeypatch.setattr(orchestrate_module.DQSNBridge, "evaluate_v3", boom)
+
+    resp = orchestrate(_request(), options=OrchestratorV3Options(deadline_seconds=5))
+
+    assert resp.reason_ids == (ReasonId.COMPONENT_ERROR.value,)
+
+
+def test_orchestrate_many_times_out_a_hung_bridge_for_every_item(
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+) -> None:
+    _patch_engines(monkeypatch, release, hung=set())
+
+    def hung_batch(self: Any, items: Any) -> list[Any]:
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(ADNBridge, "evaluate_v3_many", hung_batch)
+    requests = [_request("nonce-1", ttl_seconds=60), _request("nonce-2", ttl_seconds=1)]
+    options = OrchestratorV3Options(max_workers=5, component_timeouts={"adn": 0.05}, enforce_ttl_deadline=True)
+
+    responses = orchestrate_many(requests, options=options)
+
+    assert [_notes(resp)["adn"] for resp in responses] == [DEADLINE_EXCEEDED_NOTE] * 2
+    assert [resp.outcome for resp in responses] == ["DENY", "DENY"]
+
+
+def test_orchestrate_async_times_out_hung_bridges(
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+) -> None:
+    _patch_engines(monkeypatch, release, hung={"qwg"})
+
+    async def never(self: Any, request: Any) -> Any:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(ADNBridge, "evaluate_v3_async", never, raising=False)
+
+    async def run() -> OrchestratorV3Response:
+        try:
+            return await orchestrate_async(_request(), options=OrchestratorV3Options(deadline_seconds=0.05))
+        finally:
+            release.set()
+
+    resp = asyncio.run(run())
+
+    assert _notes(resp)["adn"] == DEADLINE_EXCEEDED_NOTE
+    assert _notes(resp)["qwg"] == DEADLINE_EXCEEDED_NOTE
+    assert _notes(resp)["sentinel_ai"] == "real_component_engine"
+
+
+def test_orchestrate_async_component_timeouts_leave_fast_bridges_alone(
+    monkeypatch: pytest.MonkeyPatch,
+    release: threading.Event,
+) -> None:
+    _patch_engines(monkeypatch, release, hung=set())
+
+    resp = asyncio.run(
+        orchestrate_async(_request(), options=OrchestratorV3Options(component_timeouts={"adn": 30}))
+    )
+
+    assert resp == orchestrate(_request())
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"deadline_seconds": 0}, "deadline_seconds must be a positive number"),
+        ({"deadline_seconds": True}, "deadline_seconds must be a positive number"),
+        ({"component_timeouts": {"adn": -1}}, "component_timeouts must map components to positive numbers"),
+        ({"component_timeouts": {"adn": "1"}}, "component_timeouts must map components to positive numbers"),
+    ],
+)
+def test_deadline_options_are_validated(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        OrchestratorV3Options(**kwargs)
+
+
+def test_bridges_are_unbounded_by_default() -> None:
+    assert not OrchestratorV3Options().bounds_bridges
+    assert not OrchestratorV3Options(component_timeouts={}).bounds_bridges
+    assert OrchestratorV3Options(enforce_ttl_deadline=True).bounds_bridges
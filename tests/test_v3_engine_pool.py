@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.engine_pool import EnginePool, EnginePools
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import COMPONENT_BRIDGES, orchestrate, orchestrate_many
+
+CTX = "a" * 64
+
+
+def _request(index: int, *, decision: str = "ALLOW") -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": decision}},
+                "dqsn": {"signals": [{"decision": decision}]},
+                "adn": {"events": [{"decision": decision}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": decision}},
+                "qwg": {"risk_context": {"device_id": decision}},
+            },
+        },
+    )
+
+
+class Engine:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_engine_pool_reuses_warm_engines_and_counts_hits_and_misses() -> None:
+    pool = EnginePool(Engine, size=2)
+
+    pool.warmup()
+    assert pool.stats().created == 2
+    with pool.lease() as first:
+        with pool.lease() as second:
+            with pool.lease() as third:
+                assert len({id(first), id(second), id(third)}) == 3
+    with pool.lease() as again:
+        assert again in (first, second, third)
+
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.created, stats.idle) == (3, 1, 3, 2)
+    assert stats.size == 2 and not stats.per_thread and not stats.closed
+
+
+def test_engine_pool_per_thread_mode_gives_each_thread_its_own_engine() -> None:
+    pool = EnginePool(Engine, size=1, per_thread=True)
+    pool.warmup()
+    seen: dict[str, list[Any]] = {}
+    together = threading.Barrier(3)
+
+    def worker(name: str) -> None:
+        for _ in range(3):
+            with pool.lease() as engine:
+                seen.setdefault(name, []).append(engine)
+            together.wait()
+
+    threads = [threading.Thread(target=worker, args=(f"t{index}",)) for index in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(len(set(map(id, engines))) == 1 for engines in seen.values())
+    engines = [engines[0] for engines in seen.values()]
+    assert len(set(map(id, engines))) == 3
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.created, stats.idle) == (7, 2, 3, 1)
+    assert sorted(engine.closed for engine in engines) == [False, True, True]
+
+
+def test_engine_pool_per_thread_engines_are_reused_by_short_lived_threads() -> None:
+    pool = EnginePool(Engine, size=2, per_thread=True)
+    pool.warmup()
+
+    together = threading.Barrier(2)
+
+    def lease_once() -> None:
+        with pool.lease():
+            together.wait()
+
+    for _ in range(50):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(lease_once) for _ in range(2)]:
+                future.result()
+
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.created, stats.idle) == (100, 0, 2, 2)
+
+
+def test_orchestrate_reuses_per_thread_engines_across_per_call_workers(fake_engines: Any) -> None:
+    pools = EnginePools.for_bridges(COMPONENT_BRIDGES, size=2, per_thread={"sentinel_ai", "adn"})
+    assert all(pools.warmup().values())
+    options = OrchestratorV3Options(engine_pools=pools, max_workers=2)
+
+    for index in range(20):
+        orchestrate(_request(index), options=options)
+    orchestrate_many([_request(index) for index in range(20, 30)], options=options)
+
+    stats = pools.stats()
+    for component in ("sentinel_ai", "adn"):
+        assert (stats[component].hits, stats[component].misses, stats[component].created, stats[component].idle) == (
+            21,
+            0,
+            2,
+            2,
+        )
+    pools.shutdown()
+
+
+@pytest.mark.parametrize("per_thread", [False, True])
+def test_engine_pool_shutdown_closes_engines_and_rejects_new_leases(per_thread: bool) -> None:
+    pool = EnginePool(Engine, size=1, per_thread=per_thread)
+    with pool.lease() as engine:
+        pass
+
+    pool.shutdown()
+
+    assert engine.closed
+    assert pool.stats().closed
+    with pytest.raises(RuntimeError, match="engine pool is shut down"):
+        with pool.lease():
+            pass
+    with pytest.raises(RuntimeError, match="engine pool is shut down"):
+        pool.warmup()
+
+
+def test_engine_pool_thread_engines_outliving_the_pool_are_not_returned() -> None:
+    pools = [EnginePool(Engine, size=1, per_thread=True) for _ in range(2)]
+    leased = threading.Event()
+    done = threading.Event()
+    engines: list[Any] = []
+
+    def worker() -> None:
+        for pool in pools:
+            with pool.lease() as engine:
+                engines.append(engine)
+        del pool
+        leased.set()
+        done.wait()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    leased.wait()
+    pools[0].shutdown()
+    dropped = weakref.ref(pools.pop())
+    assert dropped() is None
+    done.set()
+    thread.join()
+
+    assert [engine.closed for engine in engines] == [True, False]
+    assert pools[0].stats().idle == 0
+
+
+def test_engine_pool_drops_engines_returned_after_shutdown() -> None:
+    pool = EnginePool(object, size=1)
+    with pool.lease():
+        pool.shutdown()
+
+    assert pool.stats().idle == 0
+
+
+@pytest.mark.parametrize("size", [0, -1, True, "2"])
+def test_engine_pool_rejects_invalid_size(size: Any) -> None:
+    with pytest.raises(ValueError, match="engine pool size must be a positive integer"):
+        EnginePool(Engine, size=size)
+
+
+def test_orchestrate_with_engine_pools_constructs_each_engine_once(fake_engines: Any) -> None:
+    unpooled = [orchestrate(_request(index)) for index in range(5)]
+    fake_engines.constructed.clear()
+    pools = EnginePools.for_bridges(COMPONENT_BRIDGES, size=1, sizes={"adn": 2}, per_thread={"sentinel_ai"})
+
+    assert pools.warmup() == {
+        "sentinel_ai": True,
+        "dqsn": True,
+        "adn": True,
+        "guardian_wallet": True,
+        "qwg": True,
+    }
+    options = OrchestratorV3Options(engine_pools=pools)
+    pooled = [orchestrate(_request(index), options=options) for index in range(5)]
+    batched = orchestrate_many([_request(index) for index in range(5)], options=options)
+
+    assert pooled == unpooled
+    assert batched == unpooled
+    assert fake_engines.constructed == {"sentinel_ai": 1, "adn": 2, "guardian_wallet": 1, "qwg": 1}
+    stats = pools.stats()
+    assert stats["adn"].misses == 0
+    assert stats["sentinel_ai"].per_thread
+
+
+def test_engine_pools_report_unavailable_engines_and_fail_closed_after_shutdown(
+    fake_engines: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "adn_v3", None)
+    pools = EnginePools.for_bridges(COMPONENT_BRIDGES)
+
+    assert pools.warmup()["adn"] is False
+    assert pools.get("unknown") is None
+
+    pools.shutdown()
+    resp = orchestrate(_request(0), options=OrchestratorV3Options(engine_pools=pools))
+
+    assert resp.outcome == "DENY"
+    notes = {entry.notes for entry in resp.trace[1:6]}
+    assert notes == {"component_engine_unavailable_or_failed"}
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.bridges.engine_process_pool as process_pool_module
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.engine_process_pool import EngineProcessPool
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+
+CTX = "a" * 64
+FORK = multiprocessing.get_context("fork")
+
+
+def _request(index: int, *, decision: str = "ALLOW") -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+                "dqsn": {"signals": [{"decision": decision}]},
+                "adn": {"events": [{"decision": "ALLOW"}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+                "qwg": {"risk_context": {"device_id": "ALLOW"}},
+            },
+        },
+    )
+
+
+def _note(resp: OrchestratorV3Response, stage: str) -> str | None:
+    return next(entry.notes for entry in resp.trace if entry.stage == stage)
+
+
+@pytest.fixture
+def crashing_dqsn(fake_engines: Any, monkeypatch: pytest.MonkeyPatch) -> Any:
+    api = sys.modules["dqsnetwork.v3_api"]
+    real = api.evaluate_v3
+
+    def evaluate_v3(req: dict[str, Any]) -> dict[str, Any]:
+        decision = req["signals"][0]["decision"]
+        if decision == "CRASH":
+            os._exit(1)
+        if decision == "PID":
+            return {"decision": "ALLOW", "reason_codes": [f"pid-{os.getpid()}"]}
+        return real(req)
+
+    monkeypatch.setattr(api, "evaluate_v3", evaluate_v3)
+    return fake_engines
+
+
+@pytest.fixture
+def pool(crashing_dqsn: Any) -> Iterator[EngineProcessPool]:
+    engine_pool = EngineProcessPool((SentinelBridge, DQSNBridge), max_workers=2, mp_context=FORK)
+    yield engine_pool
+    engine_pool.shutdown()
+
+
+def test_process_pool_responses_match_in_process_engines(pool: EngineProcessPool) -> None:
+    pool.warmup()
+    options = OrchestratorV3Options(process_pool=pool)
+    requests = [_request(index) for index in range(4)]
+
+    remote = [orchestrate(request, options=options) for request in requests]
+    batched = orchestrate_many(requests, options=options)
+    local = [orchestrate(request) for request in requests]
+
+    assert remote == local
+    assert batched == local
+    assert pool.components == frozenset({"sentinel_ai", "dqsn"})
+
+
+def test_process_pool_runs_engines_outside_the_calling_process(pool: EngineProcessPool) -> None:
+    remote = orchestrate(_request(0, decision="PID"), options=OrchestratorV3Options(process_pool=pool))
+    local = orchestrate(_request(0, decision="PID"))
+
+    def engine_pid(resp: OrchestratorV3Response) -> str:
+        assert resp.receipt is not None
+        dqsn = next(v for v in resp.receipt["component_verdicts"] if v["component_id"] == "dqsn")
+        return str(dqsn["metadata"]["engine_reason_codes"][0])
+
+    assert engine_pid(local) == f"pid-{os.getpid()}"
+    assert engine_pid(remote) != engine_pid(local)
+
+
+def test_worker_crash_fails_closed_and_pool_recovers(pool: EngineProcessPool) -> None:
+    options = OrchestratorV3Options(process_pool=pool)
+
+    crashed = orchestrate(_request(0, decision="CRASH"), options=options)
+    batch = orchestrate_many([_request(1, decision="CRASH")], options=options)
+    recovered = orchestrate(_request(2), options=options)
+
+    assert crashed.outcome == "DENY"
+    assert _note(crashed, "dqsn") == "component_engine_unavailable_or_failed"
+    assert _note(batch[0], "dqsn") == "component_engine_unavailable_or_failed"
+    assert recovered.outcome == "ALLOW"
+    assert pool.replacements == 2
+
+
+def test_shut_down_pool_fails_closed(pool: EngineProcessPool) -> None:
+    pool.shutdown()
+
+    resp = orchestrate(_request(0), options=OrchestratorV3Options(process_pool=pool))
+
+    assert _note(resp, "dqsn") == "component_engine_unavailable_or_failed"
+    with pytest.raises(RuntimeError, match="engine process pool is shut down"):
+        pool.submit("dqsn", {}, request_id="req")
+
+
+def test_broken_executor_on_submit_is_replaced(pool: EngineProcessPool, monkeypatch: pytest.MonkeyPatch) -> None:
+    class Broken:
+        def submit(self, *args: Any) -> Any:
+            raise BrokenProcessPool("gone")
+
+        def shutdown(self, **kwargs: Any) -> None:
+            pass
+
+    broken = Broken()
+    monkeypatch.setattr(pool, "_executor", broken)
+
+    with pytest.raises(BrokenProcessPool):
+        pool.submit("dqsn", {}, request_id="req")
+    pool._replace(broken)  # type: ignore[arg-type]
+    cancelled: Future[Any] = Future()
+    cancelled.cancel()
+    pool._replace_if_broken(broken, cancelled)  # type: ignore[arg-type]
+
+    assert pool.replacements == 1
+
+
+def test_worker_functions_preload_engines_and_reload_missing_ones(
+    fake_engines: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(process_pool_module, "_WORKER_BRIDGES", {})
+    monkeypatch.setattr(process_pool_module, "_WORKER_ENGINES", {})
+    monkeypatch.setitem(sys.modules, "adn_v3", None)
+
+    process_pool_module._init_worker((DQSNBridge, ADNBridge))
+
+    assert set(process_pool_module._WORKER_ENGINES) == {"dqsn"}
+    assert process_pool_module._evaluate_in_worker("dqsn", {"signals": [{"decision": "WARN"}]}, "req") == {
+        "decision": "WARN",
+        "component": "dqsn",
+    }
+    with pytest.raises(ImportError):
+        process_pool_module._evaluate_in_worker("adn", {"events": [{"decision": "ALLOW"}]}, "req")
+    assert process_pool_module._worker_ready()
+
+
+@pytest.mark.parametrize("max_workers", [0, True, "2"])
+def test_process_pool_rejects_invalid_max_workers(max_workers: Any) -> None:
+    with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+        EngineProcessPool((DQSNBridge,), max_workers=max_workers)
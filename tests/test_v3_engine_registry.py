@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.component_bridge import ComponentBridge
+from shield_orchestrator.bridges.engine_registry import EngineImportRegistry, EngineReadiness
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import COMPONENT_BRIDGES, orchestrate
+
+CTX = "a" * 64
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request() -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce="nonce-1",
+        ttl_seconds=60,
+        payload={"request_id": "req-1", "context_hash": CTX, "component_inputs": {"adn": {"events": []}}},
+    )
+
+
+def test_registry_runs_loader_once_while_module_is_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("fake_engine_pkg")
+    monkeypatch.setitem(sys.modules, "fake_engine_pkg", module)
+    registry = EngineImportRegistry()
+    calls: list[int] = []
+
+    def loader() -> str:
+        calls.append(1)
+        return "entry-point"
+
+    assert [registry.resolve(("fake_engine_pkg",), loader) for _ in range(3)] == ["entry-point"] * 3
+    assert len(calls) == 1
+
+    monkeypatch.setitem(sys.modules, "fake_engine_pkg", types.ModuleType("fake_engine_pkg"))
+    registry.resolve(("fake_engine_pkg",), loader)
+    assert len(calls) == 2
+
+
+def test_registry_negative_cache_skips_reprobe_until_interval_elapses(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "missing_engine_pkg", raising=False)
+    clock = FakeClock()
+    registry = EngineImportRegistry(reprobe_interval_seconds=5, clock=clock)
+    probes: list[int] = []
+
+    def loader() -> Any:
+        probes.append(1)
+        raise ModuleNotFoundError("No module named 'missing_engine_pkg'")
+
+    for _ in range(3):
+        with pytest.raises(ModuleNotFoundError):
+            registry.resolve(("missing_engine_pkg",), loader)
+    assert len(probes) == 1
+    assert registry.unavailable() == (("missing_engine_pkg",),)
+
+    clock.now += 5
+    assert registry.unavailable() == ()
+    with pytest.raises(ModuleNotFoundError, match="No module named"):
+        registry.resolve(("missing_engine_pkg",), loader)
+    assert len(probes) == 2
+
+    clock.now += 5
+    monkeypatch.setitem(sys.modules, "missing_engine_pkg", types.ModuleType("missing_engine_pkg"))
+    assert registry.resolve(("missing_engine_pkg",), lambda: "installed") == "installed"
+    assert registry.unavailable() == ()
+
+
+def test_orchestrate_uses_configured_registry_and_skips_failed_import_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "adn_v3", raising=False)
+    registry = EngineImportRegistry(reprobe_interval_seconds=60)
+    probes: list[int] = []
+    real_import = ADNBridge._import_engine
+
+    def counting_import(self: ADNBridge) -> Any:
+        probes.append(1)
+        return real_import(self)
+
+    monkeypatch.setattr(ADNBridge, "_import_engine", counting_import)
+    options = OrchestratorV3Options(engine_registry=registry)
+
+    responses = [orchestrate(_request(), options=options) for _ in range(4)]
+
+    assert len(probes) == 1
+    assert len({response.receipt["receipt_hash"] for response in responses if response.receipt}) == 1
+    adn = next(entry for entry in responses[-1].trace if entry.stage == "adn")
+    assert adn.notes == "component_engine_unavailable_or_failed"
+
+
+def test_readiness_report_lists_live_engines(fake_engines: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "qwg", None)
+
+    report = EngineImportRegistry().readiness(COMPONENT_BRIDGES)
+
+    assert report == (
+        EngineReadiness("sentinel_ai", True, ("sentinel_ai_v2.config", "sentinel_ai_v2.v3")),
+        EngineReadiness("dqsn", True, ("dqsnetwork.v3_api",)),
+        EngineReadiness("adn", True, ("adn_v3",)),
+        EngineReadiness("guardian_wallet", True, ("dgb_wallet_guardian",)),
+        EngineReadiness("qwg", False, ("qwg",)),
+    )
+
+
+@pytest.mark.parametrize("interval", [-1, True, "5", None])
+def test_registry_rejects_invalid_reprobe_interval(interval: Any) -> None:
+    with pytest.raises(ValueError, match="reprobe_interval_seconds must be a non-negative number"):
+        EngineImportRegistry(reprobe_interval_seconds=interval)
+
+
+def test_component_bridge_base_requires_import_hook() -> None:
+    class NoImport(ComponentBridge):
+        def _load_engine(self) -> Any:
+            return None
+
+        def _engine_request(self, payload: Any, *, request_id: str) -> dict[str, Any]:
+            return {}
+
+    with pytest.raises(TypeError, match="_import_engine"):
+        NoImport()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.component_verdicts import skipped_component_result
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.contracts.v3_2_receipt import (
+    validate_component_verdict,
+    validate_receipt,
+)
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import FAST_DENY_SKIPPED_NOTE, orchestrate, orchestrate_many
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+
+CTX = "a" * 64
+BRIDGES = (SentinelBridge, DQSNBridge, ADNBridge, GuardianWalletBridge, QWGBridge)
+FAST_DENY = OrchestratorV3Options(fast_deny=True)
+
+
+def _request(index: int = 0, **decisions: str) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                bridge.COMPONENT: {"decision": decisions.get(bridge.COMPONENT, "ALLOW")} for bridge in BRIDGES
+            },
+        },
+    )
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Patch every bridge engine to echo its input decision and record the call."""
+    made: list[str] = []
+    for bridge_cls in BRIDGES:
+
+        def engine(self: Any, payload: Any, *, request_id: str) -> dict[str, Any]:
+            made.append(self.COMPONENT)
+            if payload["decision"] == "RAISE":
+                raise RuntimeError("engine failed")
+            return {"decision": payload["decision"]}
+
+        def engine_many(self: Any, items: list[Any]) -> list[Any]:
+            return [self.evaluate_v3(item) for item in items]
+
+        monkeypatch.setattr(bridge_cls, "_evaluate_engine", engine)
+        monkeypatch.setattr(bridge_cls, "evaluate_v3_many", engine_many)
+    return made
+
+
+def _statuses(resp: OrchestratorV3Response) -> dict[str, str]:
+    return {entry.stage: entry.status for entry in resp.trace[1:6]}
+
+
+def test_fast_deny_skips_components_after_the_first_deny(calls: list[str]) -> None:
+    full = orchestrate(_request(dqsn="DENY"))
+    calls.clear()
+
+    resp = orchestrate(_request(dqsn="DENY"), options=FAST_DENY)
+
+    assert calls == ["sentinel_ai", "dqsn"]
+    assert (resp.outcome, resp.reason_ids) == (full.outcome, full.reason_ids) == ("DENY", ("ORCH_DENY_DOMINATES",))
+    assert _statuses(resp) == {
+        "sentinel_ai": "OK",
+        "dqsn": "DENY",
+        "adn": "SKIPPED",
+        "guardian_wallet": "SKIPPED",
+        "qwg": "SKIPPED",
+    }
+    assert {entry.notes for entry in resp.trace[3:6]} == {FAST_DENY_SKIPPED_NOTE}
+    assert resp.receipt is not None
+    assert validate_receipt(resp.receipt, expected_context_hash=CTX) == resp.receipt
+    decisions = {v["component_id"]: v["decision"] for v in resp.receipt["component_verdicts"]}
+    assert decisions == {
+        "adn": "SKIPPED",
+        "dqsn": "DENY",
+        "guardian_wallet": "SKIPPED",
+        "qwg": "SKIPPED",
+        "sentinel_ai": "ALLOW",
+    }
+
+
+@pytest.mark.parametrize("decisions", [{}, {"adn": "ESCALATE"}, {"sentinel_ai": "RAISE", "qwg": "DENY"}])
+def test_fast_deny_is_a_no_op_until_a_component_denies(calls: list[str], decisions: dict[str, str]) -> None:
+    assert orchestrate(_request(**decisions), options=FAST_DENY) == orchestrate(_request(**decisions))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        OrchestratorV3Options(fast_deny=True, max_workers=5),
+        OrchestratorV3Options(fast_deny=True, deadline_seconds=30),
+        OrchestratorV3Options(fast_deny=True, deadline_seconds=30, max_workers=5),
+    ],
+)
+def test_concurrent_and_bounded_modes_match_sequential_fast_deny(calls: list[str], options: OrchestratorV3Options) -> None:
+    expected = orchestrate(_request(sentinel_ai="DENY", adn="RAISE"), options=FAST_DENY)
+
+    assert orchestrate(_request(sentinel_ai="DENY", adn="RAISE"), options=options) == expected
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        pooled = OrchestratorV3Options(fast_deny=True, executor=executor)
+        assert orchestrate(_request(sentinel_ai="DENY", adn="RAISE"), options=pooled) == expected
+
+
+def test_bridge_exceptions_after_a_deny_are_discarded(calls: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    def broken(self: Any, request: Any) -> Any:
+        raise RuntimeError("bridge failed")
+
+    expected = orchestrate(_request(sentinel_ai="DENY"), options=FAST_DENY)
+    monkeypatch.setattr(QWGBridge, "evaluate_v3", broken)
+    monkeypatch.setattr(QWGBridge, "evaluate_v3_many", broken)
+
+    assert orchestrate(_request(sentinel_ai="DENY"), options=FAST_DENY) == expected
+    assert orchestrate(_request(sentinel_ai="DENY"), options=OrchestratorV3Options(fast_deny=True, max_workers=5)) == expected
+    assert orchestrate_many([_request(sentinel_ai="DENY")], options=FAST_DENY) == [expected]
+    assert asyncio.run(orchestrate_async(_request(sentinel_ai="DENY"), options=FAST_DENY)) == expected
+
+
+def test_async_fast_deny_matches_sync(calls: list[str]) -> None:
+    for request in (_request(dqsn="DENY"), _request(guardian_wallet="DENY"), _request()):
+        assert asyncio.run(orchestrate_async(request, options=FAST_DENY)) == orchestrate(request, options=FAST_DENY)
+
+
+@pytest.mark.parametrize("max_workers", [1, 5])
+def test_batch_fast_deny_matches_single_requests_and_skips_denied_items(
+    calls: list[str],
+    max_workers: int,
+) -> None:
+    requests = [_request(0), _request(1, dqsn="DENY"), _request(2, qwg="DENY"), _request(3, adn="DENY", qwg="DENY")]
+    options = OrchestratorV3Options(fast_deny=True, max_workers=max_workers)
+    expected = [orchestrate(request, options=FAST_DENY) for request in requests]
+    calls.clear()
+
+    assert orchestrate_many(requests, options=options) == expected
+    if max_workers == 1:
+        assert calls.count("adn") == 3
+        assert calls.count("guardian_wallet") == 2
+
+
+def test_batch_of_requests_denied_by_the_first_component_calls_no_later_engine(calls: list[str]) -> None:
+    requests = [_request(index, sentinel_ai="DENY") for index in range(3)]
+
+    responses = orchestrate_many(requests, options=FAST_DENY)
+
+    assert calls == ["sentinel_ai"] * 3
+    assert [resp.outcome for resp in responses] == ["DENY"] * 3
+
+
+def test_skipped_component_result_is_contract_valid() -> None:
+    result = skipped_component_result(component_id="adn", request_id="req-1", context_hash=CTX, note="why")
+
+    assert validate_component_verdict(result.verdict, expected_context_hash=CTX) == result.verdict
+    assert result.verdict["decision"] == "SKIPPED"
+    assert result.verdict["metadata"] == {"bridge_source": "orchestrator", "bridge_skipped": "why"}
+    assert (result.trace.status, result.trace.notes) == ("SKIPPED", "why")
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import runpy
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v3.canonical_json import to_canonical_json
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.ndjson_runner import INVALID_LINE_ERROR, RunSummary, main, run
+from shield_orchestrator.v3.orchestrate import orchestrate
+
+CTX = "a" * 64
+
+
+def _payload(index: int, *, decision: str = "ALLOW") -> dict[str, Any]:
+    return {
+        "contract_version": 3,
+        "wallet_id": "wallet-1",
+        "action": "SEND",
+        "nonce": f"nonce-{index}",
+        "ttl_seconds": 60,
+        "payload": {
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+                "dqsn": {"signals": [{"decision": decision}]},
+                "adn": {"events": [{"decision": "ALLOW"}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+                "qwg": {"risk_context": {"device_id": "ALLOW"}},
+            },
+        },
+    }
+
+
+def _lines(count: int) -> list[str]:
+    return [json.dumps(_payload(index, decision="DENY" if index % 3 == 0 else "ALLOW")) + "\n" for index in range(count)]
+
+
+def _stdin(data: bytes) -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+
+
+def _expected(index: int) -> dict[str, Any]:
+    request = OrchestratorV3Request(**_payload(index, decision="DENY" if index % 3 == 0 else "ALLOW"))
+    return json.loads(to_canonical_json(asdict(orchestrate(request))))
+
+
+def test_ordered_run_matches_orchestrate(fake_engines: Any) -> None:
+    out = io.StringIO()
+
+    summary = run(_lines(6), out, workers=3, window=2)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records == [_expected(index) for index in range(6)]
+    assert summary.requests == 6
+    assert summary.outcomes == {"ALLOW": 4, "DENY": 2}
+
+
+def test_sequential_and_threaded_runs_write_identical_output(fake_engines: Any) -> None:
+    sequential, threaded = io.StringIO(), io.StringIO()
+
+    run(_lines(5), sequential)
+    run(_lines(5), threaded, workers=4)
+
+    assert sequential.getvalue() == threaded.getvalue()
+
+
+def test_unordered_run_tags_records_with_their_input_line(fake_engines: Any) -> None:
+    out = io.StringIO()
+
+    summary = run(_lines(7), out, workers=2, ordered=False, window=3)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    by_line = {record.pop("line"): record for record in records}
+    assert by_line == {index + 1: _expected(index) for index in range(7)}
+    assert summary.requests == 7
+
+
+def test_invalid_and_blank_lines(fake_engines: Any) -> None:
+    lines = [
+        "{not json\n",
+        "\n",
+        "[1, 2]\n",
+        json.dumps({"unknown": True}) + "\n",
+        "   \n",
+        json.dumps(_payload(1)) + "\n",
+    ]
+    out = io.StringIO()
+
+    summary = run(lines, out, ordered=False)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[:3] == [
+        {"error": INVALID_LINE_ERROR, "line": 1},
+        {"error": INVALID_LINE_ERROR, "line": 3},
+        {"error": INVALID_LINE_ERROR, "line": 4},
+    ]
+    assert records[3]["line"] == 6
+    assert (summary.requests, summary.invalid_lines) == (1, 3)
+
+
+def test_undecodable_and_deeply_nested_lines_are_invalid(fake_engines: Any) -> None:
+    lines = [
+        b"\xff\xfe{}\n",
+        b"[" * 100_000 + b"\n",
+        "{" * 100_000 + "\n",
+        json.dumps(_payload(1)).encode("utf-8") + b"\n",
+    ]
+    out = io.StringIO()
+
+    summary = run(lines, out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[:3] == [{"error": INVALID_LINE_ERROR, "line": line} for line in (1, 2, 3)]
+    assert records[3] == _expected(1)
+    assert (summary.requests, summary.invalid_lines) == (1, 3)
+
+
+@pytest.mark.parametrize("workers", [0, True, 1.5])
+def test_run_rejects_invalid_workers(workers: Any) -> None:
+    with pytest.raises(ValueError, match="workers must be a positive integer"):
+        run([], io.StringIO(), workers=workers)
+
+
+def test_summary_throughput() -> None:
+    assert RunSummary(requests=3).requests_per_second == 0.0
+    summary = RunSummary(requests=4, outcomes={"DENY": 1, "ALLOW": 3}, elapsed_seconds=2.0)
+    assert summary.as_dict() == {
+        "requests": 4,
+        "invalid_lines": 0,
+        "outcomes": {"ALLOW": 3, "DENY": 1},
+        "elapsed_seconds": 2.0,
+        "requests_per_second": 2.0,
+    }
+
+
+def test_main_reads_and_writes_files(fake_engines: Any, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source = tmp_path / "requests.ndjson"
+    target = tmp_path / "responses.ndjson"
+    source.write_text("".join(_lines(3)), encoding="utf-8")
+
+    assert main([str(source), "-o", str(target), "-w", "2", "--no-summary"]) == 0
+
+    records = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert records == [_expected(index) for index in range(3)]
+    assert capsys.readouterr().err == ""
+
+
+def test_main_streams_stdin_to_stdout_with_summary(
+    fake_engines: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(sys, "stdin", _stdin("".join(_lines(2)).encode("utf-8") + b"\xffoops\n"))
+
+    assert main(["--unordered", "--window", "1"]) == 0
+
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 3
+    summary = json.loads(captured.err)
+    assert (summary["requests"], summary["invalid_lines"]) == (2, 1)
+
+
+@pytest.mark.parametrize("argv", [["--workers", "0"], ["--window", "0"]])
+def test_main_rejects_non_positive_limits(argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(argv)
+
+    assert excinfo.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
+
+
+def test_module_entry_point(
+    fake_engines: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(sys, "argv", ["shield_orchestrator.v3", "--no-summary"])
+    monkeypatch.setattr(sys, "stdin", _stdin("".join(_lines(1)).encode("utf-8")))
+
+    with pytest.raises(SystemExit) as excinfo:
+        runpy.run_module("shield_orchestrator.v3", run_name="__main__")
+
+    assert excinfo.value.code == 0
+    assert json.loads(capsys.readouterr().out) == _expected(0)
+
+
+def test_importing_the_entry_point_does_not_run_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["docs-tool", "--workers", "0"])
+    monkeypatch.delitem(sys.modules, "shield_orchestrator.v3.__main__", raising=False)
+
+    module = importlib.import_module("shield_orchestrator.v3.__main__")
+
+    assert module.main is main
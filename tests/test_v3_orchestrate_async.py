@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.v3.orchestrate as orchestrate_module
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.base_layer import AsyncComponentBridge
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.guardian_wallet_bridge import GuardianWalletBridge
+from shield_orchestrator.bridges.qwg_bridge import QWGBridge
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.contracts.reason_ids import ReasonId
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+
+CTX = "a" * 64
+REQ = "req-async"
+BRIDGES = (SentinelBridge, DQSNBridge, ADNBridge, GuardianWalletBridge, QWGBridge)
+
+
+def _request(ttl_seconds: int = 60) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce="nonce-1",
+        ttl_seconds=ttl_seconds,
+        payload={
+            "request_id": REQ,
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {}},
+                "dqsn": {"signals": []},
+                "adn": {"events": []},
+                "guardian_wallet": {"wallet_ctx": {}},
+                "qwg": {"risk_context": {}},
+            },
+        },
+    )
+
+
+def _patch_engines(monkeypatch: pytest.MonkeyPatch, *, deny: str | None = None) -> None:
+    for bridge_cls in BRIDGES:
+        component = bridge_cls.COMPONENT
+
+        def engine(self: Any, payload: Any, *, request_id: str, _component: str = component) -> dict[str, Any]:
+            return {"decision": "BLOCK" if _component == deny else "ALLOW", "component": _component}
+
+        monkeypatch.setattr(bridge_cls, "_evaluate_engine", engine)
+
+
+@pytest.mark.parametrize("deny", [None, "guardian_wallet"])
+def test_async_sync_only_bridges_match_sync_receipt(monkeypatch: pytest.MonkeyPatch, deny: str | None) -> None:
+    _patch_engines(monkeypatch, deny=deny)
+
+    expected = orchestrate(_request())
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        on_pool = asyncio.run(orchestrate_async(_request(), options=OrchestratorV3Options(executor=pool)))
+
+    assert asyncio.run(orchestrate_async(_request())) == expected
+    assert on_pool == expected
+
+
+def test_async_native_bridges_are_awaited_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_engines(monkeypatch)
+    expected = orchestrate(_request())
+    loop_thread: list[int] = []
+
+    async def run() -> Any:
+        started = 0
+        all_started = asyncio.Event()
+
+        def make(bridge_cls: type[Any]) -> Any:
+            async def evaluate_v3_async(self: Any, request: OrchestratorV3Request) -> Any:
+                nonlocal started
+                loop_thread.append(threading.get_ident())
+                started += 1
+                if started == len(BRIDGES):
+                    all_started.set()
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+                return bridge_cls.evaluate_v3(self, request)
+
+            return evaluate_v3_async
+
+        for bridge_cls in BRIDGES:
+            monkeypatch.setattr(bridge_cls, "evaluate_v3_async", make(bridge_cls), raising=False)
+        return await orchestrate_async(_request())
+
+    assert asyncio.run(run()) == expected
+    assert len(set(loop_thread)) == 1
+    assert isinstance(SentinelBridge(), AsyncComponentBridge)
+
+
+@pytest.mark.parametrize(
+    "error, reason_id",
+    [
+        (TypeError("not serializable"), ReasonId.HASHING_FAILED.value),
+        (RuntimeError("component exploded"), ReasonId.COMPONENT_ERROR.value),
+    ],
+)
+def test_async_bridge_failures_keep_fail_closed_mapping(
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception,
+    reason_id: str,
+) -> None:
+    async def boom(self: Any, request: Any) -> Any:
+        raise error
+
+    monkeypatch.setattr(orchestrate_module.ADNBridge, "evaluate_v3_async", boom, raising=False)
+
+    resp = asyncio.run(orchestrate_async(_request()))
+
+    assert resp.outcome == "DENY"
+    assert resp.reason_ids == (reason_id,)
+    assert resp.trace[0].stage == "fail_closed"
+
+
+def test_async_invalid_request_and_internal_error_match_sync(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert asyncio.run(orchestrate_async(_request(ttl_seconds=0))) == orchestrate(_request(ttl_seconds=0))
+
+    def invalid_validator(request: Any) -> None:
+        raise ValueError("unexpected validator defect")
+
+    monkeypatch.setattr(orchestrate_module, "_validate_request", invalid_validator)
+
+    resp = asyncio.run(orchestrate_async(_request()))
+
+    assert resp == orchestrate(_request())
+    assert resp.reason_ids == (ReasonId.INTERNAL_ERROR.value,)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.v3.orchestrate as orchestrate_module
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.component_bridge import ComponentBridge
+from shield_orchestrator.bridges.component_verdicts import prepare_request
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.contracts.reason_ids import ReasonId
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+
+CTX = "a" * 64
+
+
+def _request(index: int, *, decision: str = "ALLOW", ttl_seconds: int = 60, **inputs: Any) -> OrchestratorV3Request:
+    component_inputs: dict[str, Any] = {
+        "sentinel_ai": {"telemetry": {"decision": decision}},
+        "dqsn": {"signals": [{"decision": decision}]},
+        "adn": {"events": [{"decision": decision}]},
+        "guardian_wallet": {"wallet_ctx": {"decision": decision}},
+        "qwg": {"risk_context": {"device_id": decision}},
+    }
+    component_inputs.update(inputs)
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=ttl_seconds,
+        payload={"request_id": f"req-{index}", "context_hash": CTX, "component_inputs": component_inputs},
+    )
+
+
+def test_orchestrate_many_matches_per_request_orchestrate_in_input_order(fake_engines: Any) -> None:
+    batch = [
+        _request(0),
+        _request(1, decision="BLOCK"),
+        _request(2, ttl_seconds=0),
+        _request(3, decision="WARN"),
+        _request(4, qwg="not-a-mapping"),
+        _request(5, decision="RAISE"),
+    ]
+
+    expected = [orchestrate(request) for request in batch]
+
+    assert orchestrate_many(batch) == expected
+    assert orchestrate_many(iter(batch), options=OrchestratorV3Options(max_workers=5)) == expected
+    assert [response.outcome for response in expected] == ["ALLOW", "DENY", "DENY", "ESCALATE", "DENY", "DENY"]
+    assert orchestrate_many([]) == []
+
+
+def test_orchestrate_many_amortizes_engine_construction_and_uses_batch_entry_point(fake_engines: Any) -> None:
+    counters = fake_engines
+
+    responses = orchestrate_many([_request(index) for index in range(20)])
+
+    assert {response.outcome for response in responses} == {"ALLOW"}
+    assert counters.constructed == {"sentinel_ai": 1, "adn": 1, "guardian_wallet": 1, "qwg": 1}
+    assert counters.batch_calls == 1
+    assert counters.single_calls == 0
+
+
+@pytest.mark.parametrize("batch_behaviour", ["raise", "short"])
+def test_orchestrate_many_falls_back_to_single_calls_when_batch_call_is_unusable(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_engines: Any,
+    batch_behaviour: str,
+) -> None:
+    counters = fake_engines
+    fake_adn = sys.modules["adn_v3"].ADNv3
+
+    def broken_evaluate_many(self: Any, reqs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if batch_behaviour == "raise":
+            raise RuntimeError("batch endpoint down")
+        return []
+
+    monkeypatch.setattr(fake_adn, "evaluate_many", broken_evaluate_many)
+    batch = [_request(0), _request(1, decision="BLOCK")]
+
+    assert orchestrate_many(batch) == [orchestrate(request) for request in batch]
+    assert counters.single_calls == 4
+
+
+def test_orchestrate_many_isolates_per_request_hashing_failures(fake_engines: Any) -> None:
+    batch = [_request(0), _request(1, decision="UNHASHABLE"), _request(2)]
+
+    responses = orchestrate_many(batch)
+
+    assert [response.outcome for response in responses] == ["ALLOW", "DENY", "ALLOW"]
+    assert responses[1].reason_ids == (ReasonId.HASHING_FAILED.value,)
+    assert responses == [orchestrate(request) for request in batch]
+
+
+def test_orchestrate_many_unavailable_engine_fails_each_request_closed(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_engines: Any,
+) -> None:
+    monkeypatch.setitem(sys.modules, "adn_v3", None)
+    batch = [_request(0), _request(1, adn=None)]
+
+    responses = orchestrate_many(batch)
+
+    assert responses == [orchestrate(request) for request in batch]
+    adn_notes = [
+        next(entry.notes for entry in response.trace if entry.stage == "adn") for response in responses
+    ]
+    assert adn_notes == ["component_engine_unavailable_or_failed", "missing_component_input"]
+
+
+def test_orchestrate_many_bridge_level_failures_fail_items_closed(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_engines: Any,
+) -> None:
+
+    def boom(self: Any, items: Any) -> list[Any]:
+        raise RuntimeError("bridge exploded")
+
+    monkeypatch.setattr(ADNBridge, "evaluate_v3_many", boom)
+    responses = orchestrate_many([_request(0), _request(1)])
+    assert [response.reason_ids for response in responses] == [(ReasonId.COMPONENT_ERROR.value,)] * 2
+
+    monkeypatch.setattr(ADNBridge, "evaluate_v3_many", lambda self, items: [])
+    responses = orchestrate_many([_request(0)])
+    assert responses[0].reason_ids == (ReasonId.COMPONENT_ERROR.value,)
+
+
+def test_orchestrate_many_internal_errors_are_per_request(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_engines: Any,
+) -> None:
+    real_validate = orchestrate_module._validate_request
+
+    def validator(request: OrchestratorV3Request) -> None:
+        if request.nonce == "nonce-1":
+            raise ValueError("unexpected validator defect")
+        real_validate(request)
+
+    monkeypatch.setattr(orchestrate_module, "_validate_request", validator)
+
+    def broken_receipt(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["request_id"] == "req-2":
+            raise KeyError("receipt defect")
+        return real_build_receipt(**kwargs)
+
+    real_build_receipt = orchestrate_module.build_receipt
+    monkeypatch.setattr(orchestrate_module, "build_receipt", broken_receipt)
+
+    responses = orchestrate_many([_request(0), _request(1), _request(2)])
+
+    assert [response.reason_ids for response in responses] == [
+        ("ORCH_OK_ALL_COMPONENTS_ALLOW",),
+        (ReasonId.INTERNAL_ERROR.value,),
+        (ReasonId.INTERNAL_ERROR.value,),
+    ]
+
+
+def test_component_bridge_base_requires_engine_hooks() -> None:
+    class ImportOnly(ComponentBridge):
+        def _import_engine(self) -> Any:
+            return None
+
+    with pytest.raises(TypeError, match="_engine_request.*_load_engine|_load_engine.*_engine_request"):
+        ImportOnly()
+    with pytest.raises(TypeError):
+        ComponentBridge()  # type: ignore[abstract]
+
+
+def test_component_bridge_batch_without_inputs_never_loads_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    def forbidden_load(self: Any) -> Any:
+        raise AssertionError("engine must not be loaded")
+
+    monkeypatch.setattr(ADNBridge, "_load_engine", forbidden_load)
+
+    results = ADNBridge().evaluate_v3_many([prepare_request(_request(0, adn=None))])
+
+    assert results[0].verdict["metadata"]["bridge_error"] == "missing_component_input"
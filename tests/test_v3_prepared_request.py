@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.bridges.component_verdicts as verdicts
+from shield_orchestrator.bridges.component_verdicts import PreparedRequest, prepare_request
+from shield_orchestrator.bridges.sentinel_bridge import SentinelBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+
+
+def _request(nonce: str = "nonce-1") -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=nonce,
+        ttl_seconds=60,
+        payload={
+            "blob": ["x" * 64] * 256,
+            "sentinel": {"telemetry": {"decision": "ALLOW"}},
+            "component_inputs": {"adn": {"events": []}, "qwg": "not-a-mapping"},
+        },
+    )
+
+
+def test_prepare_request_derives_receipt_context_once() -> None:
+    request = _request()
+
+    prepared = prepare_request(request)
+
+    assert prepared.request is request
+    assert prepared.request_id == "nonce-1"
+    assert prepared.context_hash == verdicts.receipt_context_hash(request)
+    assert dict(prepared.component_inputs) == {
+        "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+        "adn": {"events": []},
+    }
+    assert prepared.component_input("qwg") is None
+
+
+def test_orchestrate_hashes_the_request_context_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    expected = [orchestrate(_request()), orchestrate_many([_request("nonce-1"), _request("nonce-2")])]
+    calls: list[Any] = []
+    real_hash = verdicts.compute_context_hash
+
+    def counting_hash(value: Any) -> str:
+        calls.append(value)
+        return real_hash(value)
+
+    monkeypatch.setattr(verdicts, "compute_context_hash", counting_hash)
+
+    assert orchestrate(_request()) == expected[0]
+    assert len(calls) == 1
+    assert orchestrate_many([_request("nonce-1"), _request("nonce-2")]) == expected[1]
+    assert len(calls) == 3
+
+
+def test_bridge_accepts_raw_or_prepared_request() -> None:
+    request = _request()
+
+    assert SentinelBridge().evaluate_v3(prepare_request(request)) == SentinelBridge().evaluate_v3(request)
+    assert isinstance(prepare_request(request), PreparedRequest)
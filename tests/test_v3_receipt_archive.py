@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v3 import receipt_archive
+from shield_orchestrator.v3.contracts.v3_2_receipt import SUPPORTED_COMPONENTS, build_receipt
+from shield_orchestrator.v3.receipt_archive import (
+    CHECKPOINT_SCHEMA_VERSION,
+    INVALID_LINE_REASON,
+    ArchiveFileResult,
+    main,
+    validate_archive,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+CTX = "a" * 64
+FAMILIES = {
+    "adn": "defense_signal",
+    "dqsn": "network_observation",
+    "guardian_wallet": "wallet_context",
+    "qwg": "wallet_posture",
+    "sentinel_ai": "telemetry",
+}
+REASONS = {
+    "adn": "ADN_OK_COORDINATION_ALLOW",
+    "dqsn": "DQSN_OK_NETWORK_ALLOW",
+    "guardian_wallet": "GW_OK_HEALTHY_ALLOW",
+    "qwg": "QWG_OK_POSTURE_ALLOW",
+    "sentinel_ai": "SNTL_OK_TELEMETRY_ALLOW",
+}
+
+
+def receipt(index: int) -> dict[str, Any]:
+    return build_receipt(
+        request_id=f"req-{index}",
+        context_hash=CTX,
+        component_verdicts=[
+            {
+                "component_id": component_id,
+                "contract_version": 3,
+                "schema_version": "shield.verdict.v1",
+                "request_id": f"req-{index}",
+                "context_hash": CTX,
+                "decision": "ALLOW",
+                "reason_ids": [REASONS[component_id]],
+                "evidence_hash": "b" * 64,
+                "evidence_families": [FAMILIES[component_id]],
+                "metadata": {"index": index},
+                "fail_closed": True,
+            }
+            for component_id in SUPPORTED_COMPONENTS
+        ],
+    )
+
+
+def _write(path: Path, lines: list[Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    root = tmp_path / "archive"
+    _write(root / "2026-09/day-01.jsonl", [receipt(i) for i in range(7)])
+    _write(
+        root / "2026-09/day-02.jsonl",
+        [
+            receipt(10),
+            "",
+            {**receipt(11), "final_outcome": "DENY"},
+            "not json",
+            {"receipt": receipt(12), "expected_context_hash": "c" * 64},
+            {"receipt": receipt(13), "expected_context_hash": CTX},
+            [receipt(14)],
+        ],
+    )
+    _write(root / "2026-10/day-01.jsonl", [])
+    (root / "notes.txt").write_text("ignored", encoding="utf-8")
+    return root
+
+
+def _summary(result: ArchiveFileResult) -> tuple[Any, ...]:
+    return Path(result.path).name, result.receipts, result.passed, result.failed, result.first_failure
+
+
+def test_directories_are_streamed_file_by_file_with_first_failures(archive: Path) -> None:
+    report = validate_archive([archive], chunk_size=2)
+
+    assert [_summary(result) for result in report.files] == [
+        ("day-01.jsonl", 7, 7, 0, None),
+        ("day-02.jsonl", 6, 2, 4, {"line": 3, "reason": "receipt content mismatch"}),
+        ("day-01.jsonl", 0, 0, 0, None),
+    ]
+    assert all(result.complete for result in report.files)
+    assert (report.receipts, report.failed) == (13, 4)
+    summary = report.as_dict()
+    assert summary["passed"] == 9
+    assert set(summary["files"][0]) == {"path", "receipts", "passed", "failed", "first_failure", "complete"}
+
+
+def test_process_pool_matches_the_in_process_run(archive: Path) -> None:
+    serial = validate_archive([archive], chunk_size=3)
+    parallel = validate_archive([archive], workers=2, chunk_size=3, window=2)
+
+    assert [_summary(result) for result in parallel.files] == [_summary(result) for result in serial.files]
+
+
+def test_failure_reasons_cover_bad_lines_and_context(tmp_path: Path) -> None:
+    path = _write(
+        tmp_path / "bad.jsonl",
+        ["[1]", {"receipt": receipt(1), "expected_context_hash": "c" * 64}, "{"],
+    )
+
+    [result] = validate_archive([path]).files
+
+    assert result.first_failure == {"line": 1, "reason": INVALID_LINE_REASON}
+    assert result.failed == 3
+
+
+def test_deeply_nested_lines_are_invalid_lines(tmp_path: Path) -> None:
+    path = _write(tmp_path / "deep.jsonl", ["[" * 100_000, receipt(1)])
+
+    [result] = validate_archive([path]).files
+
+    assert result.first_failure == {"line": 1, "reason": INVALID_LINE_REASON}
+    assert (result.passed, result.failed) == (1, 1)
+
+
+def test_checkpoint_resumes_after_the_last_validated_chunk(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = _write(tmp_path / "a.jsonl", [receipt(i) for i in range(5)])
+    second = _write(tmp_path / "b.jsonl", [receipt(i) for i in range(5, 9)])
+    checkpoint = tmp_path / "checkpoint.json"
+    validated: list[int] = []
+    crash_on = [b"req-7"]
+    real = receipt_archive._validate_chunk
+
+    def recording(chunk: list[tuple[int, bytes]]) -> Any:
+        if any(marker in chunk[0][1] for marker in crash_on):
+            raise KeyboardInterrupt
+        validated.extend(line for line, _ in chunk)
+        return real(chunk)
+
+    monkeypatch.setattr(receipt_archive, "_validate_chunk", recording)
+    with pytest.raises(KeyboardInterrupt):
+        validate_archive([first, second], chunk_size=2, window=1, checkpoint=checkpoint, checkpoint_interval=0)
+
+    saved = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert saved["schema_version"] == CHECKPOINT_SCHEMA_VERSION
+    assert [(entry["complete"], entry["line"], entry["passed"]) for entry in saved["files"]] == [(True, 5, 5), (False, 2, 2)]
+
+    validated.clear()
+    crash_on.clear()
+    report = validate_archive([first, second], chunk_size=2, checkpoint=checkpoint)
+
+    assert validated == [3, 4]
+    assert [_summary(result) for result in report.files] == [("a.jsonl", 5, 5, 0, None), ("b.jsonl", 4, 4, 0, None)]
+    assert not (tmp_path / "checkpoint.json.partial").exists()
+
+    _write(second, [receipt(20)])
+    validated.clear()
+    report = validate_archive([first, second], checkpoint=checkpoint)
+    assert validated == [1]
+    assert _summary(report.files[1]) == ("b.jsonl", 1, 1, 0, None)
+
+
+def _rewrite_first_hash(path: Path, *, keep_mtime: bool) -> None:
+    """Corrupt the first receipt_hash in place: same size, optionally the same mtime."""
+    stat = path.stat()
+    data = path.read_bytes()
+    start = data.index(b'"receipt_hash": "') + len(b'"receipt_hash": "')
+    flipped = b"0" if data[start : start + 1] != b"0" else b"1"
+    path.write_bytes(data[:start] + flipped + data[start + 1 :])
+    if keep_mtime:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_files_rewritten_at_the_same_size_are_validated_from_the_start(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    partial = _write(tmp_path / "a.jsonl", [receipt(i) for i in range(4)])
+    complete = _write(tmp_path / "b.jsonl", [receipt(i) for i in range(4, 6)])
+    checkpoint = tmp_path / "checkpoint.json"
+    validated: list[tuple[str, int]] = []
+    crash_on = [b"req-2"]
+    real = receipt_archive._validate_chunk
+
+    def recording(chunk: list[tuple[int, bytes]]) -> Any:
+        if any(marker in chunk[0][1] for marker in crash_on):
+            raise KeyboardInterrupt
+        validated.extend((json.loads(raw)["request_id"], line) for line, raw in chunk)
+        return real(chunk)
+
+    monkeypatch.setattr(receipt_archive, "_validate_chunk", recording)
+    validate_archive([complete], checkpoint=checkpoint)
+    with pytest.raises(KeyboardInterrupt):
+        validate_archive([complete, partial], chunk_size=2, window=1, checkpoint=checkpoint, checkpoint_interval=0)
+    saved = {Path(entry["path"]).name: entry for entry in json.loads(checkpoint.read_text(encoding="utf-8"))["files"]}
+    assert [(saved[name]["complete"], saved[name]["line"]) for name in ("a.jsonl", "b.jsonl")] == [(False, 2), (True, 2)]
+
+    for path in (partial, complete):
+        _rewrite_first_hash(path, keep_mtime=True)
+    validated.clear()
+    crash_on.clear()
+    report = validate_archive([complete, partial], chunk_size=2, checkpoint=checkpoint)
+
+    assert validated == [("req-4", 1), ("req-5", 2), ("req-0", 1), ("req-1", 2), ("req-2", 3), ("req-3", 4)]
+    assert [(result.passed, result.failed, result.first_failure["line"]) for result in report.files if result.first_failure] == [
+        (1, 1, 1),
+        (3, 1, 1),
+    ]
+
+    os.utime(complete, ns=(0, 0))
+    validated.clear()
+    validate_archive([complete], checkpoint=checkpoint)
+    assert validated == [("req-4", 1), ("req-5", 2)]
+
+
+def test_invalid_settings_and_checkpoints_are_rejected(tmp_path: Path) -> None:
+    for kwargs in ({"workers": 0}, {"chunk_size": True}, {"window": -1}):
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            validate_archive([], **kwargs)
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(json.dumps({"schema_version": "other"}), encoding="utf-8")
+    with pytest.raises(ValueError, match="checkpoint schema_version mismatch"):
+        validate_archive([], checkpoint=checkpoint)
+
+
+def test_cli_prints_the_report_and_fails_on_invalid_receipts(
+    archive: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    assert main([str(archive / "2026-09/day-01.jsonl"), "--chunk-size", "4"]) == 0
+    assert json.loads(capsys.readouterr().out)["passed"] == 7
+    assert main([str(archive), "--checkpoint", str(archive / "checkpoint.json")]) == 1
+    assert json.loads(capsys.readouterr().out)["failed"] == 4
+    for flags in (["--workers", "0"], ["--chunk-size", "0"]):
+        with pytest.raises(SystemExit):
+            main([str(archive), *flags])
+
+
+def test_cli_script_compiles() -> None:
+    path = ROOT / "scripts/validate_v3_receipt_archive.py"
+    compile(path.read_text(encoding="utf-8"), str(path), "exec")
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v3 import receipt_store
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.contracts.v3_2_receipt import (
+    SUPPORTED_COMPONENTS,
+    build_receipt,
+    canonical_json,
+    canonical_sha256,
+)
+from shield_orchestrator.v3.orchestrate import orchestrate
+from shield_orchestrator.v3.receipt_store import ReceiptStore, ReceiptStoreStats
+
+CTX = "a" * 64
+FAMILIES = {
+    "adn": "defense_signal",
+    "dqsn": "network_observation",
+    "guardian_wallet": "wallet_context",
+    "qwg": "wallet_posture",
+    "sentinel_ai": "telemetry",
+}
+REASONS = {
+    "adn": "ADN_OK_COORDINATION_ALLOW",
+    "dqsn": "DQSN_OK_NETWORK_ALLOW",
+    "guardian_wallet": "GW_OK_HEALTHY_ALLOW",
+    "qwg": "QWG_OK_POSTURE_ALLOW",
+    "sentinel_ai": "SNTL_OK_TELEMETRY_ALLOW",
+}
+
+
+def receipt(index: int, attempt: int = 0) -> dict[str, Any]:
+    return build_receipt(
+        request_id=f"req-{index}",
+        context_hash=CTX,
+        component_verdicts=[
+            {
+                "component_id": component_id,
+                "contract_version": 3,
+                "schema_version": "shield.verdict.v1",
+                "request_id": f"req-{index}",
+                "context_hash": CTX,
+                "decision": "ALLOW",
+                "reason_ids": [REASONS[component_id]],
+                "evidence_hash": "b" * 64,
+                "evidence_families": [FAMILIES[component_id]],
+                "metadata": {"attempt": attempt, "note": "zürich"},
+                "fail_closed": True,
+            }
+            for component_id in SUPPORTED_COMPONENTS
+        ],
+    )
+
+
+@pytest.fixture
+def fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    real = os.fsync
+
+    def counting(fd: int) -> None:
+        calls.append(fd)
+        real(fd)
+
+    monkeypatch.setattr(os, "fsync", counting)
+    return calls
+
+
+def _rehashed(candidate: dict[str, Any]) -> dict[str, Any]:
+    """candidate with a receipt_hash that matches its content, valid or not."""
+    return {**candidate, "receipt_hash": canonical_sha256({**candidate, "receipt_hash": ""})}
+
+
+def _segments(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.iterdir())
+
+
+def test_batches_are_deduplicated_and_written_with_one_fsync(tmp_path: Path, fsyncs: list[int]) -> None:
+    with ReceiptStore(tmp_path) as store:
+        fsyncs.clear()
+        first = [receipt(1), receipt(1), receipt(2)]
+
+        assert store.put_many(first) == [receipt(1)["receipt_hash"]] * 2 + [receipt(2)["receipt_hash"]]
+        assert len(fsyncs) == 1
+        size = store.stats().stored_bytes
+
+        assert store.put_many([receipt(2), receipt(1)]) == [receipt(2)["receipt_hash"], receipt(1)["receipt_hash"]]
+        assert store.put(receipt(1)) == receipt(1)["receipt_hash"]
+        assert store.put_many([]) == []
+        assert len(fsyncs) == 1
+        assert store.stats() == ReceiptStoreStats(receipts=2, request_ids=2, segments=1, stored_bytes=size)
+
+
+def test_lookups_by_hash_and_request_id(tmp_path: Path) -> None:
+    with ReceiptStore(tmp_path) as store:
+        store.put_many([receipt(1), receipt(1, attempt=1)])
+        store.put(receipt(2))
+
+        assert store.get(receipt(1, attempt=1)["receipt_hash"]) == receipt(1, attempt=1)
+        assert store.get("c" * 64) is None
+        assert receipt(2)["receipt_hash"] in store
+        assert store.hashes_for_request("req-1") == (receipt(1)["receipt_hash"], receipt(1, attempt=1)["receipt_hash"])
+        assert store.get_for_request("req-1") == [receipt(1), receipt(1, attempt=1)]
+        assert store.get_for_request("req-9") == []
+
+
+def test_segments_are_compressed_and_reopened_from_the_frame_index(tmp_path: Path) -> None:
+    receipts = [receipt(index, attempt) for index in range(20) for attempt in range(3)]
+    with ReceiptStore(tmp_path, segment_bytes=4096, frame_cache=1) as store:
+        for start in range(0, len(receipts), 6):
+            store.put_many(receipts[start : start + 6])
+        stats = store.stats()
+
+    raw_bytes = sum(len(canonical_json(item).encode("utf-8")) for item in receipts)
+    assert stats.segments > 1
+    assert stats.stored_bytes * 4 < raw_bytes
+    assert _segments(tmp_path) == sorted(
+        [f"segment-{number:08d}.log" for number in range(1, stats.segments + 1)]
+        + [f"segment-{number:08d}.idx" for number in range(1, stats.segments)]
+    )
+
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    with ReceiptStore(tmp_path, frame_cache=1) as reopened:
+        assert reopened.stats() == stats
+        assert [reopened.get(item["receipt_hash"]) for item in reversed(receipts)] == receipts[::-1]
+        assert reopened.hashes_for_request("req-3") == tuple(receipt(3, attempt)["receipt_hash"] for attempt in range(3))
+
+
+def test_sealed_segments_are_reopened_from_their_index_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    receipts = [receipt(index) for index in range(20)]
+    with ReceiptStore(tmp_path, segment_bytes=2048) as store:
+        for item in receipts:
+            store.put(item)
+        stats = store.stats()
+    assert stats.segments >= 4
+    last = f"segment-{stats.segments:08d}.log"
+    indexes = {number: tmp_path / f"segment-{number:08d}.idx" for number in range(1, stats.segments)}
+    intact = {number: path.read_bytes() for number, path in indexes.items()}
+
+    scanned: set[str] = set()
+    real = receipt_store._read_frame_header
+
+    def recording(handle: Any, offset: int, size: int) -> Any:
+        scanned.add(Path(handle.name).name)
+        return real(handle, offset, size)
+
+    monkeypatch.setattr(receipt_store, "_read_frame_header", recording)
+    with ReceiptStore(tmp_path) as store:
+        assert scanned == {last}
+        assert store.stats() == stats
+        assert [store.get(item["receipt_hash"]) for item in receipts] == receipts
+
+    indexes[1].unlink()
+    indexes[2].write_bytes(intact[2][:3])
+    indexes[3].write_bytes(intact[3][:-1] + bytes([intact[3][-1] ^ 1]))
+    scanned.clear()
+    with ReceiptStore(tmp_path) as store:
+        assert scanned == {"segment-00000001.log", "segment-00000002.log", "segment-00000003.log", last}
+        assert store.stats() == stats
+        assert store.get_for_request("req-0") == [receipts[0]]
+        assert [store.get(item["receipt_hash"]) for item in receipts] == receipts
+    assert {number: path.read_bytes() for number, path in indexes.items()} == intact
+
+
+def test_torn_tail_frames_are_truncated_on_open(tmp_path: Path) -> None:
+    with ReceiptStore(tmp_path) as store:
+        store.put_many([receipt(1), receipt(2)])
+        size = store.stats().stored_bytes
+    segment = tmp_path / "segment-00000001.log"
+    intact = segment.read_bytes()
+
+    for tail in (b"SRS1", intact[:40], b"XXXX" + intact[4:], intact[:20] + b"{" + intact[21:]):
+        segment.write_bytes(intact + tail)
+        with ReceiptStore(tmp_path) as store:
+            assert (len(store), store.stats().stored_bytes) == (2, size)
+        assert segment.read_bytes() == intact
+
+    with ReceiptStore(tmp_path) as store:
+        store.put(receipt(3))
+    with ReceiptStore(tmp_path) as store:
+        assert store.get(receipt(3)["receipt_hash"]) == receipt(3)
+
+
+def test_damage_outside_the_tail_is_reported(tmp_path: Path) -> None:
+    with ReceiptStore(tmp_path, segment_bytes=1) as store:
+        store.put(receipt(1))
+        store.put(receipt(2))
+    first = tmp_path / "segment-00000001.log"
+    data = first.read_bytes()
+
+    first.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    with ReceiptStore(tmp_path) as store:
+        with pytest.raises(ValueError, match="segment 00000001 is corrupt"):
+            store.get(receipt(1)["receipt_hash"])
+        assert store.get(receipt(2)["receipt_hash"]) == receipt(2)
+
+    first.write_bytes(data[:-1])
+    with pytest.raises(ValueError, match="segment-00000001.log is corrupt at offset 0"):
+        ReceiptStore(tmp_path)
+
+
+def test_invalid_receipts_reject_the_whole_batch(tmp_path: Path) -> None:
+    with ReceiptStore(tmp_path) as store:
+        cases = [
+            ("not-a-dict", "receipt must be dict"),
+            ({**receipt(1), "receipt_hash": "C" * 64}, "receipt_hash must be 64-character"),
+            ({**receipt(1), "request_id": ""}, "request_id must be a non-empty string"),
+            ({**receipt(1), "final_outcome": "DENY"}, "receipt_hash does not match receipt content"),
+            (_rehashed({**receipt(1), "note": "unsigned"}), "receipt fields must match required schema"),
+            (_rehashed({**receipt(1), "context_hash": "c" * 64}), "context_hash mismatch"),
+        ]
+        for candidate, message in cases:
+            with pytest.raises(ValueError, match=message):
+                store.put_many([receipt(2), candidate])
+        assert store.stats() == ReceiptStoreStats(receipts=0, request_ids=0, segments=1, stored_bytes=0)
+
+
+def test_failed_writes_leave_no_partial_frame(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with ReceiptStore(tmp_path) as store:
+        store.put(receipt(1))
+        size = store.stats().stored_bytes
+
+        def failing(fd: int) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", failing)
+        with pytest.raises(OSError, match="disk full"):
+            store.put(receipt(2))
+        monkeypatch.undo()
+
+        assert (tmp_path / "segment-00000001.log").stat().st_size == size
+        assert receipt(2)["receipt_hash"] not in store
+        store.put(receipt(2))
+    with ReceiptStore(tmp_path) as store:
+        assert len(store) == 2
+
+
+def test_orchestrate_receipts_are_stored_once(tmp_path: Path, fake_engines: Any) -> None:
+    request = OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce="nonce-1",
+        ttl_seconds=60,
+        payload={
+            "request_id": "req-1",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+                "dqsn": {"signals": [{"decision": "ALLOW"}]},
+                "adn": {"events": [{"decision": "ALLOW"}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+                "qwg": {"risk_context": {"device_id": "ALLOW"}},
+            },
+        },
+    )
+    responses = [orchestrate(request) for _ in range(3)]
+
+    with ReceiptStore(tmp_path) as store:
+        hashes = store.put_many(response.receipt for response in responses if response.receipt is not None)
+
+        assert len(set(hashes)) == len(store) == 1
+        assert store.get_for_request("req-1") == [responses[0].receipt]
+
+
+def test_settings_and_closed_stores_are_rejected(tmp_path: Path) -> None:
+    for kwargs, message in (
+        ({"segment_bytes": 0}, "segment_bytes must be a positive integer"),
+        ({"frame_cache": True}, "frame_cache must be a positive integer"),
+        ({"compression_level": 10}, "compression_level must be an integer from 0 to 9"),
+        ({"compression_level": False}, "compression_level must be an integer from 0 to 9"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            ReceiptStore(tmp_path, **kwargs)
+
+    store = ReceiptStore(tmp_path / "nested")
+    store.close()
+    store.close()
+    for call in (lambda: store.put(receipt(1)), lambda: store.get("c" * 64)):
+        with pytest.raises(ValueError, match="receipt store is closed"):
+            call()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import random
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.bridges.component_verdicts as verdicts
+from shield_orchestrator.v3.contracts.v3_2_receipt import canonical_sha256
+
+ROOT = Path(__file__).resolve().parents[1]
+Point = namedtuple("Point", "x y")
+
+
+class Level(Enum):
+    LOW = "low"
+    RAW = {"nested": (1, 2), "override": True}
+
+
+@dataclass
+class Signal:
+    name: str
+    level: Level
+    scores: tuple[float, ...] = (0.5, 1.25)
+    extra: dict[Any, Any] = field(default_factory=dict)
+
+
+def _three_pass(component_id: str, response: Any) -> tuple[Any, bool, str | None, Exception | None]:
+    normalized = verdicts._json_like(response)
+    forbidden = verdicts._contains_forbidden_authority(normalized)
+    try:
+        return normalized, forbidden, canonical_sha256({"component_id": component_id, "engine_response": normalized}), None
+    except (TypeError, ValueError) as e:
+        return normalized, forbidden, None, e
+
+
+def _assert_equivalent(response: Any, component_id: str = "sentinel_ai") -> None:
+    normalized, forbidden, digest, error = _three_pass(component_id, response)
+    digested = verdicts._digest_engine_response(component_id, response)
+
+    assert digested.normalized == normalized
+    assert digested.forbidden_authority is forbidden
+    if error is None:
+        assert digested.evidence_hash() == digest
+    else:
+        with pytest.raises(type(error)) as excinfo:
+            digested.evidence_hash()
+        assert str(excinfo.value) == str(error)
+
+
+def _random_value(rng: random.Random, depth: int = 0) -> Any:
+    leaves = [
+        lambda: rng.choice(["", "a", "é", "日本", "\"quoted\"", "line\nbreak", "\x00", "emoji 🎉"]),
+        lambda: rng.randint(-(2**70), 2**70),
+        lambda: rng.uniform(-1e6, 1e6),
+        lambda: rng.choice([True, False, None, 0.1, -0.0, 1e300]),
+        lambda: rng.choice(list(Level)),
+    ]
+    if depth >= 4 or rng.random() < 0.4:
+        return rng.choice(leaves)()
+    size = rng.randint(0, 6)
+    kind = rng.randrange(5)
+    if kind == 0:
+        keys = ["a", "b", "B", "z", "é", "10", "2", "reason_codes", "decision", "allow", "trusted"]
+        return {rng.choice(keys + [1, 2, True]): _random_value(rng, depth + 1) for _ in range(size)}
+    if kind == 1:
+        return tuple(_random_value(rng, depth + 1) for _ in range(size))
+    if kind == 2:
+        return Signal(name=str(size), level=rng.choice(list(Level)), extra={"k": _random_value(rng, depth + 1)})
+    if kind == 3:
+        return Point(_random_value(rng, depth + 1), _random_value(rng, depth + 1))
+    return [_random_value(rng, depth + 1) for _ in range(size)]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_single_walk_matches_three_pass_pipeline_on_random_responses(seed: int) -> None:
+    _assert_equivalent(_random_value(random.Random(seed)))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"decision": "ALLOW", "reason_codes": ["x"], "nested": {"z": 1, "a": [1.5, None, True]}},
+        OrderedDict([("b", 1), ("a", 2)]),
+        {1: "int key", "1": "str key"},
+        {"k": {"override": 1}},
+        [{"trusted": True}],
+        Level.RAW,
+        Signal(name="s", level=Level.LOW, extra={Level.LOW: "enum key"}),
+        "not an object",
+        {"nan": float("nan")},
+        {"inf": [float("inf")]},
+        {"obj": object()},
+        {"set": {1, 2}, "authority": "x"},
+        {"a": "\ud800", "b": object()},
+        {"surrogate": "\ud800"},
+        {"big": [{"i": i, "s": "x" * (i % 7)} for i in range(20_000)]},
+        {"flat": list(range(10_000))},
+    ],
+)
+def test_single_walk_matches_three_pass_pipeline_on_edge_cases(response: Any) -> None:
+    _assert_equivalent(response)
+
+
+def test_dataclass_type_fails_like_json_like() -> None:
+    with pytest.raises(TypeError):
+        verdicts._json_like(Signal)
+    with pytest.raises(TypeError):
+        verdicts._digest_engine_response("adn", {"x": Signal})
+
+
+def test_benchmark_script_compiles() -> None:
+    path = ROOT / "scripts/benchmark_engine_response_digest.py"
+    compile(path.read_text(encoding="utf-8"), str(path), "exec")
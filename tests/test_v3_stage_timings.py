@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.bridges.engine_registry import EngineImportRegistry
+from shield_orchestrator.testing.stand_in_engines import StandInEngines, StandInProfile
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+from shield_orchestrator.v3.orchestrate_async import orchestrate_async
+from shield_orchestrator.v3.stage_timings import TIMED_STAGES, StageTimer, V3StageTimings
+
+CTX = "a" * 64
+BRIDGE_STAGES = ("sentinel_ai", "dqsn", "adn", "guardian_wallet", "qwg")
+
+
+def _request(index: int = 0) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"peers": 8}},
+                "dqsn": {"signals": [{"score": 0.1}]},
+                "adn": {"events": [{"kind": "tx"}]},
+                "guardian_wallet": {"wallet_ctx": {"balance": 10}},
+                "qwg": {"risk_context": {"tx_amount": 5}},
+            },
+        },
+    )
+
+
+@pytest.fixture
+def slow_dqsn() -> Iterator[StandInEngines]:
+    with StandInEngines({"dqsn": StandInProfile(latency_ms=30)}).installed() as engines:
+        yield engines
+
+
+def _options(timings: list[V3StageTimings], **kwargs: Any) -> OrchestratorV3Options:
+    return OrchestratorV3Options(engine_registry=EngineImportRegistry(), on_stage_timings=timings.append, **kwargs)
+
+
+def _untimed(options: OrchestratorV3Options) -> OrchestratorV3Response:
+    return orchestrate(_request(), options=replace(options, on_stage_timings=None))
+
+
+@pytest.mark.parametrize("max_workers", [1, 5])
+def test_timings_cover_every_stage_without_changing_the_response(slow_dqsn: StandInEngines, max_workers: int) -> None:
+    timings: list[V3StageTimings] = []
+    options = _options(timings, max_workers=max_workers)
+
+    resp = orchestrate(_request(), options=options)
+
+    assert resp == _untimed(options)
+    [timing] = timings
+    assert (timing.request_id, timing.outcome) == ("req-0", "ALLOW")
+    assert tuple(timing.durations) == TIMED_STAGES
+    assert all(duration >= 0 for duration in timing.durations.values())
+    assert timing.durations["dqsn"] >= 0.03 > timing.durations["adn"]
+    assert timing.total_seconds >= sum(timing.durations.values()) - (0.03 if max_workers > 1 else 0)
+
+
+def test_batch_reports_each_request_with_shared_bridge_durations(slow_dqsn: StandInEngines) -> None:
+    timings: list[V3StageTimings] = []
+    bad = replace(_request(9), contract_version=2)
+
+    responses = orchestrate_many([_request(0), bad, _request(1)], options=_options(timings))
+
+    assert [timing.request_id for timing in timings] == ["req-0", None, "req-1"]
+    assert [timing.outcome for timing in timings] == [resp.outcome for resp in responses] == ["ALLOW", "DENY", "ALLOW"]
+    assert tuple(timings[1].durations) == ("input_validation",)
+    assert {name: timings[0].durations[name] for name in BRIDGE_STAGES} == {
+        name: timings[2].durations[name] for name in BRIDGE_STAGES
+    }
+    assert timings[0].durations["dqsn"] >= 0.03
+
+
+def test_async_timings_match_the_sync_stages(slow_dqsn: StandInEngines) -> None:
+    timings: list[V3StageTimings] = []
+    options = _options(timings)
+
+    resp = asyncio.run(orchestrate_async(_request(), options=options))
+
+    assert resp == _untimed(options)
+    assert tuple(timings[0].durations) == TIMED_STAGES
+    assert timings[0].durations["dqsn"] >= 0.03
+
+
+def test_async_times_native_async_bridges(slow_dqsn: StandInEngines, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def evaluate_v3_async(self: Any, request: Any) -> Any:
+        await asyncio.sleep(0.03)
+        return DQSNBridge.evaluate_v3(self, request)
+
+    monkeypatch.setattr(DQSNBridge, "evaluate_v3_async", evaluate_v3_async, raising=False)
+    timings: list[V3StageTimings] = []
+
+    asyncio.run(orchestrate_async(_request(), options=_options(timings)))
+
+    assert timings[0].durations["dqsn"] >= 0.06
+
+
+def test_abandoned_and_skipped_bridges_have_no_duration() -> None:
+    timings: list[V3StageTimings] = []
+    engines = StandInEngines(
+        {"dqsn": StandInProfile(latency_ms=200), "adn": StandInProfile(decision="DENY")}
+    )
+
+    with engines.installed():
+        options = _options(timings, component_timeouts={"dqsn": 0.02}, fast_deny=True)
+        sync = orchestrate(_request(), options=options)
+        async_ = asyncio.run(orchestrate_async(_request(), options=options))
+
+    assert sync.outcome == async_.outcome == "DENY"
+    assert tuple(timings[0].durations) == ("input_validation", "sentinel_ai", "adn", "receipt_synthesis", "adaptive_core")
+    # Async awaits every bridge concurrently, so only the abandoned one is missing.
+    assert "dqsn" not in timings[1].durations
+    assert len(timings[1].durations) == len(TIMED_STAGES) - 1
+
+
+def test_failing_callback_does_not_reach_the_response(slow_dqsn: StandInEngines) -> None:
+    def broken(timing: V3StageTimings) -> None:
+        raise RuntimeError("metrics backend down")
+
+    options = OrchestratorV3Options(engine_registry=EngineImportRegistry(), on_stage_timings=broken)
+
+    assert orchestrate(_request(), options=options) == _untimed(options)
+
+
+def test_stage_timer_orders_stages_and_skips_cancelled_blocks() -> None:
+    ticks = iter(range(100))
+    timer = StageTimer(clock=lambda: float(next(ticks)))
+
+    with timer.stage("adaptive_core"):
+        pass
+    with pytest.raises(ValueError), timer.stage("input_validation"):
+        raise ValueError("bad request")
+    with pytest.raises(KeyboardInterrupt), timer.stage("dqsn"):
+        raise KeyboardInterrupt
+    assert timer.timed("qwg", lambda: "done")() == "done"
+    timing = timer.finish("ALLOW")
+
+    assert timing.durations == {"input_validation": 1.0, "qwg": 1.0, "adaptive_core": 1.0}
+    assert timing.total_seconds == 8.0
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import random
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.engine_registry import EngineImportRegistry
+from shield_orchestrator.testing.stand_in_engines import (
+    STAND_IN_COMPONENTS,
+    StandInEngineError,
+    StandInEngines,
+    StandInProfile,
+)
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+
+ROOT = Path(__file__).resolve().parents[1]
+CTX = "a" * 64
+
+
+def _request(index: int = 0) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"peers": 8}},
+                "dqsn": {"signals": [{"score": 0.1}]},
+                "adn": {"events": [{"kind": "tx"}]},
+                "guardian_wallet": {"wallet_ctx": {"balance": 10}},
+                "qwg": {"risk_context": {"adn_level": "elevated", "tx_amount": 5}},
+            },
+        },
+    )
+
+
+def _options() -> OrchestratorV3Options:
+    return OrchestratorV3Options(engine_registry=EngineImportRegistry())
+
+
+def _notes(resp: OrchestratorV3Response) -> dict[str, str | None]:
+    return {entry.stage: entry.notes for entry in resp.trace}
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_stand_ins_drive_every_bridge_and_record_per_stage_durations() -> None:
+    fake = FakeTime()
+    engines = StandInEngines(
+        {"qwg": StandInProfile(latency_ms=5)},
+        default=StandInProfile(latency_ms=2),
+        sleep=fake.sleep,
+        clock=fake.clock,
+    )
+
+    with engines.installed():
+        single = orchestrate(_request(0), options=_options())
+        batch = orchestrate_many([_request(1), _request(2)], options=_options())
+
+    assert single.outcome == "ALLOW"
+    assert [resp.outcome for resp in batch] == ["ALLOW", "ALLOW"]
+    assert set(_notes(single).values()) >= {"real_component_engine"}
+    stats = engines.stats()
+    assert list(stats) == list(STAND_IN_COMPONENTS)
+    assert {component: (s.calls, s.failures) for component, s in stats.items()} == dict.fromkeys(STAND_IN_COMPONENTS, (3, 0))
+    assert stats["qwg"].durations == pytest.approx((0.005,) * 3)
+    assert stats["adn"].durations == pytest.approx((0.002,) * 3)
+
+
+def test_installed_restores_the_previous_modules(monkeypatch: pytest.MonkeyPatch) -> None:
+    real_qwg = types.ModuleType("qwg")
+    monkeypatch.setitem(sys.modules, "qwg", real_qwg)
+    monkeypatch.delitem(sys.modules, "adn_v3", raising=False)
+
+    with StandInEngines().installed() as engines:
+        assert sys.modules["qwg"] is not real_qwg
+        assert sys.modules["adn_v3"].ADNv3().evaluate({"component": "adn"})["decision"] == "ALLOW"
+        assert sys.modules["sentinel_ai_v2"].v3 is sys.modules["sentinel_ai_v2.v3"]
+
+    assert sys.modules["qwg"] is real_qwg
+    assert "adn_v3" not in sys.modules
+    assert engines.stats()["adn"].calls == 1
+
+
+def test_failures_decisions_and_response_size_follow_the_profiles() -> None:
+    engines = StandInEngines(
+        {
+            "dqsn": StandInProfile(failure_rate=1.0),
+            "adn": StandInProfile(decision="DENY", response_items=3),
+        }
+    )
+
+    with engines.installed():
+        resp = orchestrate(_request(), options=_options())
+        response = sys.modules["adn_v3"].ADNv3().evaluate({"component": "adn", "request_id": "r"})
+
+    assert resp.outcome == "DENY"
+    assert _notes(resp)["dqsn"] == "component_engine_unavailable_or_failed"
+    assert (engines.stats()["dqsn"].calls, engines.stats()["dqsn"].failures) == (1, 1)
+    assert response["decision"] == "DENY"
+    assert response["request_id"] == "r"
+    assert response["evidence"] == [{"index": 0, "score": 0.0}, {"index": 1, "score": 0.01}, {"index": 2, "score": 0.02}]
+    with pytest.raises(StandInEngineError, match="dqsn stand-in failure"):
+        engines.respond("dqsn", {})
+
+
+@pytest.mark.parametrize("distribution", ["fixed", "uniform", "exponential", "lognormal"])
+def test_latency_distributions_are_seeded_and_centred_on_latency_ms(distribution: str) -> None:
+    profile = StandInProfile(latency_ms=10, distribution=distribution)
+    samples = [profile.sample_latency_ms(random.Random(seed)) for seed in range(400)]
+
+    assert samples == [profile.sample_latency_ms(random.Random(seed)) for seed in range(400)]
+    assert all(sample >= 0 for sample in samples)
+    centre = sorted(samples)[200] if distribution == "lognormal" else sum(samples) / len(samples)
+    assert centre == pytest.approx(10, rel=0.2)
+    assert StandInProfile(distribution=distribution).sample_latency_ms(random.Random(0)) == 0.0
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"latency_ms": -1}, "latency_ms must be a non-negative number"),
+        ({"latency_ms": True}, "latency_ms must be a non-negative number"),
+        ({"distribution": "pareto"}, "distribution must be one of"),
+        ({"latency_sigma": -0.1}, "latency_sigma must be a non-negative number"),
+        ({"failure_rate": 1.5}, "failure_rate must be a number between 0 and 1"),
+        ({"failure_rate": "0.1"}, "failure_rate must be a number between 0 and 1"),
+        ({"response_items": -1}, "response_items must be a non-negative integer"),
+        ({"response_items": 2.0}, "response_items must be a non-negative integer"),
+        ({"decision": "ERROR"}, "decision must be one of"),
+    ],
+)
+def test_profile_rejects_invalid_configuration(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        StandInProfile(**kwargs)
+
+
+def test_unknown_component_profiles_are_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown stand-in components: sentinel"):
+        StandInEngines({"sentinel": StandInProfile()})
+
+
+def test_load_driver_script_compiles() -> None:
+    path = ROOT / "scripts/load_v3_stand_in_engines.py"
+    compile(path.read_text(encoding="utf-8"), str(path), "exec")
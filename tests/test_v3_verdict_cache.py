@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.bridges.adn_bridge import ADNBridge
+from shield_orchestrator.bridges.component_verdicts import ComponentBridgeResult, prepare_request
+from shield_orchestrator.bridges.verdict_cache import VerdictCache, VerdictCacheKey
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+
+CTX = "a" * 64
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _request(index: int = 0, *, adn: Any = "ALLOW") -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+                "dqsn": {"signals": [{"decision": "WARN"}]},
+                "adn": {"events": [{"decision": adn}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+                "qwg": {"risk_context": {"device_id": "ALLOW"}},
+            },
+        },
+    )
+
+
+def test_cached_retries_are_identical_and_skip_engines(fake_engines: Any) -> None:
+    uncached = orchestrate(_request())
+    cache = VerdictCache()
+    options = OrchestratorV3Options(verdict_cache=cache)
+
+    first = orchestrate(_request(), options=options)
+    calls = fake_engines.single_calls
+    retried = [orchestrate(_request(), options=options) for _ in range(3)]
+
+    assert first == uncached
+    assert retried == [uncached] * 3
+    assert fake_engines.single_calls == calls
+    stats = cache.stats()
+    assert (stats.size, stats.hits, stats.misses) == (5, 15, 5)
+
+
+def test_batch_path_reads_and_fills_the_cache(fake_engines: Any) -> None:
+    requests = [_request(0), _request(1), _request(2, adn="RAISE")]
+    expected = orchestrate_many(requests)
+    cache = VerdictCache()
+    options = OrchestratorV3Options(verdict_cache=cache)
+
+    orchestrate(_request(0), options=options)
+    first = orchestrate_many(requests, options=options)
+    batch_calls = fake_engines.batch_calls
+    second = orchestrate_many(requests[:2], options=options)
+
+    assert first == expected
+    assert second == expected[:2]
+    assert fake_engines.batch_calls == batch_calls
+
+
+def test_error_verdicts_and_other_request_ids_are_not_served(fake_engines: Any) -> None:
+    cache = VerdictCache()
+    options = OrchestratorV3Options(verdict_cache=cache)
+
+    orchestrate(_request(0, adn="RAISE"), options=options)
+    orchestrate(_request(0, adn="???"), options=options)
+    calls = fake_engines.single_calls
+    orchestrate(_request(0, adn="RAISE"), options=options)
+    orchestrate(_request(0, adn="???"), options=options)
+    orchestrate(_request(1, adn="???"), options=options)
+
+    assert fake_engines.single_calls == calls + 3
+    assert cache.stats().hits == 12
+
+
+def _key(index: int) -> VerdictCacheKey:
+    key = VerdictCache.key("adn", request_id=f"req-{index}", context_hash=CTX, component_input={"n": index})
+    assert key is not None
+    return key
+
+
+def test_entries_expire_and_least_recently_used_are_evicted() -> None:
+    clock = FakeClock()
+    cache = VerdictCache(max_entries=2, ttl_seconds=10, clock=clock)
+    error = ADNBridge().evaluate_v3(prepare_request(_request(0, adn={"missing": True})))
+    ok = ComponentBridgeResult(trace=error.trace, verdict={**error.verdict, "decision": "ALLOW"})
+
+    cache.put(_key(0), ok)
+    cache.put(_key(1), ok)
+    assert cache.get(_key(0)) == ok
+    cache.put(_key(2), ok)
+    assert cache.get(_key(1)) is None
+    cache.put(_key(0), error)
+
+    served = cache.get(_key(0))
+    assert served is not None
+    served.verdict["decision"] = "DENY"
+    assert cache.get(_key(0)) == ok
+
+    clock.now = 10
+    assert cache.get(_key(2)) is None
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.expirations, stats.max_entries) == (1, 1, 1, 2)
+
+    cache.clear()
+    assert cache.stats().size == 0
+
+
+def test_unhashable_component_input_is_never_cached() -> None:
+    assert VerdictCache.key("adn", request_id="r", context_hash=CTX, component_input={"x": object()}) is None
+    assert VerdictCache.key("adn", request_id="r", context_hash=CTX, component_input={"x": float("nan")}) is None
+
+    bridge = ADNBridge(verdict_cache=VerdictCache())
+    request = OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce="nonce-1",
+        ttl_seconds=60,
+        payload={"context_hash": CTX, "adn": {"events": [object()]}},
+    )
+
+    assert bridge.evaluate_v3(request).verdict["decision"] == "ERROR"
+    assert bridge.verdict_cache.stats().misses == 0  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"max_entries": 0}, "max_entries must be a positive integer"),
+        ({"max_entries": True}, "max_entries must be a positive integer"),
+        ({"ttl_seconds": 0}, "ttl_seconds must be a positive number"),
+        ({"ttl_seconds": "1"}, "ttl_seconds must be a positive number"),
+    ],
+)
+def test_cache_rejects_invalid_configuration(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        VerdictCache(**kwargs)
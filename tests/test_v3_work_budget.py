@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import pytest
+
+import shield_orchestrator.bridges.component_verdicts as verdicts
+from shield_orchestrator.bridges.component_verdicts import RESPONSE_OVER_BUDGET_NOTE
+from shield_orchestrator.bridges.dqsn_bridge import DQSNBridge
+from shield_orchestrator.v3.contracts.envelope import OrchestratorV3Request, OrchestratorV3Response
+from shield_orchestrator.v3.contracts.reason_ids import ReasonId
+from shield_orchestrator.v3.options import OrchestratorV3Options
+from shield_orchestrator.v3.orchestrate import orchestrate, orchestrate_many
+from shield_orchestrator.v3.work_budget import DEFAULT_WORK_BUDGET, V3WorkBudget, V3WorkBudgetError
+
+CTX = "a" * 64
+TIGHT = V3WorkBudget(max_depth=4, max_nodes=20, max_string_bytes=8, max_scalar_bytes=100)
+
+
+class Mode(Enum):
+    FLAT = "flat"
+    BULKY = {"items": list(range(30))}
+
+
+@dataclass
+class Reading:
+    label: str
+    values: tuple[int, ...]
+
+
+def _nested(depth: int) -> Any:
+    value: Any = "leaf"
+    for _ in range(depth - 1):
+        value = [value]
+    return value
+
+
+def _request(index: int = 0, **payload: Any) -> OrchestratorV3Request:
+    return OrchestratorV3Request(
+        contract_version=3,
+        wallet_id="wallet-1",
+        action="SEND",
+        nonce=f"nonce-{index}",
+        ttl_seconds=60,
+        payload={
+            "request_id": f"req-{index}",
+            "context_hash": CTX,
+            "component_inputs": {
+                "sentinel_ai": {"telemetry": {"decision": "ALLOW"}},
+                "dqsn": {"signals": [{"decision": "ALLOW"}]},
+                "adn": {"events": [{"decision": "ALLOW"}]},
+                "guardian_wallet": {"wallet_ctx": {"decision": "ALLOW"}},
+                "qwg": {"risk_context": {"device_id": "ALLOW"}},
+            },
+            **payload,
+        },
+    )
+
+
+def _dqsn_note(resp: OrchestratorV3Response) -> str | None:
+    return next(entry.notes for entry in resp.trace if entry.stage == "dqsn")
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [
+        (_nested(5), "container depth exceeds work budget"),
+        (list(range(25)), "node count exceeds work budget"),
+        ({"k": "x" * 9}, "string exceeds work budget"),
+        ({"k": "éééé" + "x"}, "string exceeds work budget"),
+        ({"x" * 9: 1}, "string exceeds work budget"),
+        (["abcdefg"] * 15, "scalar bytes exceed work budget"),
+        ([2**400], "scalar bytes exceed work budget"),
+        (Reading(label="r", values=tuple(range(30))), "node count exceeds work budget"),
+        (Mode.BULKY, "node count exceeds work budget"),
+    ],
+)
+def test_budget_rejects_values_exceeding_any_cap(value: Any, message: str) -> None:
+    with pytest.raises(V3WorkBudgetError, match=message):
+        TIGHT.check(value)
+
+
+def test_budget_accepts_values_within_caps_and_rejects_cycles() -> None:
+    TIGHT.check({"a": [1, 2.5, None, True], "mode": Mode.FLAT, "r": Reading(label="r", values=(1,)), 3: "int key"})
+    cyclic: dict[str, Any] = {}
+    cyclic["self"] = cyclic
+    with pytest.raises(V3WorkBudgetError, match="depth"):
+        DEFAULT_WORK_BUDGET.check(cyclic)
+
+
+@pytest.mark.parametrize("name", ["max_depth", "max_nodes", "max_string_bytes", "max_scalar_bytes"])
+@pytest.mark.parametrize("limit", [0, True, 1.5])
+def test_budget_rejects_invalid_limits(name: str, limit: Any) -> None:
+    with pytest.raises(ValueError, match=f"{name} must be a positive integer"):
+        V3WorkBudget(**{name: limit})
+
+
+def test_over_budget_payload_fails_closed_before_hashing(fake_engines: Any) -> None:
+    deep = _request(extra=_nested(40))
+    cyclic = _request()
+    cyclic.payload["loop"] = cyclic.payload
+
+    for resp in (orchestrate(deep), orchestrate(cyclic), orchestrate_many([deep])[0]):
+        assert (resp.outcome, resp.reason_ids) == ("DENY", (ReasonId.INVALID_REQUEST.value,))
+        assert resp.trace[0].stage == "fail_closed"
+
+    unbounded = orchestrate(deep, options=OrchestratorV3Options(payload_budget=None))
+    assert unbounded.outcome == "ALLOW"
+
+
+def test_payload_budget_is_configurable_per_deployment(fake_engines: Any) -> None:
+    strict = OrchestratorV3Options(payload_budget=V3WorkBudget(max_nodes=10))
+
+    assert orchestrate(_request(), options=strict).reason_ids == (ReasonId.INVALID_REQUEST.value,)
+    assert orchestrate(_request()).outcome == "ALLOW"
+
+
+def test_over_budget_engine_response_yields_error_verdict(fake_engines: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    def huge(self: Any, engine: Any, payload: Any, *, request_id: str) -> dict[str, Any]:
+        return {"decision": "ALLOW", "blob": ["x" * 64] * 100}
+
+    monkeypatch.setattr(DQSNBridge, "_call_engine", huge)
+    strict = OrchestratorV3Options(engine_response_budget=V3WorkBudget(max_nodes=50))
+
+    single = orchestrate(_request(), options=strict)
+    batch = orchestrate_many([_request(0), _request(1)], options=strict)
+    unbounded = orchestrate(_request(), options=OrchestratorV3Options(engine_response_budget=None))
+
+    assert single.outcome == "DENY"
+    assert _dqsn_note(single) == RESPONSE_OVER_BUDGET_NOTE
+    assert batch[0] == single
+    assert _dqsn_note(batch[1]) == RESPONSE_OVER_BUDGET_NOTE
+    assert unbounded.outcome == "ALLOW"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"decision": "ALLOW", "mode": Mode.FLAT, "reading": Reading(label="é", values=(1, 2)), 7: [None, 1.5]},
+        [{"nested": {"deeper": ("a", "b")}}],
+    ],
+)
+def test_metered_digest_matches_unmetered_digest(response: Any) -> None:
+    assert verdicts._digest_engine_response("adn", response, DEFAULT_WORK_BUDGET) == verdicts._digest_engine_response(
+        "adn", response
+    )
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"mode": Mode.BULKY},
+        {"deep": _nested(6)},
+        {"text": "y" * 9},
+        {"x" * 9: 1},
+        {"obj": [object()] * 25},
+    ],
+)
+def test_metered_digest_stops_at_the_first_exceeded_cap(response: Any) -> None:
+    with pytest.raises(V3WorkBudgetError):
+        verdicts._digest_engine_response("adn", response, TIGHT)
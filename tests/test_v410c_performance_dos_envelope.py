@@ -143,9 +143,9 @@ def _assert_rejects_without_payload_or_backend_work(
         backend_calls += 1
         return True
 
-    monkeypatch.setattr(budget, "to_canonical_json", forbidden_payload_work)
-    monkeypatch.setattr(audit, "build_receipt_hash", forbidden_payload_work)
-    monkeypatch.setattr(audit, "signed_payload_hash", forbidden_payload_work)
+    monkeypatch.setattr(budget, "canonical_json_byte_length", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_digests", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_hash_streaming", forbidden_payload_work)
     sink = RecordingSink()
     with pytest.raises(ShieldV4VerificationError, match=expected_reason):
         verify_v4_receipt_with_audit(
@@ -694,8 +694,8 @@ def test_v410c_canonical_receipt_expansion_rejects_before_hash_or_crypto(
         backend_calls += 1
         return True
 
-    monkeypatch.setattr(audit, "build_receipt_hash", forbidden_hash)
-    monkeypatch.setattr(audit, "signed_payload_hash", forbidden_hash)
+    monkeypatch.setattr(audit, "signed_payload_digests", forbidden_hash)
+    monkeypatch.setattr(audit, "signed_payload_hash_streaming", forbidden_hash)
     sink = RecordingSink()
     with pytest.raises(ShieldV4VerificationError, match=V4_CONTRACT_INVALID):
         verify_v4_receipt_with_audit(
@@ -767,9 +767,9 @@ def test_v410c_signature_and_public_key_oversize_reject_without_payload_work(
         backend_calls += 1
         return True
 
-    monkeypatch.setattr(budget, "to_canonical_json", forbidden_payload_work)
-    monkeypatch.setattr(audit, "build_receipt_hash", forbidden_payload_work)
-    monkeypatch.setattr(audit, "signed_payload_hash", forbidden_payload_work)
+    monkeypatch.setattr(budget, "canonical_json_byte_length", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_digests", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_hash_streaming", forbidden_payload_work)
     sink = RecordingSink()
     with pytest.raises(ShieldV4VerificationError, match=V4_CONTRACT_INVALID):
         verify_v4_receipt_with_audit(
@@ -858,9 +858,9 @@ def test_v410c_hostile_registry_subclass_rejects_without_attribute_access(
         backend_calls += 1
         return True
 
-    monkeypatch.setattr(budget, "to_canonical_json", forbidden_payload_work)
-    monkeypatch.setattr(audit, "build_receipt_hash", forbidden_payload_work)
-    monkeypatch.setattr(audit, "signed_payload_hash", forbidden_payload_work)
+    monkeypatch.setattr(budget, "canonical_json_byte_length", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_digests", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_hash_streaming", forbidden_payload_work)
     sink = RecordingSink()
     with pytest.raises(ValueError, match="loaded KeyRegistry"):
         verify_v4_receipt_with_audit(
@@ -899,9 +899,9 @@ def test_v410c_registry_floor_precondition_is_positive_signed64_before_audit(
         backend_calls += 1
         return True
 
-    monkeypatch.setattr(budget, "to_canonical_json", forbidden_payload_work)
-    monkeypatch.setattr(audit, "build_receipt_hash", forbidden_payload_work)
-    monkeypatch.setattr(audit, "signed_payload_hash", forbidden_payload_work)
+    monkeypatch.setattr(budget, "canonical_json_byte_length", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_digests", forbidden_payload_work)
+    monkeypatch.setattr(audit, "signed_payload_hash_streaming", forbidden_payload_work)
     sink = RecordingSink()
     with pytest.raises(ValueError, match="positive signed 64-bit"):
         verify_v4_receipt_with_audit(
@@ -926,8 +926,8 @@ def test_v410c_bounded_snapshot_counts_all_json_scalars_and_rejects_graph_attack
 ) -> None:
     monkeypatch.setattr(
         budget,
-        "to_canonical_json",
-        lambda value: json.dumps(value, sort_keys=True, separators=(",", ":")),
+        "canonical_json_byte_length",
+        lambda value: len(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")),
     )
     snapshot = budget.snapshot_bounded_receipt({"a": [None, True, False, 1, ""]})
     assert snapshot.node_count == 7
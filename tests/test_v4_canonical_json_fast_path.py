@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v4 import canonical_json
+from shield_orchestrator.v4.canonical_json import (
+    COMPONENT_VERDICT_DOMAIN,
+    ORCHESTRATOR_RECEIPT_DOMAIN,
+    parse_json_no_duplicate_keys,
+    signed_payload_hash,
+    to_canonical_json,
+)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "v4"
+# ASCII, precomposed, decomposed, compatibility and multi-mark strings.
+TEXTS = ["a", "req-1", "", "\u00e9", "e\u0301", "\u212b", "\u00c5", "\u1e9b\u0323", "\uac00", "\u00df", "\U0001f642", 'q"\\\n']
+SCALARS: list[Any] = [0, 1, -7, 2**80, True, False]
+REJECTED: list[Any] = [None, 1.5, float("nan"), object(), {1, 2}, b"raw"]
+
+
+def _reference(payload: Any) -> str:
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be dict")
+    return json.dumps(
+        canonical_json._normalise_reference(payload, path="$"),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    )
+
+
+def _decide(serialize: Any, payload: Any) -> Any:
+    try:
+        return "accept", serialize(payload)
+    except Exception as error:
+        return "reject", type(error), str(error)
+
+
+def _random_value(rng: random.Random, depth: int, reject_rate: float) -> Any:
+    roll = rng.random()
+    if roll < reject_rate:
+        return rng.choice(REJECTED)
+    if depth <= 0 or roll < 0.45:
+        return rng.choice(TEXTS) if rng.random() < 0.6 else rng.choice(SCALARS)
+    if roll < 0.7:
+        items = [_random_value(rng, depth - 1, reject_rate) for _ in range(rng.randint(0, 4))]
+        return tuple(items) if rng.random() < 0.2 else items
+    return _random_dict(rng, depth - 1, reject_rate)
+
+
+def _random_dict(rng: random.Random, depth: int, reject_rate: float) -> dict[Any, Any]:
+    value: dict[Any, Any] = {}
+    for _ in range(rng.randint(0, 4)):
+        key: Any = rng.choice(TEXTS) + rng.choice(["", "_k", "\u0301"])
+        if rng.random() < reject_rate / 2:
+            key = rng.choice([1, None, ("t",)])
+        value[key] = _random_value(rng, depth, reject_rate)
+    return value
+
+
+def test_kat_fixtures_serialize_byte_for_byte() -> None:
+    external = json.loads((FIXTURES / "external_verifier_contract_v1_kat.json").read_text(encoding="utf-8"))
+    for artifact in external["kat_artifacts"]:
+        payload = artifact["unsigned_payload"]
+        assert to_canonical_json(payload) == artifact["canonical_json_utf8"] == _reference(payload)
+        assert signed_payload_hash(domain_tag=artifact["domain_tag"], payload=payload) == artifact["signed_payload_hash"]
+
+    receipt_kat = json.loads((FIXTURES / "orchestrator_receipt_policy_v1_kat.json").read_text(encoding="utf-8"))
+    payload = receipt_kat["unsigned_payload"]
+    assert to_canonical_json(payload) == _reference(payload)
+    assert signed_payload_hash(domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN, payload=payload) == receipt_kat["signed_payload_hash"]
+
+
+@pytest.mark.parametrize("reject_rate", [0.0, 0.02, 0.1])
+def test_random_corpus_matches_the_reference(reject_rate: float) -> None:
+    rng = random.Random(f"shield-v4-canon-{reject_rate}")
+    decisions = set()
+    for _ in range(1500):
+        payload = _random_dict(rng, 4, reject_rate)
+        decision = _decide(to_canonical_json, payload)
+        assert decision == _decide(_reference, payload)
+        decisions.add(decision[0])
+    assert "accept" in decisions
+    assert reject_rate == 0.0 or "reject" in decisions
+
+
+@pytest.mark.parametrize(
+    ("payload", "message"),
+    [
+        ({"a": [1, {"b": None}]}, "$.a[1].b must omit absent fields instead of using null"),
+        ({"\u00e9": (0, [2.5])}, "$.\u00e9[1][0] must not contain floats"),
+        ({"x": {"y": {3: "z"}}}, "$.x.y object keys must be strings"),
+        ({"m": {"\u00e9": 1, "e\u0301": 2}}, "$.m contains duplicate key after Unicode normalization"),
+        ({"s": ["ok", {1}]}, "$.s[1] contains unsupported type set"),
+    ],
+)
+def test_errors_keep_their_paths(payload: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError) as raised:
+        to_canonical_json(payload)
+    assert str(raised.value) == message
+
+
+def test_paths_are_built_only_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_paths(value: Any, *, path: str) -> Any:
+        raise AssertionError(f"path built: {path}")
+
+    monkeypatch.setattr(canonical_json, "_normalise_reference", no_paths)
+
+    assert to_canonical_json({"b": ("e\u0301", [True, 2**70]), "a": {"\u212b": "ok"}}) == (
+        '{"a":{"\u00c5":"ok"},"b":["\u00e9",[true,1180591620717411303424]]}'
+    )
+    with pytest.raises(AssertionError, match=r"path built: \$"):
+        to_canonical_json({"a": None})
+
+
+def test_normalized_payloads_are_serialized_without_a_copy(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_copy(value: Any) -> Any:
+        raise AssertionError("copied")
+
+    monkeypatch.setattr(canonical_json, "_normalise", no_copy)
+    payload = {"request_id": "req-1", "note": "z\u00fcrich", "ids": ("b", "a"), "n": 4}
+
+    assert to_canonical_json(payload) == '{"ids":["b","a"],"n":4,"note":"z\u00fcrich","request_id":"req-1"}'
+    assert signed_payload_hash(domain_tag=COMPONENT_VERDICT_DOMAIN, payload=payload) == signed_payload_hash(
+        domain_tag=COMPONENT_VERDICT_DOMAIN, payload={**payload, "ids": ["b", "a"]}
+    )
+
+
+def test_ascii_and_nfc_strings_are_returned_as_is() -> None:
+    for text in ("req-1", "z\u00fcrich", "\uac00"):
+        assert canonical_json._nfc(text) is text
+    assert canonical_json._nfc("e\u0301") == "\u00e9"
+    with pytest.raises(ValueError, match="duplicate key"):
+        parse_json_no_duplicate_keys('{"\\u00e9":1,"e\\u0301":2}')
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shield_orchestrator.v4 import canonical_json
+from shield_orchestrator.v4 import work_budget as budget
+from shield_orchestrator.v4.canonical_json import (
+    COMPONENT_VERDICT_DOMAIN,
+    ORCHESTRATOR_RECEIPT_DOMAIN,
+    SignedPayloadDigests,
+    canonical_json_byte_length,
+    signed_payload_digests,
+    signed_payload_hash,
+    signed_payload_hash_streaming,
+    to_canonical_json_bytes,
+    write_canonical_json,
+)
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "v4"
+TEXTS = ["a", "req-1", "", "\u00e9", "e\u0301", "\u212b", "\uac00", "\U0001f642", 'q"\\\n']
+LEAVES: list[Any] = [0, -7, 2**70, True, False, [], {}, ()]
+REJECTED: list[Any] = [None, 1.5, object()]
+
+
+def _outcome(call: Any) -> Any:
+    try:
+        return "accept", call()
+    except Exception as error:
+        return "reject", type(error), str(error)
+
+
+def _chunks(payload: Any) -> tuple[list[bytes], int]:
+    chunks: list[bytes] = []
+    length = write_canonical_json(payload, chunks.append)
+    return chunks, length
+
+
+def _random_value(rng: random.Random, depth: int, reject_rate: float) -> Any:
+    roll = rng.random()
+    if roll < reject_rate:
+        return rng.choice(REJECTED)
+    if depth <= 0 or roll < 0.4:
+        return rng.choice(TEXTS) if rng.random() < 0.5 else rng.choice(LEAVES)
+    if roll < 0.7:
+        items = [_random_value(rng, depth - 1, reject_rate) for _ in range(rng.randint(0, 4))]
+        return tuple(items) if rng.random() < 0.2 else items
+    return {
+        rng.choice(TEXTS) + rng.choice(["", "_k", "\u0301"]): _random_value(rng, depth - 1, reject_rate)
+        for _ in range(rng.randint(0, 4))
+    }
+
+
+def test_kat_fixtures_hash_and_measure_identically() -> None:
+    external = json.loads((FIXTURES / "external_verifier_contract_v1_kat.json").read_text(encoding="utf-8"))
+    for artifact in external["kat_artifacts"]:
+        domain_tag = artifact["domain_tag"]
+        payload = artifact["unsigned_payload"]
+        canonical = artifact["canonical_json_utf8"].encode("utf-8")
+        assert signed_payload_hash_streaming(domain_tag=domain_tag, payload=payload) == artifact["signed_payload_hash"]
+        assert signed_payload_digests(domain_tag=domain_tag, payload=payload) == SignedPayloadDigests(
+            payload_sha256=hashlib.sha256(canonical).hexdigest(),
+            signed_payload_hash=artifact["signed_payload_hash"],
+        )
+        assert canonical_json_byte_length(payload) == len(canonical)
+
+    receipt_kat = json.loads((FIXTURES / "orchestrator_receipt_policy_v1_kat.json").read_text(encoding="utf-8"))
+    payload = receipt_kat["unsigned_payload"]
+    assert signed_payload_hash_streaming(domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN, payload=payload) == (
+        receipt_kat["signed_payload_hash"]
+    )
+    digests = signed_payload_digests(domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN, payload=payload)
+    assert digests.signed_payload_hash == receipt_kat["signed_payload_hash"]
+
+
+@pytest.mark.parametrize("reject_rate", [0.0, 0.05])
+def test_random_corpus_streams_the_canonical_bytes(reject_rate: float) -> None:
+    rng = random.Random(f"shield-v4-stream-{reject_rate}")
+    accepted = 0
+    for _ in range(800):
+        payload = {key: _random_value(rng, 4, reject_rate) for key in rng.sample(TEXTS, rng.randint(0, 5))}
+        expected = _outcome(partial(to_canonical_json_bytes, payload))
+        streamed = _outcome(partial(_chunks, payload))
+        if expected[0] == "reject":
+            assert streamed == expected
+            for hasher in (signed_payload_hash_streaming, signed_payload_hash):
+                hashed = partial(hasher, domain_tag=COMPONENT_VERDICT_DOMAIN, payload=payload)
+                assert _outcome(hashed) == expected
+            continue
+        accepted += 1
+        chunks, length = streamed[1]
+        assert b"".join(chunks) == expected[1]
+        assert length == canonical_json_byte_length(payload) == len(expected[1])
+        for domain_tag in (COMPONENT_VERDICT_DOMAIN, ORCHESTRATOR_RECEIPT_DOMAIN):
+            signed = signed_payload_hash(domain_tag=domain_tag, payload=payload)
+            assert signed_payload_hash_streaming(domain_tag=domain_tag, payload=payload) == signed
+            assert signed_payload_digests(domain_tag=domain_tag, payload=payload) == SignedPayloadDigests(
+                payload_sha256=hashlib.sha256(expected[1]).hexdigest(),
+                signed_payload_hash=signed,
+            )
+    assert accepted > 400
+
+
+def test_large_payloads_are_hashed_in_member_sized_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {
+        "component_verdicts": [{"component_id": f"c{index}", "metadata": {"blob": "x" * 2048}} for index in range(48)],
+        "request_id": "req-1",
+    }
+    chunks, length = _chunks(payload)
+    expected = signed_payload_hash(domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN, payload=payload)
+
+    assert length > 96 * 1024
+    assert max(len(chunk) for chunk in chunks) < 4096
+
+    def no_full_copy(_payload: Any) -> Any:
+        raise AssertionError("full canonical copy built")
+
+    monkeypatch.setattr(canonical_json, "to_canonical_json", no_full_copy)
+    assert budget.require_canonical_receipt_budget(payload) == length
+    assert signed_payload_hash_streaming(domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN, payload=payload) == expected
+    digests = signed_payload_digests(domain_tag=ORCHESTRATOR_RECEIPT_DOMAIN, payload=payload)
+    assert digests.signed_payload_hash == expected
+
+
+def test_invalid_arguments_fail_before_streaming() -> None:
+    written: list[bytes] = []
+    with pytest.raises(ValueError, match="payload must be dict"):
+        write_canonical_json(["bad"], written.append)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match=r"^\$\.a\[0\] must omit absent fields"):
+        write_canonical_json({"a": [None]}, written.append)
+    for hasher in (signed_payload_hash_streaming, signed_payload_digests):
+        with pytest.raises(ValueError, match="unsupported Shield v4 domain tag"):
+            hasher(domain_tag="bad", payload={"a": 1})
+        with pytest.raises(ValueError, match="payload must be dict"):
+            hasher(domain_tag=COMPONENT_VERDICT_DOMAIN, payload=["bad"])  # type: ignore[arg-type]
+    assert written == []